@@ -0,0 +1,67 @@
+#!/usr/bin/python3
+#
+
+#  Copyright (C) 2026  Rafael Senties Martinelli <rafael@senties-martinelli.com>
+#
+#  This program is free software; you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License 3 as published by
+#   the Free Software Foundation.
+#
+#  This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+#   along with this program; if not, write to the Free Software Foundation,
+#   Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301  USA.
+
+"""
+    Frames per second of the effects of the animator.
+"""
+
+from time import sleep
+
+from benchmark import main
+
+
+def bench_animation(seconds=3, fps=30, computer_name='M17XR3', latency=0.001):
+    """
+        Run every effect against a simulated device and report the
+        achieved frames per second, the dropped frames and the CPU usage.
+    """
+    from Engine import Driver, Controller
+    from Animation import Animator, EFFECTS
+    from Pacing import Pacer, PACING_ADAPTIVE
+
+    print('Animations on {} at {} fps, {} ms per transfer ({} seconds):'.format(
+        computer_name, fps, latency * 1000, seconds))
+
+    results = {}
+    for name in sorted(EFFECTS.keys()):
+        driver = Driver(computer_name)
+        driver.dev.latency = latency
+        driver.pacer = Pacer(computer_name, PACING_ADAPTIVE)
+        driver.pacer.delay = Pacer.MIN_DELAY
+
+        animator = Animator(Controller(driver), EFFECTS[name](), fps)
+        animator.start()
+        sleep(seconds)
+        animator.stop()
+
+        stats = animator.get_stats()
+        stats['packets'] = driver.dev.packets
+        results[name] = stats
+        print('  {:<10} {:>6.1f} fps {:>5} dropped {:>5} skipped {:>6.1f} % cpu {:>6} packets'.format(
+            name, stats['fps'], stats['dropped'], stats['skipped'],
+            stats['cpu'] * 100, stats['packets']))
+
+    return results
+
+
+BENCHMARKS = {
+    'animation': bench_animation,
+}
+
+if __name__ == '__main__':
+    main(BENCHMARKS)
@@ -0,0 +1,93 @@
+#!/usr/bin/python3
+#
+
+#  Copyright (C) 2026  Rafael Senties Martinelli <rafael@senties-martinelli.com>
+#
+#  This program is free software; you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License 3 as published by
+#   the Free Software Foundation.
+#
+#  This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+#   along with this program; if not, write to the Free Software Foundation,
+#   Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301  USA.
+
+"""
+    Reading and writing the configuration with CCParser.
+"""
+
+import os
+import shutil
+import tempfile
+
+from benchmark import main, measure
+
+
+def bench_ccparser(reads=10000, writes=20):
+    """
+        Time reading values with the cache of CCParser and parsing the
+        file for each one like before, then writing values one by one
+        and in a batch.
+    """
+    from CCParser import CCParser
+
+    class _UncachedCCParser(CCParser):
+
+        def _read(self):
+            self._stamp = None
+            return CCParser._read(self)
+
+    root = tempfile.mkdtemp(prefix='akbl-benchmark-')
+    path = os.path.join(root, 'global.ini')
+    section = 'Global alienware-kbl Configuration'
+
+    try:
+        ccp = CCParser(path, section)
+        with ccp.batch():
+            for i in range(writes):
+                ccp.write('key_{}'.format(i), i)
+
+        def read_all(parser):
+            for i in range(reads):
+                parser.get_int_defval('key_{}'.format(i % writes), -1)
+
+        cached = measure(lambda: read_all(ccp), 1)[0]
+        uncached = measure(lambda: read_all(_UncachedCCParser(path, section)), 1)[0]
+
+        def write_each():
+            for i in range(writes):
+                ccp.write('key_{}'.format(i), i + 1)
+
+        def write_batch():
+            with ccp.batch():
+                write_each()
+
+        each = measure(write_each, 1)[0]
+        batch = measure(write_batch, 1)[0]
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+    print('CCParser, {} reads of {} keys:'.format(reads, writes))
+    print('  cached   {:>9.2f} ms   parsing each time {:>9.2f} ms'.format(
+        cached * 1000, uncached * 1000))
+    print('  {} writes: one by one {:>8.2f} ms   batch {:>8.2f} ms'.format(
+        writes, each * 1000, batch * 1000))
+
+    return {'reads': reads,
+            'cached': cached,
+            'uncached': uncached,
+            'writes': writes,
+            'write_each': each,
+            'write_batch': batch}
+
+
+BENCHMARKS = {
+    'ccparser': bench_ccparser,
+}
+
+if __name__ == '__main__':
+    main(BENCHMARKS)
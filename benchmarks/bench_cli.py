@@ -0,0 +1,147 @@
+#!/usr/bin/python3
+#
+
+#  Copyright (C) 2026  Rafael Senties Martinelli <rafael@senties-martinelli.com>
+#
+#  This program is free software; you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License 3 as published by
+#   the Free Software Foundation.
+#
+#  This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+#   along with this program; if not, write to the Free Software Foundation,
+#   Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301  USA.
+
+"""
+    Cold invocations of the command line and the modules that they import.
+"""
+
+import os
+import sys
+import subprocess
+from time import perf_counter
+
+from benchmark import SOURCE_PATH, DaemonSession, main, percentile, pyro_usable
+
+# What the command line did before the socket, for each command
+_PYRO_CLI = '''
+import Pyro4
+pyro = Pyro4.Proxy({!r})
+pyro.ping()
+pyro.set_lights('root', True)
+'''
+
+
+def bench_cli(repeat=10, computer_name='M17XR3'):
+    """
+        Time cold invocations of the command line: `--on` through the
+        socket of the daemon, against the Pyro4 proxy that it used before.
+    """
+    directory = SOURCE_PATH
+    transport = 'pyro' if pyro_usable() else 'direct'
+    session = DaemonSession(computer_name, transport, fast_server=True)
+
+    env = dict(os.environ)
+    env['AKBL_SOCKET'] = session.paths.DAEMON_SOCKET_PATH
+
+    paths = [
+        ('python', [sys.executable, '-c', 'pass']),
+        ('socket', [sys.executable, os.path.join(directory, 'DefaultArguments.py'), '--on'])]
+
+    if session.uri is not None:
+        paths.append(('pyro', [sys.executable, '-c', _PYRO_CLI.format(session.uri)]))
+
+    print('Cold command line invocations ({} repetitions):'.format(repeat))
+
+    results = {}
+    try:
+        for name, command in paths:
+            latencies = []
+            for _ in range(repeat):
+                start = perf_counter()
+                subprocess.check_call(command, env=env, cwd=directory,
+                                      stdout=subprocess.DEVNULL)
+                latencies.append(perf_counter() - start)
+                session.daemon._worker.join()
+
+            results[name] = {'p50': percentile(latencies, 50),
+                             'p95': percentile(latencies, 95)}
+            print('  {:<8} p50 {:>7.1f} ms   p95 {:>7.1f} ms'.format(
+                name, results[name]['p50'] * 1000, results[name]['p95'] * 1000))
+    finally:
+        session.close()
+
+    return results
+
+
+# Budget of the imports of `alienware-kbl --on`, with the daemon running
+CLI_IMPORT_BUDGET = 0.05
+
+
+def _parse_importtime(output):
+    """
+        Return a dict of module: cumulative seconds, of the modules imported
+        at the top level, from the output of `python3 -X importtime`.
+    """
+    modules = {}
+    for line in output.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+
+        _, cumulative, name = line[len('import time:'):].split('|')
+        if not name.startswith('  '):
+            modules[name.strip()] = int(cumulative) / 1e6
+
+    return modules
+
+
+def bench_importtime(repeat=5, computer_name='M17XR3'):
+    """
+        Time with `-X importtime` the imports of `alienware-kbl --on`
+        against CLI_IMPORT_BUDGET, and show the slowest ones.
+    """
+    directory = SOURCE_PATH
+    session = DaemonSession(computer_name, 'direct', fast_server=True)
+
+    env = dict(os.environ)
+    env['AKBL_SOCKET'] = session.paths.DAEMON_SOCKET_PATH
+    command = [sys.executable, '-X', 'importtime',
+               os.path.join(directory, 'DefaultArguments.py'), '--on']
+
+    totals = []
+    try:
+        for _ in range(repeat):
+            process = subprocess.run(command, env=env, cwd=directory,
+                                     stdout=subprocess.DEVNULL,
+                                     stderr=subprocess.PIPE)
+            modules = _parse_importtime(process.stderr.decode('utf-8'))
+            totals.append(sum(modules.values()))
+            session.daemon._worker.join()
+    finally:
+        session.close()
+
+    total = percentile(totals, 50)
+    slowest = sorted(modules.items(), key=lambda item: item[1], reverse=True)[:5]
+
+    print('Imports of `alienware-kbl --on` ({} repetitions):'.format(repeat))
+    print('  p50 {:.1f} ms, budget {:.1f} ms'.format(total * 1000, CLI_IMPORT_BUDGET * 1000))
+    for name, seconds in slowest:
+        print('  {:<20} {:>7.1f} ms'.format(name, seconds * 1000))
+
+    if total > CLI_IMPORT_BUDGET:
+        print('  over the budget')
+
+    return {'p50': total, 'budget': CLI_IMPORT_BUDGET, 'modules': modules}
+
+
+BENCHMARKS = {
+    'cli': bench_cli,
+    'importtime': bench_importtime,
+}
+
+if __name__ == '__main__':
+    main(BENCHMARKS)
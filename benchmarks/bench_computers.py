@@ -0,0 +1,164 @@
+#!/usr/bin/python3
+#
+
+#  Copyright (C) 2026  Rafael Senties Martinelli <rafael@senties-martinelli.com>
+#
+#  This program is free software; you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License 3 as published by
+#   the Free Software Foundation.
+#
+#  This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+#   along with this program; if not, write to the Free Software Foundation,
+#   Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301  USA.
+
+"""
+    Import of the models of computers, and detection of the device.
+"""
+
+import os
+import sys
+import json
+import shutil
+import tempfile
+import subprocess
+
+from benchmark import SOURCE_PATH, main, measure, percentile
+
+_COMPUTERS_SNIPPET = """
+import sys, json, tracemalloc
+from time import perf_counter
+
+# tracemalloc slows the import, the time is only measured without it
+trace = sys.argv[2] == 'memory'
+if trace:
+    tracemalloc.start()
+
+start = perf_counter()
+import Computers
+seconds = perf_counter() - start
+imported = tracemalloc.get_traced_memory()[0] if trace else None
+
+import Engine
+driver = Engine.Driver(simulate=sys.argv[1])
+built = [item.name for item in Computers.AllComputers.computerList.values() if item.is_built()]
+
+json.dump({'seconds': seconds, 'imported': imported, 'built': built,
+           'found': driver.computer_name}, sys.stdout)
+"""
+
+
+def bench_computers(repeat=5, computer_name='M17XR3'):
+    """
+        Time the import of Computers in a new interpreter, and show
+        the models that are built once the driver found the device.
+    """
+    directory = SOURCE_PATH
+    command = [sys.executable, '-c', _COMPUTERS_SNIPPET, computer_name]
+
+    # Like once installed, the modules are imported from their bytecode,
+    # which is written outside of the sources by the first run.
+    pycache = tempfile.mkdtemp(prefix='akbl-benchmark-')
+    env = dict(os.environ)
+    env.pop('AKBL_SIMULATE', None)
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    env['PYTHONPYCACHEPREFIX'] = pycache
+
+    runs = []
+    try:
+        for mode in ['time'] * (repeat + 1) + ['memory']:
+            output = subprocess.run(command + [mode], env=env, cwd=directory, check=True,
+                                    stdout=subprocess.PIPE).stdout
+            runs.append(json.loads(output.decode('utf-8')))
+    finally:
+        shutil.rmtree(pycache, ignore_errors=True)
+
+    seconds = percentile([run['seconds'] for run in runs[1:-1]], 50)
+    imported = runs[-1]['imported']
+    built = runs[-1]['built']
+
+    print('Computers ({} repetitions):'.format(repeat))
+    print('  import p50 {:.2f} ms, {:.1f} KiB allocated'.format(seconds * 1000, imported / 1024))
+    print('  models built after finding the {}: {}'.format(computer_name, ', '.join(built)))
+
+    return {'import': seconds, 'imported_bytes': imported, 'built': built}
+
+
+def _find_device_per_model(driver):
+    """
+        How FindDevice looked for the device before the single pass:
+        a search of the bus for each computer.
+    """
+    for computer in sorted(driver.computerList.keys()):
+        dev = driver.bus.find(
+            idVendor=driver.computerList[computer].vendorId,
+            idProduct=driver.computerList[computer].productId)
+
+        if dev is not None:
+            if computer == 'M14XR1' and 'Gaming' in str(dev):
+                computer = 'M14XR2'
+            return computer
+
+    return None
+
+
+def bench_detection(others=(0, 50, 500), repeat=200, computers=('M18XRX', 'M14XR2')):
+    """
+        Time finding the device on simulated buses with many other devices:
+        with a search per model like before, with a single pass and with
+        the model cached by a previous driver.
+    """
+    from Engine import Driver
+    from Simulator import SimulatedBus
+
+    root = tempfile.mkdtemp(prefix='akbl-benchmark-')
+    cache_path = os.path.join(root, 'device')
+
+    print('Device detection ({} repetitions):'.format(repeat))
+    print('  {:<10} {:>7} {:>14} {:>14} {:>14}'.format(
+        'Computer', 'devices', 'per model', 'single pass', 'cached'))
+
+    results = {}
+    try:
+        for computer_name in computers:
+            for count in others:
+                driver = Driver(computer_name)
+                driver.bus = SimulatedBus.for_computer(computer_name, others=count)
+                row = {}
+
+                for name, function in (
+                        ('per_model', lambda: _find_device_per_model(driver)),
+                        ('single_pass', driver.FindDevice),
+                        ('cached', driver.FindDevice)):
+
+                    driver.device_cache = cache_path if name == 'cached' else None
+                    driver.bus.enumerations = 0
+                    seconds = measure(function, repeat)[0]
+                    row[name] = {'seconds': seconds,
+                                 'enumerations': driver.bus.enumerations / (repeat + 2)}
+
+                os.remove(cache_path)
+
+                results['{}/{}'.format(computer_name, count)] = row
+                print('  {:<10} {:>7} {}'.format(computer_name, count + 1, ' '.join(
+                    '{:>8.3f} ms/{:<2.0f}'.format(row[name]['seconds'] * 1000, row[name]['enumerations'])
+                    for name in ('per_model', 'single_pass', 'cached'))))
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+    print('  (time per detection / walks of the bus)')
+
+    return results
+
+
+BENCHMARKS = {
+    'computers': bench_computers,
+    'detection': bench_detection,
+}
+
+if __name__ == '__main__':
+    main(BENCHMARKS)
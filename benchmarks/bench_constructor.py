@@ -0,0 +1,139 @@
+#!/usr/bin/python3
+#
+
+#  Copyright (C) 2026  Rafael Senties Martinelli <rafael@senties-martinelli.com>
+#
+#  This program is free software; you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License 3 as published by
+#   the Free Software Foundation.
+#
+#  This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+#   along with this program; if not, write to the Free Software Foundation,
+#   Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301  USA.
+
+"""
+    Encoding of the packets: the bytearray Constructor against the list
+    based one that was used before it.
+"""
+
+from copy import copy
+
+from benchmark import FakeDriver, main, measure
+
+
+class _LegacyRequest:
+
+    def __init__(self, legend, packet):
+        self.legend = legend
+        self.packet = packet
+
+
+class _LegacyConstructor(list):
+
+    """
+        The list based Constructor that was used before the bytearray
+        encoder. It is only kept to compare both implementations.
+    """
+
+    def __init__(self, driver):
+        self.computer = driver.computer
+        self.void = [self.computer.FILL_BYTE] * self.computer.DATA_LENGTH
+        self.Id = 0x01
+
+    def Set_Speed(self, Speed=0xc800):
+        cmd = copy(self.void)
+        legend = "Set Speed: {}".format(Speed)
+        cmd[0] = self.computer.START_BYTE
+        cmd[1] = self.computer.COMMAND_SET_SPEED
+        cmd[3] = int(Speed / 256)
+        cmd[4] = int(Speed - (Speed / 256) * 256)
+        self.append(_LegacyRequest(legend, cmd))
+
+    def Set_Color(self, Area, Color):
+        cmd = copy(self.void)
+        legend = "Set Color"
+        cmd[0] = self.computer.START_BYTE
+        cmd[1] = self.computer.COMMAND_SET_COLOR
+        cmd[2] = self.Id
+        cmd[3] = Area[0]
+        cmd[4] = Area[1]
+        cmd[5] = Area[2]
+        cmd[6] = Color[0]
+        cmd[7] = Color[1]
+        self.append(_LegacyRequest(legend, cmd))
+
+    def End_Loop(self):
+        cmd = copy(self.void)
+        legend = "End Loop"
+        cmd[0] = self.computer.START_BYTE
+        cmd[1] = self.computer.COMMAND_LOOP_BLOCK_END
+        self.Id += 0x01
+        self.append(_LegacyRequest(legend, cmd))
+
+    def End_Transfert(self):
+        cmd = copy(self.void)
+        legend = "End Transfert"
+        cmd[0] = self.computer.START_BYTE
+        cmd[1] = self.computer.COMMAND_TRANSMIT_EXECUTE
+        self.append(_LegacyRequest(legend, cmd))
+
+
+def bench_constructor(zones_per_region=4, repeat=2000):
+    """
+        Encode a theme of the computer with most regions, with the
+        list based Constructor and with the bytearray one.
+    """
+    from Engine import Constructor
+    from Computers import AllComputers
+
+    computer = max(
+        (item.computer for item in AllComputers.computerList.values()),
+        key=lambda computer: len(computer.regions))
+
+    driver = FakeDriver(computer)
+    areas = [Constructor(driver).Area(region.regionId)
+             for region in computer.regions.values()]
+    color = [0xf0, 0xf0]
+    size = len(areas) * (zones_per_region + 1) + 2
+
+    def encode(constructor):
+        constructor.Set_Speed(0xc800)
+        for area in areas:
+            for _ in range(zones_per_region):
+                constructor.Set_Color(area, color)
+            constructor.End_Loop()
+        constructor.End_Transfert()
+        return constructor
+
+    print('Encoding {} packets for {} ({} repetitions):'.format(
+        size, computer.name, repeat))
+
+    results = {}
+    for name, function in (
+            ('list', lambda: encode(_LegacyConstructor(driver))),
+            ('bytearray', lambda: encode(Constructor(driver, size=size)))):
+
+        seconds, peak = measure(function, repeat)
+        results[name] = (seconds, peak)
+        print('  {:<10} {:>8.1f} us/theme {:>8} bytes/theme {:>6.1f} bytes/packet'.format(
+            name, seconds * 1e6, peak, peak / size))
+
+    print('  cpu: x{:.1f} faster, memory: x{:.1f} smaller'.format(
+        results['list'][0] / results['bytearray'][0],
+        results['list'][1] / results['bytearray'][1]))
+
+    return dict((name, {'seconds': seconds, 'bytes': peak})
+                for name, (seconds, peak) in results.items())
+
+
+BENCHMARKS = {
+    'constructor': bench_constructor,
+}
+
+if __name__ == '__main__':
+    main(BENCHMARKS)
@@ -0,0 +1,143 @@
+#!/usr/bin/python3
+#
+
+#  Copyright (C) 2026  Rafael Senties Martinelli <rafael@senties-martinelli.com>
+#
+#  This program is free software; you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License 3 as published by
+#   the Free Software Foundation.
+#
+#  This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+#   along with this program; if not, write to the Free Software Foundation,
+#   Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301  USA.
+
+"""
+    Latency of the commands of the daemon, end to end, and of a burst
+    of commands that are coalesced by its queue.
+"""
+
+from time import perf_counter
+
+from benchmark import DaemonSession, main, percentile, pyro_usable
+
+
+def bench_daemon(repeat=10, transport='pyro', pacing='adaptive', computers=None):
+    """
+        Time the commands of the bindings, end to end, for every
+        computer against a simulated device.
+    """
+    from Computers import AllComputers
+
+    if transport == 'pyro' and not pyro_usable():
+        print("Using the direct transport.")
+        transport = 'direct'
+
+    if computers is None:
+        computers = sorted(AllComputers.computerList.keys())
+
+    commands = (
+        ('set_profile', lambda bindings, i: bindings.set_profile(('Blue', 'Red')[i % 2])),
+        ('set_lights', lambda bindings, i: bindings.set_lights(i % 2 == 1)),
+        ('switch_lights', lambda bindings, i: bindings.switch_lights()),
+        ('set_colors', lambda bindings, i: bindings.set_colors(
+            ('fixed', 'blink', 'morph')[i % 3], 100, '#F7F200', '#0018FF')),
+    )
+
+    print('Daemon commands, {} transport, {} pacing ({} repetitions):'.format(
+        transport, pacing, repeat))
+    print('  {:<14} {:<14} {:>9} {:>9} {:>9} {:>8} {:>8}'.format(
+        'computer', 'command', 'p50 ms', 'p95 ms', 'p99 ms', 'packets', 'bytes'))
+
+    results = {}
+    for computer_name in computers:
+        session = DaemonSession(computer_name, transport, pacing)
+        results[computer_name] = {}
+
+        try:
+            for command, function in commands:
+                latencies = []
+                packets = 0
+                usb_bytes = 0
+
+                for i in range(repeat):
+                    device = session.device
+                    packets_before, bytes_before = device.packets, device.bytes
+
+                    start = perf_counter()
+                    if function(session.bindings, i) is False:
+                        raise RuntimeError("The command `{}` failed".format(command))
+                    session.daemon._worker.join()
+                    latencies.append(perf_counter() - start)
+
+                    packets += device.packets - packets_before
+                    usb_bytes += device.bytes - bytes_before
+
+                result = {
+                    'p50': percentile(latencies, 50),
+                    'p95': percentile(latencies, 95),
+                    'p99': percentile(latencies, 99),
+                    'packets': packets / repeat,
+                    'bytes': usb_bytes / repeat}
+
+                results[computer_name][command] = result
+                print('  {:<14} {:<14} {:>9.2f} {:>9.2f} {:>9.2f} {:>8.1f} {:>8.1f}'.format(
+                    computer_name, command,
+                    result['p50'] * 1000, result['p95'] * 1000, result['p99'] * 1000,
+                    result['packets'], result['bytes']))
+        finally:
+            session.close()
+
+    return {'transport': transport,
+            'pacing': pacing,
+            'repeat': repeat,
+            'computers': results}
+
+
+def bench_queue(calls=10, computer_name='M17XR3'):
+    """
+        Send a burst of set_colors and measure how long the daemon
+        needs to reach the last state, and how many were written.
+    """
+    session = DaemonSession(computer_name, 'direct')
+
+    try:
+        device = session.device
+        transactions = device.transactions
+        colors = ['#{:02X}00{:02X}'.format(i * 255 // calls, 255 - i * 255 // calls)
+                  for i in range(calls)]
+
+        start = perf_counter()
+        for color in colors:
+            session.bindings.set_colors('fixed', 100, color)
+        session.daemon._worker.join()
+        elapsed = perf_counter() - start
+
+        stats = session.daemon._worker.get_stats()
+        result = {'calls': calls,
+                  'seconds': elapsed,
+                  'transactions': device.transactions - transactions,
+                  'coalesced': stats['coalesced'],
+                  'time_in_queue': stats['time_in_queue']}
+    finally:
+        session.close()
+
+    print('A burst of {} set_colors on {}:'.format(calls, computer_name))
+    print('  {:.1f} ms until the last state, {} transactions, {} coalesced, {:.1f} ms in queue'.format(
+        result['seconds'] * 1000, result['transactions'], result['coalesced'],
+        result['time_in_queue'] * 1000))
+
+    return result
+
+
+BENCHMARKS = {
+    'daemon': bench_daemon,
+    'queue': bench_queue,
+}
+
+if __name__ == '__main__':
+    main(BENCHMARKS)
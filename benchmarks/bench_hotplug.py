@@ -0,0 +1,90 @@
+#!/usr/bin/python3
+#
+
+#  Copyright (C) 2026  Rafael Senties Martinelli <rafael@senties-martinelli.com>
+#
+#  This program is free software; you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License 3 as published by
+#   the Free Software Foundation.
+#
+#  This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+#   along with this program; if not, write to the Free Software Foundation,
+#   Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301  USA.
+
+"""
+    Time to apply the profile again when the device is plugged.
+"""
+
+from time import time
+
+from benchmark import DaemonSession, main, percentile, wait_until
+
+
+def bench_hotplug(repeat=5, computer_name='M17XR3', poll_interval=0.05):
+    """
+        Unplug the simulated device, change the profile meanwhile and plug
+        a new device. The time to recover is measured from the moment that
+        the monitor (polling every `poll_interval`) saw the device until
+        the profile was applied, and from the moment that it was plugged.
+    """
+    from Hotplug import HotplugMonitor
+    from Simulator import SimulatedDevice
+
+    default_interval = HotplugMonitor.POLL_INTERVAL
+    HotplugMonitor.POLL_INTERVAL = poll_interval
+    try:
+        session = DaemonSession(computer_name, 'direct', hotplug='poll')
+    except Exception:
+        HotplugMonitor.POLL_INTERVAL = default_interval
+        raise
+
+    daemon = session.daemon
+    driver = daemon._driver
+    device = session.device
+
+    totals = []
+    try:
+        for i in range(repeat):
+            driver.bus.unplug(device)
+            wait_until(lambda: not driver.connected)
+
+            session.bindings.set_profile(('Red', 'Blue')[i % 2])
+            daemon._worker.join()
+
+            device = SimulatedDevice(device.computer, device.idVendor,
+                                     device.idProduct, device.product)
+            plugged = time()
+            driver.bus.plug(device)
+            wait_until(lambda: daemon._hotplug_stats['recoveries'] == i + 1)
+            totals.append(time() - plugged)
+
+        stats = session.bindings.get_session_state()
+    finally:
+        session.close()
+        HotplugMonitor.POLL_INTERVAL = default_interval
+
+    print('Hotplug on {}, polling every {:.0f} ms ({} repetitions):'.format(
+        computer_name, poll_interval * 1000, repeat))
+    print('  from the event: last {:.1f} ms, max {:.1f} ms'.format(
+        stats['last_recovery_time'] * 1000, stats['max_recovery_time'] * 1000))
+    print('  from the plug:  p50 {:.1f} ms, max {:.1f} ms'.format(
+        percentile(totals, 50) * 1000, max(totals) * 1000))
+
+    return {'last_recovery_time': stats['last_recovery_time'],
+            'max_recovery_time': stats['max_recovery_time'],
+            'removals': stats['removals'],
+            'p50_from_plug': percentile(totals, 50),
+            'max_from_plug': max(totals)}
+
+
+BENCHMARKS = {
+    'hotplug': bench_hotplug,
+}
+
+if __name__ == '__main__':
+    main(BENCHMARKS)
@@ -0,0 +1,69 @@
+#!/usr/bin/python3
+#
+
+#  Copyright (C) 2026  Rafael Senties Martinelli <rafael@senties-martinelli.com>
+#
+#  This program is free software; you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License 3 as published by
+#   the Free Software Foundation.
+#
+#  This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+#   along with this program; if not, write to the Free Software Foundation,
+#   Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301  USA.
+
+"""
+    Packets of the themes with and without merging the areas that have
+    the same loop (Compiler.merge_blocks).
+"""
+
+from benchmark import FakeDriver, main
+
+
+def bench_merge():
+    """
+        Count the packets of a theme of each computer with and without
+        merging the areas that have the same loop. The areas of the
+        themes have a single color, two colors, or all different.
+    """
+    from Engine import Controller
+    from Computers import AllComputers
+
+    colors = ['#{:06X}'.format((i * 0x1F3D5B) & 0xFFFFFF) for i in range(1, 32)]
+    themes = (('single', lambda i: colors[0]),
+              ('two', lambda i: colors[i % 2]),
+              ('unique', lambda i: colors[i]))
+
+    print('Packets of a theme, without and with merging the areas:')
+    print('  {:<14}'.format('computer') + ''.join('{:>14}'.format(name) for name, _ in themes))
+
+    results = {}
+    for name in sorted(AllComputers.computerList.keys()):
+        computer = AllComputers.computerList[name].computer
+        controller = Controller(FakeDriver(computer))
+        results[name] = {}
+
+        for theme_name, color in themes:
+            blocks = [(key, ((computer.regions[key].regionId, 'fixed', color(i), color(i)),))
+                      for i, key in enumerate(sorted(computer.regions.keys()))]
+
+            results[name][theme_name] = (
+                len(controller.Build_Theme(0xc800, blocks, merge=False)),
+                len(controller.Build_Theme(0xc800, blocks)))
+
+        print('  {:<14}'.format(name) + ''.join(
+            '{:>8} {:>5}'.format(*results[name][theme_name]) for theme_name, _ in themes))
+
+    return results
+
+
+BENCHMARKS = {
+    'merge': bench_merge,
+}
+
+if __name__ == '__main__':
+    main(BENCHMARKS)
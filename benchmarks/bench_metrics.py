@@ -0,0 +1,59 @@
+#!/usr/bin/python3
+#
+
+#  Copyright (C) 2026  Rafael Senties Martinelli <rafael@senties-martinelli.com>
+#
+#  This program is free software; you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License 3 as published by
+#   the Free Software Foundation.
+#
+#  This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+#   along with this program; if not, write to the Free Software Foundation,
+#   Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301  USA.
+
+"""
+    Cost of collecting and writing the metrics of the daemon.
+"""
+
+from benchmark import DaemonSession, main, measure
+
+
+def bench_metrics(repeat=100, computer_name='M17XR3'):
+    """
+        Apply profiles, then time collecting the metrics of the daemon
+        and writing them like for the textfile collector of node_exporter.
+    """
+    session = DaemonSession(computer_name, 'direct', metrics=True)
+    daemon = session.daemon
+    exporter = daemon._metrics
+
+    try:
+        for profile in ('Red', 'Blue', 'Red'):
+            session.bindings.set_profile(profile)
+            daemon._worker.join()
+
+        collect = measure(daemon._collect_metrics, repeat)[0]
+        write = measure(exporter.write, repeat)[0]
+        samples = len([line for line in daemon._collect_metrics().text().splitlines()
+                       if not line.startswith('#')])
+    finally:
+        session.close()
+
+    print('Metrics of the daemon on {}, {} samples ({} repetitions):'.format(
+        computer_name, samples, repeat))
+    print('  collect {:>8.3f} ms   collect and write {:>8.3f} ms'.format(collect * 1000, write * 1000))
+
+    return {'samples': samples, 'collect': collect, 'write': write}
+
+
+BENCHMARKS = {
+    'metrics': bench_metrics,
+}
+
+if __name__ == '__main__':
+    main(BENCHMARKS)
@@ -0,0 +1,99 @@
+#!/usr/bin/python3
+#
+
+#  Copyright (C) 2026  Rafael Senties Martinelli <rafael@senties-martinelli.com>
+#
+#  This program is free software; you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License 3 as published by
+#   the Free Software Foundation.
+#
+#  This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+#   along with this program; if not, write to the Free Software Foundation,
+#   Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301  USA.
+
+"""
+    Saving the lights of the power modes in the blocks of the device.
+"""
+
+from time import time
+
+from benchmark import DaemonSession, main, percentile
+
+
+def bench_power_blocks(repeat=10, computer_name='M17XR3'):
+    """
+        Time applying a profile with lights for the power modes when its
+        blocks must be saved and when they did not change, and writing
+        them with the controllers of the next boots, which read the
+        hashes of the saved blocks from their file.
+    """
+    import Configuration
+    from Engine import Controller
+
+    session = DaemonSession(computer_name, 'direct')
+    daemon = session.daemon
+    device = session.device
+    computer = device.computer
+
+    profile = Configuration.New(computer)
+    profile.create_profile('Power', session.paths.PROFILES_PATH + 'Power.cfg')
+    for power, color in (('acPower', '#00FF00'), ('onBat', '#FF0000')):
+        for region in computer.regions.values():
+            profile.add_power_area(power, region).add_zone(
+                Configuration.ZoneData(region.regionId, 'fixed', region, color, color))
+    profile.save()
+
+    def measure(clear):
+        times = []
+        packets = []
+        for _ in range(repeat):
+            if clear:
+                daemon._controller.saved_blocks.clear()
+            count = device.packets
+            start = time()
+            session.bindings.set_profile('Power')
+            daemon._worker.join()
+            times.append(time() - start)
+            packets.append(device.packets - count)
+        return percentile(times, 50), max(packets)
+
+    try:
+        saving, saving_packets = measure(True)
+        unchanged, unchanged_packets = measure(False)
+
+        saved_blocks_path = session.paths.SAVED_BLOCKS_PATH
+        Controller(daemon._driver, saved_blocks_path).Write_Power_Blocks(daemon._theme)
+
+        count = device.packets
+        start = time()
+        for _ in range(repeat):
+            Controller(daemon._driver, saved_blocks_path).Write_Power_Blocks(daemon._theme)
+        boot = (time() - start) / repeat
+        boot_packets = device.packets - count
+    finally:
+        session.close()
+
+    print('Power mode blocks on {} ({} repetitions):'.format(computer_name, repeat))
+    print('  blocks saved:     p50 {:>8.2f} ms, {} packets'.format(saving * 1000, saving_packets))
+    print('  blocks unchanged: p50 {:>8.2f} ms, {} packets'.format(unchanged * 1000, unchanged_packets))
+    print('  next boots:       mean {:>7.3f} ms, {} packets'.format(boot * 1000, boot_packets))
+
+    return {'saving': saving,
+            'saving_packets': saving_packets,
+            'unchanged': unchanged,
+            'unchanged_packets': unchanged_packets,
+            'boot': boot,
+            'boot_packets': boot_packets}
+
+
+BENCHMARKS = {
+    'power_blocks': bench_power_blocks,
+}
+
+if __name__ == '__main__':
+    main(BENCHMARKS)
@@ -0,0 +1,118 @@
+#!/usr/bin/python3
+#
+
+#  Copyright (C) 2026  Rafael Senties Martinelli <rafael@senties-martinelli.com>
+#
+#  This program is free software; you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License 3 as published by
+#   the Free Software Foundation.
+#
+#  This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+#   along with this program; if not, write to the Free Software Foundation,
+#   Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301  USA.
+
+"""
+    Listing, loading and saving the profiles.
+"""
+
+import shutil
+import tempfile
+
+from benchmark import DaemonSession, legacy_save, main, measure, pyro_usable
+
+
+def bench_profiles(counts=(5, 5000), repeat=20, computer_name='M17XR3'):
+    """
+        Time get_profile_names with the names served by the daemon and with
+        the local scan, for a few and for many profiles.
+    """
+    transport = 'pyro' if pyro_usable() else 'direct'
+
+    print('get_profile_names, {} transport ({} repetitions):'.format(transport, repeat))
+
+    results = {}
+    for count in counts:
+        session = DaemonSession(computer_name, transport, profiles=count)
+        try:
+            index = measure(session.bindings.get_profile_names, repeat)[0]
+            scan = measure(session.bindings._local_profile_names, repeat)[0]
+        finally:
+            session.close()
+
+        results[count] = {'daemon': index, 'scan': scan}
+        print('  {:>6} profiles: daemon {:>9.3f} ms   scan {:>9.3f} ms'.format(
+            count, index * 1000, scan * 1000))
+
+    return results
+
+
+def bench_format(zones_per_region=(1, 20, 50), repeat=100, computer_name='M17XR3'):
+    """
+        Time loading and saving a profile in the JSON lines format and
+        in the legacy one.
+    """
+    import Configuration
+    from Computers import AllComputers
+
+    computer = AllComputers.computerList[computer_name].computer
+    modes = ('fixed', 'blink', 'morph')
+    root = tempfile.mkdtemp(prefix='akbl-benchmark-')
+
+    def load(path):
+        profile = Configuration.New(computer)
+        profile.path = path
+        profile.load(path)
+        return profile
+
+    print('Profile load and save on {} ({} repetitions):'.format(computer_name, repeat))
+
+    results = {}
+    try:
+        for count in zones_per_region:
+            profile = Configuration.New(computer)
+            profile.create_profile('Benchmark', root + '/Benchmark.cfg')
+            Configuration.profiles.pop('Benchmark')
+
+            for area in profile.area.values():
+                zone = area[0]
+                for i in range(1, count):
+                    color = '#{:06X}'.format((i * 0x10101) & 0xFFFFFF)
+                    profile.add_zone(Configuration.ZoneData(
+                        zone.regionId, modes[i % 3], computer.regions[area.name], color, color))
+
+            total = sum(len(area) for area in profile.area.values())
+            legacy_path = root + '/Legacy.cfg'
+
+            timings = {
+                'save': measure(profile.save, repeat)[0],
+                'save_legacy': measure(lambda: legacy_save(profile, legacy_path), repeat)[0],
+                'load': measure(lambda: load(profile.path), repeat)[0],
+                'load_legacy': measure(lambda: load(legacy_path), repeat)[0],
+            }
+
+            Configuration.profiles.pop('Benchmark')
+            results[total] = timings
+
+            print('  {:>5} zones: load {:>8.3f} ms (legacy {:>8.3f})   '
+                  'save {:>8.3f} ms (legacy {:>8.3f})'.format(
+                      total,
+                      timings['load'] * 1000, timings['load_legacy'] * 1000,
+                      timings['save'] * 1000, timings['save_legacy'] * 1000))
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+    return results
+
+
+BENCHMARKS = {
+    'profiles': bench_profiles,
+    'format': bench_format,
+}
+
+if __name__ == '__main__':
+    main(BENCHMARKS)
@@ -0,0 +1,70 @@
+#!/usr/bin/python3
+#
+
+#  Copyright (C) 2026  Rafael Senties Martinelli <rafael@senties-martinelli.com>
+#
+#  This program is free software; you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License 3 as published by
+#   the Free Software Foundation.
+#
+#  This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+#   along with this program; if not, write to the Free Software Foundation,
+#   Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301  USA.
+
+"""
+    Cost of the Tracer of the driver, and the statistics that it gives.
+"""
+
+from benchmark import main, measure
+
+
+def bench_tracing(repeat=200, computer_name='M17XR3'):
+    """
+        Time writing a theme to the simulated device without and with
+        a Tracer, and print the statistics like `alienware-kbl --stats`.
+    """
+    from Engine import Controller, Driver
+    from Tracing import Tracer, format_stats
+
+    driver = Driver(computer_name)
+    driver.pacer.delay = 0
+    controller = Controller(driver)
+    computer = driver.computer
+    blocks = [(key, tuple((computer.regions[key].regionId, 'fixed', '#{:06X}'.format(i * 0x111111), None)
+                          for i in range(4)))
+              for key in sorted(computer.regions.keys())]
+    data = bytes(controller.Build_Theme(0xc800, blocks, merge=False).getbuffer())
+    packets = len(data) // computer.DATA_LENGTH
+
+    driver.tracer = None
+    disabled = measure(lambda: driver.WriteDevice(data), repeat)[0]
+
+    driver.tracer = Tracer()
+    enabled = measure(lambda: driver.WriteDevice(data), repeat)[0]
+    controller.WaitForOk()
+    controller.Get_State()
+
+    stats = driver.tracer.get_stats(recent=4)
+
+    print('Writing {} packets on {} ({} repetitions):'.format(packets, computer_name, repeat))
+    print('  without tracing {:>8.2f} us/packet'.format(disabled / packets * 1e6))
+    print('  with tracing    {:>8.2f} us/packet'.format(enabled / packets * 1e6))
+    print()
+    print(format_stats({'tracing': stats, 'wait': controller.wait_stats}))
+
+    return {'packets': packets,
+            'disabled': disabled / packets,
+            'enabled': enabled / packets}
+
+
+BENCHMARKS = {
+    'tracing': bench_tracing,
+}
+
+if __name__ == '__main__':
+    main(BENCHMARKS)
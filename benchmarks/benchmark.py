@@ -0,0 +1,117 @@
+#!/usr/bin/python3
+#
+
+#  Copyright (C) 2026  Rafael Senties Martinelli <rafael@senties-martinelli.com>
+#
+#  This program is free software; you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License 3 as published by
+#   the Free Software Foundation.
+#
+#  This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+#   along with this program; if not, write to the Free Software Foundation,
+#   Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301  USA.
+
+"""
+    What the benchmarks share. Each bench_*.py file has the benchmarks of a
+    feature in its dict BENCHMARKS, run them with:
+
+        python3 bench_<feature>.py [<name> ...] [--json <path>]
+
+    or all the benchmarks with `python3 run.py`. With `--json <path>` the
+    results are also written to a JSON file, so the runs of different
+    commits can be compared. What the benchmarks measure is checked by
+    the tests of the `tests` directory.
+"""
+
+import os
+import sys
+import json
+import subprocess
+import tracemalloc
+from time import perf_counter, time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.realpath(__file__))), 'tests'))
+
+# local imports
+from support import (SOURCE_PATH, DaemonSession, FakeDriver,  # noqa: E402,F401
+                     device_color, legacy_save, pyro_usable, wait_until)
+
+
+def measure(function, repeat):
+    """
+        Return the seconds per call and the bytes allocated per call.
+    """
+    function()  # warm up
+
+    start = perf_counter()
+    for _ in range(repeat):
+        function()
+    seconds = (perf_counter() - start) / repeat
+
+    tracemalloc.start()
+    function()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return seconds, peak
+
+
+def percentile(values, percent):
+    """
+        Nearest-rank percentile of a list of values.
+    """
+    values = sorted(values)
+    index = max(int(round(percent / 100 * len(values) + 0.5)) - 1, 0)
+    return values[min(index, len(values) - 1)]
+
+
+def _git_revision():
+    try:
+        return subprocess.check_output(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            cwd=SOURCE_PATH,
+            stderr=subprocess.DEVNULL).decode('utf-8').strip()
+    except Exception:
+        return None
+
+
+def main(benchmarks, arguments=None):
+    """
+        Run the benchmarks named in the command line, or all of them.
+    """
+    names = list(sys.argv[1:] if arguments is None else arguments)
+    json_path = None
+
+    if '--json' in names:
+        index = names.index('--json')
+        try:
+            json_path = names[index + 1]
+        except IndexError:
+            print("--json needs a path")
+            exit(1)
+        del names[index:index + 2]
+
+    names = names or sorted(benchmarks.keys())
+
+    for name in names:
+        if name not in benchmarks:
+            print("Unknown benchmark `{}`, choose from: {}".format(
+                name, ', '.join(sorted(benchmarks.keys()))))
+            exit(1)
+
+    results = {}
+    for name in names:
+        results[name] = benchmarks[name]()
+        print()
+
+    if json_path is not None:
+        with open(json_path, encoding='utf-8', mode='wt') as f:
+            json.dump({'revision': _git_revision(),
+                       'time': time(),
+                       'python': sys.version.split()[0],
+                       'results': results}, f, indent=4, sort_keys=True)
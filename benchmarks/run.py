@@ -0,0 +1,37 @@
+#!/usr/bin/python3
+#
+
+#  Copyright (C) 2026  Rafael Senties Martinelli <rafael@senties-martinelli.com>
+#
+#  This program is free software; you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License 3 as published by
+#   the Free Software Foundation.
+#
+#  This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+#   along with this program; if not, write to the Free Software Foundation,
+#   Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301  USA.
+
+"""
+    Run all the benchmarks, or only some of them, with:
+
+        python3 run.py [<name> ...] [--json <path>]
+"""
+
+import os
+import importlib
+
+from benchmark import main
+
+BENCHMARKS = {}
+
+for file_name in sorted(os.listdir(os.path.dirname(os.path.realpath(__file__)))):
+    if file_name.startswith('bench_') and file_name.endswith('.py'):
+        BENCHMARKS.update(importlib.import_module(file_name[:-3]).BENCHMARKS)
+
+if __name__ == '__main__':
+    main(BENCHMARKS)
@@ -0,0 +1,260 @@
+#!/usr/bin/python3
+#
+
+#  Copyright (C) 2026  Rafael Senties Martinelli <rafael@senties-martinelli.com>
+#
+#  This program is free software; you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License 3 as published by
+#   the Free Software Foundation.
+#
+#  This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+#   along with this program; if not, write to the Free Software Foundation,
+#   Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301  USA.
+
+"""
+    What the tests and the benchmarks share: the sources are imported
+    from usr/share/alienware-kbl, and a daemon can be run against a
+    simulated device with files that are only in a temporary directory.
+"""
+
+import os
+import sys
+import json
+import shutil
+import tempfile
+import threading
+from time import sleep, time
+
+SOURCE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.realpath(__file__))),
+                           'usr', 'share', 'alienware-kbl')
+
+if SOURCE_PATH not in sys.path:
+    sys.path.insert(0, SOURCE_PATH)
+
+
+class FakeDriver:
+
+    """
+        A driver without device, to build the packets of a computer.
+    """
+
+    def __init__(self, computer):
+        self.computer = computer
+        self.trace = False
+
+
+class TemporaryPaths:
+
+    """
+        Replaces `Paths.Paths` so the daemon and the bindings only use the
+        files of a temporary directory, and never those of the users.
+    """
+
+    root = None
+
+    def __init__(self, user=None):
+        root = self.root
+
+        self.CONFIGURATION_PATH = os.path.join(root, 'alienware-kbl.ini')
+        self.PROFILES_PATH = os.path.join(root, 'profiles') + '/'
+        self.DAEMON_PYRO_PATH = os.path.join(root, 'daemon-adress')
+        self.DAEMON_SOCKET_PATH = os.path.join(root, 'daemon.sock')
+        self.DEVICE_CACHE_PATH = os.path.join(root, 'device')
+        self.GLOBAL_CONFIG = os.path.join(root, 'gobal-config.ini')
+        self.CACHE_PATH = os.path.join(root, 'cache') + '/'
+        self.COMPILED_THEMES_PATH = self.CACHE_PATH + 'themes/'
+        self.PACING_PATH = self.CACHE_PATH + 'pacing.ini'
+        self.SAVED_BLOCKS_PATH = self.CACHE_PATH + 'saved-blocks.ini'
+
+        for directory in (self.PROFILES_PATH, self.CACHE_PATH):
+            if not os.path.exists(directory):
+                os.makedirs(directory)
+
+
+def pyro_usable():
+    try:
+        import Pyro4
+        Pyro4.Daemon().shutdown()
+        return True
+    except Exception as e:
+        print("Pyro4 is not usable ({}).".format(e))
+        return False
+
+
+class DaemonSession:
+
+    """
+        A Daemon running against a simulated device of `computer_name`,
+        and an AlienwareKBL connected to it. With the `pyro` transport the
+        commands go through a Pyro4 daemon like in the real world, with
+        the `direct` one the bindings call the Daemon object. The daemon
+        also listens on its Unix socket if `fast_server` is True. `hotplug`
+        is the key of the global configuration, by default it is `off`. If
+        `metrics` is True, the daemon writes its metrics in `metrics_path`.
+        `settings` are other keys of the global configuration. If `delay`
+        is not None, the pacer always waits `delay` before each packet.
+    """
+
+    def __init__(self, computer_name, transport='pyro', pacing='adaptive', fast_server=False,
+                 profiles=2, hotplug='off', metrics=False, settings=None, delay=None):
+        import Bindings
+        import Daemon
+        from CCParser import CCParser
+
+        self._modules = (Bindings, Daemon)
+        self._root = tempfile.mkdtemp(prefix='akbl-test-')
+        self._pyro_daemon = None
+        self._fast_server = None
+
+        TemporaryPaths.root = self._root
+        for module in self._modules:
+            module.Paths = TemporaryPaths
+
+        paths = TemporaryPaths()
+        ccp = CCParser(paths.GLOBAL_CONFIG, 'Global alienware-kbl Configuration')
+        with ccp.batch():
+            ccp.write('boot_user', 'root')
+            ccp.write('simulate', computer_name)
+            ccp.write('write_pacing', pacing if delay is None else 'conservative')
+            ccp.write('hotplug', hotplug)
+            if metrics:
+                ccp.write('metrics_path', os.path.join(self._root, 'alienware-kbl.prom'))
+            for key, value in (settings or {}).items():
+                ccp.write(key, value)
+
+        self._add_profiles(computer_name, paths.PROFILES_PATH, profiles)
+
+        simulate = os.environ.pop('AKBL_SIMULATE', None)
+        try:
+            self.daemon = Daemon.Daemon(None)
+        finally:
+            if simulate is not None:
+                os.environ['AKBL_SIMULATE'] = simulate
+
+        self.device = self.daemon._driver.dev
+        if delay is not None:
+            self.daemon._driver.pacer.delay = delay
+
+        self.paths = paths
+        self.uri = None
+
+        if fast_server:
+            from FastServer import FastServer
+
+            self._fast_server = FastServer(self.daemon, paths.DAEMON_SOCKET_PATH)
+            self._fast_server.start()
+
+        if transport == 'pyro':
+            import Pyro4
+
+            self._pyro_daemon = Pyro4.Daemon()
+            self.uri = str(self._pyro_daemon.register(self.daemon))
+            with open(paths.DAEMON_PYRO_PATH, encoding='utf-8', mode='wt') as f:
+                f.write(self.uri)
+
+            thread = threading.Thread(target=self._pyro_daemon.requestLoop)
+            thread.daemon = True
+            thread.start()
+
+            self.bindings = Bindings.AlienwareKBL()
+        else:
+            self.bindings = Bindings.AlienwareKBL()
+            self.bindings._address = 'direct'
+            self.bindings._pyro = self.daemon
+
+        if not self.bindings.ping():
+            self.close()
+            raise RuntimeError("The bindings could not connect to the daemon")
+
+    def _add_profiles(self, computer_name, profiles_path, count):
+        """
+            Two profiles with different colors, so switching between them
+            changes the lights, and copies of them up to `count` profiles.
+        """
+        import Configuration
+        from Computers import AllComputers
+
+        computer = AllComputers.computerList[computer_name].computer
+
+        for name, color in (('Blue', '#0000FF'), ('Red', '#FF0000')):
+            profile = Configuration.New(computer)
+            profile.create_profile(name, profiles_path + name + '.cfg')
+            for area in profile.area.values():
+                for zone in area:
+                    zone.color1 = color
+                    zone.color2 = color
+            profile.save()
+
+        with open(profiles_path + 'Blue.cfg', encoding='utf-8', mode='rt') as f:
+            header = json.loads(f.readline())
+            text = f.read()
+
+        for i in range(count - 2):
+            header['name'] = 'Profile {:05}'.format(i)
+            with open(profiles_path + header['name'] + '.cfg', encoding='utf-8', mode='wt') as f:
+                f.write('{}\n{}'.format(json.dumps(header), text))
+
+    def close(self):
+        if self.daemon._profiles_watcher is not None:
+            self.daemon._profiles_watcher.close()
+
+        if self.daemon._hotplug is not None:
+            self.daemon._hotplug.close()
+
+        if self.daemon._metrics is not None:
+            self.daemon._metrics.close()
+
+        if self._fast_server is not None:
+            self._fast_server.close()
+            self._fast_server = None
+
+        if self._pyro_daemon is not None:
+            self._pyro_daemon.shutdown()
+            self._pyro_daemon = None
+
+        from Paths import Paths
+        for module in self._modules:
+            module.Paths = Paths
+
+        shutil.rmtree(self._root, ignore_errors=True)
+
+
+def legacy_save(profile, path):
+    """
+        How the profiles were written before the JSON lines format.
+    """
+    with open(path, encoding='utf-8', mode='wt') as f:
+        f.write('name={0}\n'.format(profile.name))
+        f.write('computer={0}\n'.format(profile.computer.name))
+        f.write('speed={0}\n\n\n'.format(profile.speed))
+
+        for key in sorted(profile.area.keys()):
+            area = profile.area[key]
+
+            f.write('area={0}\n'.format(area.name))
+            for zone_data in area:
+                f.write('mode={0}\n'.format(zone_data.mode))
+                f.write('color1={0}\n'.format(zone_data.color1))
+                f.write('color2={0}\n'.format(zone_data.color2))
+            f.write('\n')
+
+
+def device_color(color):
+    """
+        The color that the device shows, it has 4 bits per channel.
+    """
+    return '#' + ''.join('{:02X}'.format(int(color[i:i + 2], 16) // 16 * 17)
+                         for i in (1, 3, 5))
+
+
+def wait_until(condition, timeout=10):
+    deadline = time() + timeout
+    while not condition():
+        if time() > deadline:
+            raise AssertionError("Timeout")
+        sleep(0.001)
@@ -0,0 +1,54 @@
+#!/usr/bin/python3
+#
+
+#  Copyright (C) 2026  Rafael Senties Martinelli <rafael@senties-martinelli.com>
+#
+#  This program is free software; you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License 3 as published by
+#   the Free Software Foundation.
+#
+#  This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+#   along with this program; if not, write to the Free Software Foundation,
+#   Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301  USA.
+
+import pytest
+
+from Animation import Animator, Effect, Wave
+from Engine import Controller, Driver
+from Scheduler import DeviceWorker
+from Tracing import Tracer
+
+from support import wait_until
+
+
+def test_effects_must_have_colors():
+    with pytest.raises(TypeError):
+        Effect()
+
+
+@pytest.mark.parametrize('with_worker', (False, True))
+def test_only_the_first_frame_resets_the_lights(with_worker):
+    driver = Driver('M17XR3')
+    driver.pacer.delay = 0
+    driver.tracer = Tracer()
+    controller = Controller(driver)
+    controller.incremental_writes = True
+    worker = DeviceWorker(controller) if with_worker else None
+
+    animator = Animator(controller, Wave(period=0.5), 100, worker)
+    animator.start()
+    try:
+        wait_until(lambda: animator.frames >= 10)
+    finally:
+        animator.stop()
+
+    stats = driver.tracer.get_stats()
+    assert animator.errors == 0
+    assert stats['commands']['reset']['count'] == 1
+    assert stats['commands']['transmit_execute']['count'] >= 10 - animator.skipped
+    assert len(set(driver.dev.get_colors().values())) > 1
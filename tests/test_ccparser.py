@@ -0,0 +1,75 @@
+#!/usr/bin/python3
+#
+
+#  Copyright (C) 2026  Rafael Senties Martinelli <rafael@senties-martinelli.com>
+#
+#  This program is free software; you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License 3 as published by
+#   the Free Software Foundation.
+#
+#  This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+#   along with this program; if not, write to the Free Software Foundation,
+#   Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301  USA.
+
+import os
+
+from CCParser import CCParser
+
+SECTION = 'Global alienware-kbl Configuration'
+
+
+def test_values(tmpdir):
+    path = str(tmpdir.join('global.ini'))
+    ccp = CCParser(path, SECTION)
+    with ccp.batch():
+        ccp.write('boolean', True)
+        ccp.write('integer', 12)
+        ccp.write('string', 'text')
+
+    assert ccp.get_bool_defval('boolean', False) is True
+    assert ccp.get_int_defval('integer', 0) == 12
+    assert ccp.get_str_defval('string', '') == 'text'
+    assert ccp.get_int_defval('missing', -1) == -1
+
+
+def test_cache_sees_the_changes_of_other_instances(tmpdir):
+    path = str(tmpdir.join('global.ini'))
+    ccp = CCParser(path, SECTION)
+    ccp.write('key', 'value')
+    assert ccp.get_str_defval('key', '') == 'value'
+
+    CCParser(path, SECTION).write('key', 'changed')
+    assert ccp.get_str_defval('key', '') == 'changed'
+
+
+def test_no_temporary_file_is_left(tmpdir):
+    ccp = CCParser(str(tmpdir.join('global.ini')), SECTION)
+    for i in range(5):
+        ccp.write('key_{}'.format(i), i)
+    with ccp.batch():
+        ccp.write('key_0', 'batch')
+
+    assert os.listdir(str(tmpdir)) == ['global.ini']
+
+
+def test_the_mode_and_the_owner_are_kept(tmpdir):
+    path = str(tmpdir.join('global.ini'))
+    ccp = CCParser(path, SECTION)
+    ccp.write('key', 'value')
+    assert os.stat(path).st_mode & 0o777 == 0o644
+
+    os.chmod(path, 0o600)
+    if os.getuid() == 0:
+        os.chown(path, 1, 1)
+
+    ccp.write('key', 'changed')
+
+    stat = os.stat(path)
+    assert stat.st_mode & 0o777 == 0o600
+    if os.getuid() == 0:
+        assert (stat.st_uid, stat.st_gid) == (1, 1)
@@ -0,0 +1,99 @@
+#!/usr/bin/python3
+#
+
+#  Copyright (C) 2026  Rafael Senties Martinelli <rafael@senties-martinelli.com>
+#
+#  This program is free software; you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License 3 as published by
+#   the Free Software Foundation.
+#
+#  This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+#   along with this program; if not, write to the Free Software Foundation,
+#   Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301  USA.
+
+import os
+import sys
+import socket
+import subprocess
+from time import perf_counter
+
+import pytest
+
+pytest.importorskip('Pyro4')
+
+from support import SOURCE_PATH, DaemonSession
+
+# Modules that toggling the lights must not import
+FORBIDDEN_MODULES = ('Pyro4', 'Bindings', 'AlienwareKBL', 'Paths',
+                     'Configuration', 'Computers', 'Texts', 'shutil')
+
+
+def _imported_modules(output):
+    """
+        Return the names of the modules of the output of `python3 -X importtime`.
+    """
+    modules = set()
+    for line in output.splitlines():
+        if line.startswith('import time:') and 'cumulative' not in line:
+            modules.add(line.split('|')[-1].strip())
+
+    return modules
+
+
+def test_lights_are_switched_through_the_socket():
+    session = DaemonSession('M17XR3', 'direct', fast_server=True, delay=0)
+
+    env = dict(os.environ)
+    env['AKBL_SOCKET'] = session.paths.DAEMON_SOCKET_PATH
+    command = [sys.executable, '-X', 'importtime',
+               os.path.join(SOURCE_PATH, 'DefaultArguments.py'), '--off']
+
+    try:
+        process = subprocess.run(command, env=env, cwd=SOURCE_PATH, check=True,
+                                 stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        session.daemon._worker.join()
+
+        assert session._fast_server.requests == 1
+        assert session.device.lights_on is False
+    finally:
+        session.close()
+
+    modules = _imported_modules(process.stderr.decode('utf-8'))
+    assert [name for name in FORBIDDEN_MODULES if name in modules] == []
+
+
+def test_a_silent_client_does_not_delay_the_others():
+    import FastClient
+    from FastServer import FastServer
+
+    session = DaemonSession('M17XR3', 'direct', fast_server=True, delay=0)
+    path = session.paths.DAEMON_SOCKET_PATH
+    server = session._fast_server
+    silent = []
+
+    try:
+        for _ in range(FastServer.MAX_CONNECTIONS - 1):
+            connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            connection.connect(path)
+            silent.append(connection)
+
+        start = perf_counter()
+        assert FastClient.ping(path)
+        assert perf_counter() - start < FastServer.READ_TIMEOUT
+
+        # The silent connections are closed after READ_TIMEOUT
+        for connection in silent:
+            connection.settimeout(FastServer.READ_TIMEOUT * 4)
+            assert connection.recv(1) == b''
+
+        assert server.requests == 1
+        assert server.refused == 0
+    finally:
+        for connection in silent:
+            connection.close()
+        session.close()
@@ -0,0 +1,125 @@
+#!/usr/bin/python3
+#
+
+#  Copyright (C) 2026  Rafael Senties Martinelli <rafael@senties-martinelli.com>
+#
+#  This program is free software; you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License 3 as published by
+#   the Free Software Foundation.
+#
+#  This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+#   along with this program; if not, write to the Free Software Foundation,
+#   Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301  USA.
+
+import os
+
+import Configuration
+from Computers import AllComputers
+from Compiler import CompiledThemes, merge_blocks, theme_key
+from Engine import Controller
+from Simulator import SimulatedDevice
+
+from support import FakeDriver
+
+COLORS = ['#{:06X}'.format((i * 0x1F3D5B) & 0xFFFFFF) for i in range(1, 32)]
+
+
+def _blocks(computer, color):
+    return [(key, ((computer.regions[key].regionId, 'fixed', color(i), color(i)),))
+            for i, key in enumerate(sorted(computer.regions.keys()))]
+
+
+def _lights(computer, request):
+    device = SimulatedDevice(computer, 0, 0, busy_after_execute=False)
+    for packet in request:
+        device.ctrl_transfer(0x21, 9, 0x202, 0, bytes(packet))
+    return device.regions
+
+
+def test_merged_themes_give_the_same_lights():
+    for name in sorted(AllComputers.computerList.keys()):
+        computer = AllComputers.computerList[name].computer
+        controller = Controller(FakeDriver(computer))
+
+        for color in (lambda i: COLORS[0], lambda i: COLORS[i % 2], lambda i: COLORS[i]):
+            blocks = _blocks(computer, color)
+            separate = controller.Build_Theme(0xc800, blocks, merge=False)
+            separate_lights = _lights(computer, separate)
+            merged = controller.Build_Theme(0xc800, blocks)
+
+            assert _lights(computer, merged) == separate_lights, name
+            assert len(merged) <= len(separate)
+
+
+def test_single_color_theme_packets():
+    computer = AllComputers.computerList['M17XR3'].computer
+    controller = Controller(FakeDriver(computer))
+    blocks = _blocks(computer, lambda i: COLORS[0])
+
+    assert len(controller.Build_Theme(0xc800, blocks, merge=False)) == 26
+    assert len(controller.Build_Theme(0xc800, blocks)) == 6
+
+
+def test_unique_colors_are_not_merged():
+    computer = AllComputers.computerList['M17XR3'].computer
+    blocks = _blocks(computer, lambda i: COLORS[i])
+
+    assert merge_blocks(blocks, computer) == blocks
+
+
+def test_power_button_is_not_merged():
+    for name in sorted(AllComputers.computerList.keys()):
+        computer = AllComputers.computerList[name].computer
+        merged = merge_blocks(_blocks(computer, lambda i: COLORS[0]), computer)
+
+        for key, region in computer.regions.items():
+            if region.power_button:
+                assert key in [name for name, _ in merged]
+
+
+def test_compiled_themes_are_not_written_again(tmpdir):
+    computer = AllComputers.computerList['M17XR3'].computer
+    cache_path = str(tmpdir.join('themes'))
+    path = str(tmpdir.join('Test.cfg'))
+    theme = Configuration.New(computer)
+    theme.create_profile('Test', path)
+    Configuration.profiles.pop('Test')
+    theme.save()
+
+    compiled = CompiledThemes(path=cache_path)
+    calls = []
+
+    def compile():
+        calls.append(True)
+        return Controller(FakeDriver(computer)).Build_Theme(
+            theme.speed, _blocks(computer, lambda i: COLORS[i]))
+
+    data = compiled.get(theme, computer, compile)
+    filename = os.path.join(cache_path, os.listdir(cache_path)[0])
+    stat = os.stat(filename)
+
+    # Only the mtime of the profile changes when it is applied
+    os.utime(path, (stat.st_mtime + 10, stat.st_mtime + 10))
+    loaded = Configuration.New(computer)
+    loaded.load(path)
+    Configuration.profiles.pop('Test')
+    assert theme_key(loaded, computer) == theme_key(theme, computer)
+
+    for _ in range(3):
+        assert compiled.get(loaded, computer, compile) == data
+        assert CompiledThemes(path=cache_path).get(loaded, computer, compile) == data
+
+    assert len(calls) == 1
+    assert os.listdir(cache_path) == [os.path.basename(filename)]
+    assert os.stat(filename).st_ino == stat.st_ino
+    assert os.stat(filename).st_mtime == stat.st_mtime
+
+    # A new content is compiled again
+    theme.area[sorted(theme.area.keys())[0]][0].color1 = '#FF0000'
+    theme.save()
+    assert theme_key(theme, computer) != theme_key(loaded, computer)
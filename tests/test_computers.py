@@ -0,0 +1,72 @@
+#!/usr/bin/python3
+#
+
+#  Copyright (C) 2026  Rafael Senties Martinelli <rafael@senties-martinelli.com>
+#
+#  This program is free software; you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License 3 as published by
+#   the Free Software Foundation.
+#
+#  This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+#   along with this program; if not, write to the Free Software Foundation,
+#   Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301  USA.
+
+import os
+import sys
+import json
+import subprocess
+
+from Engine import Driver
+from Simulator import SimulatedBus
+
+from support import SOURCE_PATH
+
+_SNIPPET = """
+import sys, json
+import Computers, Engine
+
+driver = Engine.Driver(simulate=sys.argv[1])
+built = [item.name for item in Computers.AllComputers.computerList.values() if item.is_built()]
+json.dump({'built': built, 'found': driver.computer_name}, sys.stdout)
+"""
+
+
+def test_only_the_model_found_is_built():
+    env = dict(os.environ)
+    env.pop('AKBL_SIMULATE', None)
+
+    output = subprocess.run([sys.executable, '-c', _SNIPPET, 'M17XR3'], env=env, cwd=SOURCE_PATH,
+                            check=True, stdout=subprocess.PIPE).stdout
+    run = json.loads(output.decode('utf-8'))
+
+    assert run['found'] == 'M17XR3'
+    assert run['built'] == ['M17XR3']
+
+
+def test_device_is_found_among_other_devices(tmpdir):
+    cache_path = str(tmpdir.join('device'))
+
+    for computer_name in ('M18XRX', 'M14XR2'):
+        driver = Driver(computer_name)
+        driver.bus = SimulatedBus.for_computer(computer_name, others=50)
+        driver.device_cache = cache_path
+
+        driver.bus.enumerations = 0
+        assert driver.FindDevice()
+        assert driver.computer_name == computer_name
+        assert driver.bus.enumerations == 1
+        assert os.path.exists(cache_path)
+
+        # The next drivers only look for the model in the cache
+        driver.bus.enumerations = 0
+        driver.computer_name = None
+        assert driver.FindDevice()
+        assert driver.computer_name == computer_name
+        assert driver.bus.enumerations == 1
+
+        os.remove(cache_path)
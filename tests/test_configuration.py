@@ -0,0 +1,155 @@
+#!/usr/bin/python3
+#
+
+#  Copyright (C) 2026  Rafael Senties Martinelli <rafael@senties-martinelli.com>
+#
+#  This program is free software; you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License 3 as published by
+#   the Free Software Foundation.
+#
+#  This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+#   along with this program; if not, write to the Free Software Foundation,
+#   Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301  USA.
+
+import os
+
+import Configuration
+from Computers import AllComputers
+
+from support import legacy_save
+
+COMPUTER = AllComputers.computerList['M17XR3'].computer
+MODES = ('fixed', 'blink', 'morph')
+
+
+def _profile(path, zones=3, name='Test'):
+    profile = Configuration.New(COMPUTER)
+    profile.create_profile(name, path)
+
+    for area in profile.area.values():
+        zone = area[0]
+        for i in range(1, zones):
+            color = '#{:06X}'.format((i * 0x10101) & 0xFFFFFF)
+            profile.add_zone(Configuration.ZoneData(
+                zone.regionId, MODES[i % 3], COMPUTER.regions[area.name], color, color))
+
+    return profile
+
+
+def _load(path):
+    profile = Configuration.New(COMPUTER)
+    profile.path = path
+    profile.load(path)
+    return profile
+
+
+def _zones(areas):
+    return {name: [(zone.mode, zone.color1, zone.color2) for zone in area]
+            for name, area in areas.items()}
+
+
+def test_formats_load_the_same_zones(tmpdir):
+    path = str(tmpdir.join('Test.cfg'))
+    legacy_path = str(tmpdir.join('Legacy.cfg'))
+    profile = _profile(path)
+    profile.save()
+    legacy_save(profile, legacy_path)
+
+    with open(path, encoding='utf-8', mode='rt') as f:
+        assert '"version": 1' in f.readline()
+
+    assert _zones(_load(path).area) == _zones(_load(legacy_path).area) == _zones(profile.area)
+    assert _load(legacy_path).speed == profile.speed
+
+    # No temporary file is left
+    assert sorted(os.listdir(str(tmpdir))) == ['Legacy.cfg', 'Test.cfg']
+
+
+def test_power_areas(tmpdir):
+    path = str(tmpdir.join('Test.cfg'))
+    profile = _profile(path, zones=1)
+    region = COMPUTER.regions[sorted(COMPUTER.regions.keys())[0]]
+    profile.add_power_area('onBat', region).add_zone(
+        Configuration.ZoneData(region.regionId, 'fixed', region, '#FF0000', '#FF0000'))
+    profile.save()
+
+    with open(path, encoding='utf-8', mode='rt') as f:
+        assert '"version": 2' in f.readline()
+
+    loaded = _load(path)
+    assert list(loaded.power.keys()) == ['onBat']
+    assert _zones(loaded.power['onBat']) == {region.name: [('fixed', '#FF0000', '#FF0000')]}
+    assert _zones(loaded.area) == _zones(profile.area)
+
+
+def test_wrong_profiles_are_not_loaded(tmpdir):
+    path = str(tmpdir.join('Wrong.cfg'))
+    with open(path, encoding='utf-8', mode='wt') as f:
+        f.write('{"format": "alienware-kbl-profile", "version": 99, "name": "Wrong"}\n')
+
+    try:
+        _load(path)
+    except Configuration.ProfileError:
+        pass
+    else:
+        raise AssertionError("The profile was loaded")
+
+
+def test_profile_names(tmpdir):
+    profiles_path = str(tmpdir) + '/'
+    _profile(profiles_path + 'Test.cfg').save()
+    legacy_save(_profile(profiles_path + 'Other.cfg', name='Other'), profiles_path + 'Legacy.cfg')
+    Configuration.profiles.clear()
+
+    # The legacy profile is named by its `name=`
+    assert Configuration.READ_profile_names(profiles_path) == ['Other', 'Test']
+
+    Configuration.LOAD_profiles(COMPUTER, profiles_path)
+    assert sorted(Configuration.profiles.keys()) == ['Other', 'Test']
+    assert Configuration.UPDATE_profiles(COMPUTER, profiles_path) is False
+    Configuration.profiles.clear()
+
+
+def test_wrong_profiles_are_read_again_when_they_change(tmpdir, capsys):
+    profiles_path = str(tmpdir) + '/'
+    _profile(profiles_path + 'Test.cfg').save()
+    path = profiles_path + 'Wrong.cfg'
+    with open(path, encoding='utf-8', mode='wt') as f:
+        f.write('{"format": "alienware-kbl-profile", "version": 99, "name": "Wrong"}\n')
+
+    Configuration.LOAD_profiles(COMPUTER, profiles_path)
+    assert 'Wrong.cfg' in capsys.readouterr().out
+
+    # The file is not read again until it changes
+    assert Configuration.UPDATE_profiles(COMPUTER, profiles_path) is False
+    assert Configuration.UPDATE_profiles(COMPUTER, profiles_path, [path]) is False
+    assert capsys.readouterr().out == ''
+
+    _profile(path, name='Wrong').save()
+    assert Configuration.UPDATE_profiles(COMPUTER, profiles_path) is True
+    assert sorted(Configuration.profiles.keys()) == ['Test', 'Wrong']
+    Configuration.profiles.clear()
+
+
+def test_saving_keeps_the_mode_and_the_owner(tmpdir):
+    path = str(tmpdir.join('Test.cfg'))
+    profile = _profile(path, zones=1)
+    profile.save()
+    assert os.stat(path).st_mode & 0o777 == 0o644
+
+    os.chmod(path, 0o664)
+    if os.getuid() == 0:
+        os.chown(path, 1, 1)
+
+    profile.save()
+
+    stat = os.stat(path)
+    assert stat.st_mode & 0o777 == 0o664
+    if os.getuid() == 0:
+        assert (stat.st_uid, stat.st_gid) == (1, 1)
+    assert os.listdir(str(tmpdir)) == ['Test.cfg']
@@ -0,0 +1,175 @@
+#!/usr/bin/python3
+#
+
+#  Copyright (C) 2026  Rafael Senties Martinelli <rafael@senties-martinelli.com>
+#
+#  This program is free software; you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License 3 as published by
+#   the Free Software Foundation.
+#
+#  This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+#   along with this program; if not, write to the Free Software Foundation,
+#   Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301  USA.
+
+import os
+import re
+import json
+import threading
+
+import pytest
+
+pytest.importorskip('Pyro4')
+
+from support import DaemonSession, device_color, wait_until
+
+COMPUTER_NAME = 'M17XR3'
+
+# A sample of the text format of Prometheus
+_SAMPLE = re.compile(r'^[a-zA-Z_:][a-zA-Z0-9_:]*(\{[a-zA-Z_][a-zA-Z0-9_]*="[^"]*"'
+                     r'(,[a-zA-Z_][a-zA-Z0-9_]*="[^"]*")*\})? (-?[0-9.e+-]+|NaN)$')
+
+
+@pytest.fixture
+def session():
+    session = DaemonSession(COMPUTER_NAME, 'direct', delay=0)
+    yield session
+    session.close()
+
+
+def test_profiles_are_applied(session):
+    for name, color in (('Red', '#FF0000'), ('Blue', '#0000FF')):
+        assert session.bindings.set_profile(name) is not False
+        session.daemon._worker.join()
+        assert set(session.device.get_colors().values()) == {color}
+
+
+def test_burst_of_set_colors_reaches_the_last_state(session):
+    device = session.device
+    colors = ['#{:02X}00{:02X}'.format(i * 25, 255 - i * 25) for i in range(10)]
+
+    for color in colors:
+        session.bindings.set_colors('fixed', 100, color)
+    session.daemon._worker.join()
+
+    assert set(device.get_colors().values()) == {device_color(colors[-1])}
+    assert session.daemon._worker.get_stats()['executed'] <= len(colors) + 1
+
+
+def test_profile_names():
+    session = DaemonSession(COMPUTER_NAME, 'direct', profiles=20, delay=0)
+    try:
+        names = session.bindings.get_profile_names()
+        assert len(names) == 20
+        assert names == session.bindings._local_profile_names()
+
+        # The names are cached until the watcher sees the profiles change
+        assert session.bindings.get_profile_names() is names
+        with open(session.paths.PROFILES_PATH + 'Red.cfg', encoding='utf-8', mode='rt') as f:
+            header = json.loads(f.readline())
+            text = f.read()
+        header['name'] = 'Green'
+        with open(session.paths.PROFILES_PATH + 'Green.cfg', encoding='utf-8', mode='wt') as f:
+            f.write('{}\n{}'.format(json.dumps(header), text))
+        os.remove(session.paths.PROFILES_PATH + 'Blue.cfg')
+        if not session.daemon._profiles_watcher.inotify:
+            session.daemon._profiles_changed(None)
+
+        wait_until(lambda: session.bindings.get_profile_names() != names)
+        session.daemon._worker.join()
+        assert session.bindings.get_profile_names() == session.bindings._local_profile_names()
+        assert 'Green' in session.bindings.get_profile_names()
+        assert 'Blue' not in session.bindings.get_profile_names()
+    finally:
+        session.close()
+
+
+def test_reload_configurations_in_the_worker(monkeypatch):
+    import Configuration
+
+    session = DaemonSession(COMPUTER_NAME, 'direct', delay=0)
+    threads = []
+    update_profiles = Configuration.UPDATE_profiles
+
+    def record(*args):
+        threads.append(threading.current_thread().name)
+        return update_profiles(*args)
+
+    monkeypatch.setattr(Configuration, 'UPDATE_profiles', record)
+    try:
+        assert session.bindings._command('reload_configurations')
+        session.daemon._worker.join()
+        assert threads == ['DeviceWorker']
+    finally:
+        session.close()
+
+
+def test_metrics():
+    session = DaemonSession(COMPUTER_NAME, 'direct', metrics=True, delay=0)
+    daemon = session.daemon
+    exporter = daemon._metrics
+
+    try:
+        for profile in ('Red', 'Blue', 'Red'):
+            session.bindings.set_profile(profile)
+            daemon._worker.join()
+
+        assert exporter.write()
+        with open(exporter.path, encoding='utf-8', mode='rt') as f:
+            lines = f.read().splitlines()
+
+        values = {}
+        for line in lines:
+            if not line.startswith('# HELP ') and not line.startswith('# TYPE '):
+                assert _SAMPLE.match(line), line
+                name, value = line.rsplit(' ', 1)
+                values[name] = value
+
+        assert values['akbl_device_packets_total'] == str(session.device.packets)
+        assert values['akbl_commands_executed_total'] == str(daemon._worker.executed)
+        assert values['akbl_queue_depth'] == '0'
+        assert values['akbl_command_seconds_count{command="set_profile"}'] == '3'
+        assert exporter.errors == 0
+        assert [name for name in os.listdir(os.path.dirname(exporter.path))
+                if name.endswith('.tmp')] == []
+    finally:
+        session.close()
+
+
+def test_hotplug():
+    from Hotplug import HotplugMonitor
+    from Simulator import SimulatedDevice
+
+    default_interval = HotplugMonitor.POLL_INTERVAL
+    HotplugMonitor.POLL_INTERVAL = 0.01
+    try:
+        session = DaemonSession(COMPUTER_NAME, 'direct', hotplug='poll', delay=0)
+    except Exception:
+        HotplugMonitor.POLL_INTERVAL = default_interval
+        raise
+
+    daemon = session.daemon
+    driver = daemon._driver
+    device = session.device
+
+    try:
+        driver.bus.unplug(device)
+        wait_until(lambda: not driver.connected)
+
+        # The profile changes while the device is not there
+        session.bindings.set_profile('Red')
+        daemon._worker.join()
+
+        device = SimulatedDevice(device.computer, device.idVendor, device.idProduct, device.product)
+        driver.bus.plug(device)
+        wait_until(lambda: daemon._hotplug_stats['recoveries'] == 1)
+
+        assert set(device.get_colors().values()) == {'#FF0000'}
+        assert session.bindings.get_session_state()['removals'] == 1
+    finally:
+        session.close()
+        HotplugMonitor.POLL_INTERVAL = default_interval
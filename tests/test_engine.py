@@ -0,0 +1,269 @@
+#!/usr/bin/python3
+#
+
+#  Copyright (C) 2026  Rafael Senties Martinelli <rafael@senties-martinelli.com>
+#
+#  This program is free software; you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License 3 as published by
+#   the Free Software Foundation.
+#
+#  This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+#   along with this program; if not, write to the Free Software Foundation,
+#   Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301  USA.
+
+import Configuration
+from Computers import AllComputers
+from Engine import Constructor, Controller, Driver
+
+from support import FakeDriver, device_color
+
+COMPUTER_NAME = 'M17XR3'
+
+
+def _driver():
+    driver = Driver(COMPUTER_NAME)
+    driver.pacer.delay = 0
+    return driver
+
+
+def _theme(computer, color, power=None):
+    theme = Configuration.New(computer)
+    theme.create_profile('Test', '/nonexistent/Test.cfg')
+    Configuration.profiles.pop('Test')
+
+    for area in theme.area.values():
+        for zone in area:
+            zone.color1 = color
+            zone.color2 = color
+
+    for key, power_color in (power or {}).items():
+        for region in computer.regions.values():
+            theme.add_power_area(key, region).add_zone(
+                Configuration.ZoneData(region.regionId, 'fixed', region, power_color, power_color))
+
+    return theme
+
+
+def test_constructor_packets():
+    computer = AllComputers.computerList[COMPUTER_NAME].computer
+    fill = computer.FILL_BYTE
+    request = Constructor(FakeDriver(computer))
+
+    request.Set_Speed(0xc800)
+    request.Set_Color(request.Area(0x1c00), request.Color('#F7F200'))
+    request.End_Loop()
+    request.End_Transfert()
+
+    assert [bytes(packet) for packet in request] == [
+        bytes([computer.START_BYTE, computer.COMMAND_SET_SPEED, fill, 0xc8, fill, fill, fill, fill, fill]),
+        bytes([computer.START_BYTE, computer.COMMAND_SET_COLOR, 0x01, 0x00, 0x1c, 0x00, 0xff, 0x00, fill]),
+        bytes([computer.START_BYTE, computer.COMMAND_LOOP_BLOCK_END, fill, fill, fill, fill, fill, fill, fill]),
+        bytes([computer.START_BYTE, computer.COMMAND_TRANSMIT_EXECUTE, fill, fill, fill, fill, fill, fill, fill])]
+    assert bytes(request.getbuffer()) == b''.join(bytes(packet) for packet in request)
+
+
+def test_constructor_grows_without_moving_the_packets_given():
+    computer = AllComputers.computerList[COMPUTER_NAME].computer
+    request = Constructor(FakeDriver(computer), size=1)
+
+    request.Set_Speed(0xc800)
+    first = request.packet(0)
+    for _ in range(20):
+        request.End_Loop()
+
+    assert len(request) == 21
+    assert first[1] == computer.COMMAND_SET_SPEED
+    assert request.packet(20)[1] == computer.COMMAND_LOOP_BLOCK_END
+
+
+def test_constructor_save_mode():
+    computer = AllComputers.computerList[COMPUTER_NAME].computer
+    request = Constructor(FakeDriver(computer), save=True, block=computer.BLOCK_AC_POWER)
+
+    request.Set_Color(request.Area(0x1), request.Color('#FF0000'))
+    request.End_Loop()
+    request.End_Transfert()
+
+    commands = [packet[1] for packet in request]
+    assert commands == [computer.COMMAND_SAVE_NEXT, computer.COMMAND_SET_COLOR,
+                        computer.COMMAND_SAVE_NEXT, computer.COMMAND_LOOP_BLOCK_END,
+                        computer.COMMAND_SAVE]
+    assert all(packet[2] == computer.BLOCK_AC_POWER
+               for packet in request if packet[1] == computer.COMMAND_SAVE_NEXT)
+
+
+def test_write_theme():
+    driver = _driver()
+    controller = Controller(driver)
+    computer = driver.computer
+    theme = _theme(computer, '#00FF00')
+
+    controller.Write_Theme(theme, incremental=False)
+
+    assert driver.dev.transactions == 1
+    assert set(driver.dev.get_colors().values()) == {'#00FF00'}
+    assert sorted(driver.dev.get_colors().keys()) == sorted(computer.regions.keys())
+
+
+def test_one_area_change_is_incremental():
+    driver = _driver()
+    device = driver.dev
+    controller = Controller(driver)
+    controller.incremental_writes = True
+    theme = _theme(driver.computer, '#00FF00')
+    area = sorted(theme.area.keys())[0]
+
+    controller.Write_Theme(theme)
+    packets = device.packets
+    controller.Write_Theme(theme, incremental=False)
+    full = device.packets - packets
+
+    # The device is busy running the loops of the theme
+    assert controller.Get_State() is False
+
+    theme.area[area][0].color1 = '#FF0000'
+    packets = device.packets
+    controller.Write_Theme(theme)
+    incremental = device.packets - packets
+
+    # status, speed, color, end of loop and execute
+    assert incremental == 5
+    assert incremental < full
+    colors = device.get_colors()
+    assert colors.pop(area) == '#FF0000'
+    assert set(colors.values()) == {'#00FF00'}
+
+    # Nothing is written if nothing changed
+    packets = device.packets
+    controller.Write_Theme(theme)
+    assert device.packets == packets
+
+
+def test_a_change_writes_all_the_theme_by_default():
+    driver = _driver()
+    device = driver.dev
+    # A firmware that does not keep the regions that are not sent
+    device.keep_regions = False
+    controller = Controller(driver)
+    theme = _theme(driver.computer, '#00FF00')
+    area = sorted(theme.area.keys())[0]
+
+    controller.Write_Theme(theme)
+    theme.area[area][0].color1 = '#FF0000'
+    resets = device.resets
+    controller.Write_Theme(theme)
+
+    assert device.resets > resets
+    colors = device.get_colors()
+    assert sorted(colors.keys()) == sorted(driver.computer.regions.keys())
+    assert colors.pop(area) == '#FF0000'
+    assert set(colors.values()) == {'#00FF00'}
+
+    # Nothing is written if nothing changed
+    packets = device.packets
+    controller.Write_Theme(theme)
+    assert device.packets == packets
+
+
+def test_unknown_status_writes_all_the_theme():
+    driver = _driver()
+    device = driver.dev
+    controller = Controller(driver)
+    controller.incremental_writes = True
+    theme = _theme(driver.computer, '#00FF00')
+
+    controller.Write_Theme(theme)
+    device._running = False
+    device._status = driver.computer.STATE_UNKNOWN_COMMAND
+
+    theme.area[sorted(theme.area.keys())[0]][0].color1 = '#FF0000'
+    packets = device.packets
+    controller.Write_Theme(theme)
+
+    # The lights were reset, then all the areas written
+    assert device.packets - packets > 5
+    assert sorted(device.get_colors().keys()) == sorted(driver.computer.regions.keys())
+    assert len(set(device.get_colors().values())) == 2
+
+
+def test_reset_is_skipped_when_the_device_is_ready():
+    driver = _driver()
+    device = driver.dev
+    computer = driver.computer
+    controller = Controller(driver)
+
+    controller.WaitForOk()
+    packets = device.packets
+    controller.Reset(computer.RESET_ALL_LIGHTS_ON)
+    # Only the status was asked
+    assert device.packets - packets == 1
+
+    # The lights are turned off after the reset of WaitForOk
+    controller.Reset(computer.RESET_ALL_LIGHTS_OFF)
+    assert device.lights_on is False
+    packets = device.packets
+    controller.Reset(computer.RESET_ALL_LIGHTS_OFF)
+    assert device.packets - packets == 1
+
+    # A running theme is always reset
+    controller.Write_Theme(_theme(computer, '#00FF00'))
+    packets = device.packets
+    controller.Reset(computer.RESET_ALL_LIGHTS_OFF)
+    assert device.packets - packets > 1
+    assert device.lights_on is False
+
+
+def test_power_blocks_are_saved_once(tmpdir):
+    driver = _driver()
+    device = driver.dev
+    computer = driver.computer
+    saved_blocks_path = str(tmpdir.join('saved-blocks.ini'))
+    colors = {'acPower': '#00FF00', 'onBat': '#FF0000'}
+    theme = _theme(computer, '#0000FF', colors)
+
+    assert Controller(driver, saved_blocks_path).Write_Power_Blocks(theme) == 2
+    assert sorted(device.storage.keys()) == sorted(
+        computer.suportedMode[key].block for key in colors)
+
+    for key, color in colors.items():
+        device.set_power_mode(computer.suportedMode[key].block)
+        assert set(device.get_colors().values()) == {device_color(color)}
+
+    # The hashes are kept for the controllers of the next boots
+    controller = Controller(driver, saved_blocks_path)
+    packets = device.packets
+    assert controller.Write_Power_Blocks(theme) == 0
+    assert device.packets == packets
+    assert device.storage_writes == 2
+
+    # Only the block that changed is saved again
+    theme.power['onBat'] = _theme(computer, '#000000', {'onBat': '#FFFFFF'}).power['onBat']
+    assert controller.Write_Power_Blocks(theme) == 1
+    assert device.storage_writes == 3
+
+    device.set_power_mode(computer.suportedMode['onBat'].block)
+    assert set(device.get_colors().values()) == {'#FFFFFF'}
+
+
+def test_power_blocks_keep_the_applied_theme(tmpdir):
+    driver = _driver()
+    device = driver.dev
+    computer = driver.computer
+    controller = Controller(driver, str(tmpdir.join('saved-blocks.ini')))
+    theme = _theme(computer, '#0000FF', {'onBat': '#FF0000'})
+
+    # Like the daemon applies a profile
+    assert controller.Write_Power_Blocks(theme) == 1
+    controller.Write_Theme(theme)
+
+    resets = device.resets
+    packets = device.packets
+    assert controller.Write_Power_Blocks(theme) == 0
+    controller.Write_Theme(theme)
+    assert device.resets == resets
+    assert device.packets == packets
@@ -0,0 +1,105 @@
+#!/usr/bin/python3
+#
+
+#  Copyright (C) 2026  Rafael Senties Martinelli <rafael@senties-martinelli.com>
+#
+#  This program is free software; you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License 3 as published by
+#   the Free Software Foundation.
+#
+#  This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+#   along with this program; if not, write to the Free Software Foundation,
+#   Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301  USA.
+
+from Engine import Controller, Driver
+from Pacing import Pacer, PACING_ADAPTIVE, PACING_CONSERVATIVE
+
+from test_engine import _theme
+
+
+def test_adaptive_pacing_checks_the_status():
+    assert Pacer('M17XR3', PACING_ADAPTIVE).check_status
+    assert not Pacer('M17XR3', PACING_CONSERVATIVE).check_status
+
+
+def test_unchecked_packets_do_not_shorten_the_delay():
+    pacer = Pacer('M17XR3', PACING_ADAPTIVE)
+    for _ in range(pacer.SPEEDUP_AFTER * 10):
+        pacer.success(False)
+    assert pacer.delay == pacer.CONSERVATIVE_DELAY
+
+    for _ in range(pacer.SPEEDUP_AFTER):
+        pacer.success()
+    assert pacer.delay < pacer.CONSERVATIVE_DELAY
+
+
+def test_incremental_writes_do_not_shorten_the_delay():
+    driver = Driver('M17XR3')
+    driver.pacer = Pacer('M17XR3', PACING_ADAPTIVE)
+    driver.pacer.wait = lambda: None
+    controller = Controller(driver)
+    controller.incremental_writes = True
+
+    theme = _theme(driver.computer, '#00FF00')
+    controller.Write_Theme(theme)
+    delay = driver.pacer.delay
+    packets = driver.dev.packets
+
+    zone = theme.area[sorted(theme.area.keys())[0]][0]
+    for _ in range(driver.pacer.SPEEDUP_AFTER):
+        for color in ('#FF0000', '#0000FF'):
+            zone.color1 = color
+            controller.Write_Theme(theme)
+
+    assert driver.dev.packets - packets > driver.pacer.SPEEDUP_AFTER
+    assert driver.pacer.delay == delay
+
+
+def test_pacer_goes_back_to_adaptive():
+    pacer = Pacer('M17XR3', PACING_ADAPTIVE)
+    for _ in range(pacer.MAX_FAILURES):
+        pacer.failure(busy=True)
+    assert pacer.mode == PACING_CONSERVATIVE
+    assert not pacer.check_status
+
+    for _ in range(pacer.RECOVER_AFTER - 1):
+        pacer.success(False)
+    assert pacer.mode == PACING_CONSERVATIVE
+
+    pacer.success(False)
+    assert pacer.mode == PACING_ADAPTIVE
+    assert pacer.check_status
+    assert pacer.fallbacks == 1
+
+
+def test_usb_errors_of_the_status_checks_are_retried():
+    from Simulator import USBError
+
+    driver = Driver('M17XR3')
+    driver.pacer = Pacer('M17XR3', PACING_ADAPTIVE)
+    driver.pacer.wait = lambda: None
+    device = driver.dev
+    controller = Controller(driver)
+    ctrl_transfer = device.ctrl_transfer
+    errors = []
+
+    def failing_transfer(request_type, request, value=0, index=0, data=None, timeout=None):
+        # The first status check fails once
+        if not errors and not request_type & 0x80 \
+                and bytes(data)[1] == driver.computer.COMMAND_GET_STATUS:
+            errors.append(True)
+            raise USBError('Simulated error')
+        return ctrl_transfer(request_type, request, value, index, data, timeout)
+
+    controller.WaitForOk()
+    device.ctrl_transfer = failing_transfer
+    driver.WriteDevice(controller.Build_Theme(0xc800, [('LK', ((0x1, 'fixed', '#FF0000', None),))]))
+
+    assert errors == [True]
+    assert driver.pacer.retries == 1
+    assert driver.reclaims == 1
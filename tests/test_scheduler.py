@@ -0,0 +1,98 @@
+#!/usr/bin/python3
+#
+
+#  Copyright (C) 2026  Rafael Senties Martinelli <rafael@senties-martinelli.com>
+#
+#  This program is free software; you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License 3 as published by
+#   the Free Software Foundation.
+#
+#  This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+#   along with this program; if not, write to the Free Software Foundation,
+#   Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301  USA.
+
+import threading
+
+from Scheduler import CommandQueue, PRIORITY_ANIMATION
+
+
+def _blocked_queue():
+    """
+        Return a queue whose thread is blocked until the event is set.
+    """
+    queue = CommandQueue()
+    event = threading.Event()
+    started = threading.Event()
+
+    def block():
+        started.set()
+        event.wait()
+
+    queue.submit(None, block)
+    started.wait()
+    return queue, event
+
+
+def test_commands_with_the_same_key_are_coalesced():
+    queue, event = _blocked_queue()
+    executed = []
+
+    commands = [queue.submit('colors', executed.append, i) for i in range(5)]
+    event.set()
+    assert queue.join(5)
+
+    assert executed == [4]
+    assert queue.coalesced == 4
+    assert all(command.done.is_set() for command in commands)
+
+
+def test_barriers_are_not_crossed():
+    queue, event = _blocked_queue()
+    executed = []
+
+    queue.submit('colors', executed.append, 'first')
+    queue.submit(None, executed.append, 'barrier')
+    queue.submit('colors', executed.append, 'second')
+    queue.submit('colors', executed.append, 'third')
+    event.set()
+    assert queue.join(5)
+
+    assert executed == ['first', 'barrier', 'third']
+
+
+def test_priorities():
+    queue, event = _blocked_queue()
+    executed = []
+
+    queue.submit('frame', executed.append, 'frame', priority=PRIORITY_ANIMATION)
+    queue.submit('profile', executed.append, 'profile')
+    event.set()
+    assert queue.join(5)
+
+    assert executed == ['profile', 'frame']
+
+
+def test_execution_time():
+    queue = CommandQueue()
+
+    def set_profile():
+        pass
+
+    for _ in range(3):
+        queue.submit(None, set_profile)
+    assert queue.join(5)
+
+    execution_time = queue.get_execution_time()
+    assert execution_time['set_profile'].count == 3
+
+    # A copy, that the queue does not change
+    queue.submit(None, set_profile)
+    assert queue.join(5)
+    assert execution_time['set_profile'].count == 3
+    assert queue.get_execution_time()['set_profile'].count == 4
+    assert queue.get_stats()['executed'] == 4
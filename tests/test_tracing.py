@@ -0,0 +1,119 @@
+#!/usr/bin/python3
+#
+
+#  Copyright (C) 2026  Rafael Senties Martinelli <rafael@senties-martinelli.com>
+#
+#  This program is free software; you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License 3 as published by
+#   the Free Software Foundation.
+#
+#  This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+#   along with this program; if not, write to the Free Software Foundation,
+#   Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301  USA.
+
+import threading
+
+from Engine import Controller, Driver
+from Pacing import Pacer, PACING_ADAPTIVE
+from Tracing import LatencyHistogram, Tracer, format_stats
+
+
+def _percentile(values, percent):
+    values = sorted(values)
+    index = max(int(round(percent / 100 * len(values) + 0.5)) - 1, 0)
+    return values[min(index, len(values) - 1)]
+
+
+def test_histogram_percentiles():
+    histogram = LatencyHistogram()
+    values = [i / 1000000 for i in range(1, 100001)]
+    for value in values:
+        histogram.record(value)
+
+    for percent in (50, 90, 99, 99.9):
+        exact = _percentile(values, percent)
+        error = abs(histogram.percentile(percent) - exact) / exact
+        assert error <= 1 / LatencyHistogram.SUB_BUCKETS, percent
+
+    assert histogram.count == len(values)
+    assert histogram.percentile(100) == histogram.max == values[-1]
+
+
+def test_tracer_counts_every_packet():
+    driver = Driver('M17XR3')
+    driver.pacer.delay = 0
+    driver.tracer = Tracer()
+    controller = Controller(driver)
+    device = driver.dev
+
+    request = controller.Build_Theme(0xc800, [('LK', ((0x1, 'fixed', '#FF0000', None),))])
+    controller.WaitForOk()
+    for _ in range(3):
+        driver.WriteDevice(request)
+
+    stats = driver.tracer.get_stats(recent=2)
+    assert stats['packets'] == device.packets
+    assert stats['bytes'] == device.bytes
+    assert stats['reads'] == device.reads
+    assert stats['commands']['set_color']['count'] == 3
+    assert stats['commands']['transmit_execute']['count'] == 3
+    assert stats['waits']['WaitForOk']['count'] == 1
+    assert len(stats['recent']) == 2
+
+    text = format_stats({'tracing': stats, 'wait': controller.wait_stats})
+    assert 'set_color' in text
+    assert 'wait WaitForOk' in text
+
+
+def test_tracer_measures_the_transfers_only():
+    driver = Driver('M17XR3')
+    driver.pacer = Pacer('M17XR3', PACING_ADAPTIVE)
+    driver.pacer.delay = 0.01
+    driver.tracer = Tracer()
+    controller = Controller(driver)
+    device = driver.dev
+
+    request = controller.Build_Theme(0xc800, [('LK', ((0x1, 'fixed', '#FF0000', None),))])
+    controller.WaitForOk()
+    driver.WriteDevice(request)
+
+    # The status checks of the adaptive pacing are traced too
+    stats = driver.tracer.get_stats()
+    assert stats['packets'] == device.packets
+    assert stats['reads'] == device.reads
+    assert stats['commands']['get_status']['count'] > 1
+
+    # Without the delay of the pacer before each packet
+    for histogram in stats['commands'].values():
+        assert histogram['max'] < driver.pacer.delay
+
+
+def test_tracer_stats_while_writing():
+    tracer = Tracer()
+    driver = Driver('M17XR3')
+    packet = bytes([driver.computer.START_BYTE, driver.computer.COMMAND_SET_COLOR])
+
+    def write():
+        # New loop names, so the dicts of the Tracer keep growing
+        for index in range(2000):
+            tracer.write(driver.computer, packet, 0.001, 1)
+            tracer.wait(str(index), 1, 0.001)
+
+    thread = threading.Thread(target=write)
+    thread.start()
+    while thread.is_alive():
+        tracer.get_stats(recent=10)
+    thread.join()
+
+    stats = tracer.get_stats()
+    assert stats['packets'] == 2000
+    assert len(stats['waits']) == 2000
+
+
+def test_format_stats_disabled():
+    assert 'disabled' in format_stats({'tracing': {'enabled': False}})
@@ -0,0 +1,290 @@
+#!/usr/bin/python3
+#
+
+#  Copyright (C) 2026  Rafael Senties Martinelli <rafael@senties-martinelli.com>
+#
+#  This program is free software; you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License 3 as published by
+#   the Free Software Foundation.
+#
+#  This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+#   along with this program; if not, write to the Free Software Foundation,
+#   Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301  USA.
+
+"""
+    Software animations: the colors of each region are computed for every
+    frame and sent to the device as a theme of fixed colors. The first frame
+    resets the lights; with the `incremental_writes` of the controller, the
+    next ones only transmit the regions whose color changed (see
+    `Controller.Write_Theme`).
+"""
+
+import math
+import colorsys
+import threading
+from abc import ABCMeta, abstractmethod
+from collections import namedtuple
+from traceback import format_exc
+from time import time
+
+try:
+    from time import thread_time as _cpu_time
+except ImportError:  # python < 3.7
+    from time import process_time as _cpu_time
+
+# local imports
+from Engine import TransactionCancelled
+from Scheduler import PRIORITY_ANIMATION
+
+
+def _hex_to_rgb(color):
+    color = color.replace('#', '')
+    return (int(color[0:2], 16) / 255,
+            int(color[2:4], 16) / 255,
+            int(color[4:6], 16) / 255)
+
+
+def _rgb_to_hex(r, g, b):
+    """
+        The device has 4 bits per channel, the colors are rounded
+        to them so two frames that look the same are equal.
+    """
+    return '#{:02X}{:02X}{:02X}'.format(
+        int(round(r * 15)) * 17,
+        int(round(g * 15)) * 17,
+        int(round(b * 15)) * 17)
+
+
+def _mix(rgb1, rgb2, ratio):
+    return tuple(c1 + (c2 - c1) * ratio for c1, c2 in zip(rgb1, rgb2))
+
+
+class Effect(metaclass=ABCMeta):
+
+    """
+        An effect returns the color of each region at the time `t`
+        (seconds since the animation started). `count` is the
+        number of regions.
+    """
+
+    @abstractmethod
+    def colors(self, t, count):
+        pass
+
+
+class Breathing(Effect):
+
+    def __init__(self, color='#0000FF', period=4.0):
+        self.rgb = _hex_to_rgb(color)
+        self.period = period
+
+    def colors(self, t, count):
+        brightness = (1 - math.cos(2 * math.pi * t / self.period)) / 2
+        return [_rgb_to_hex(*(c * brightness for c in self.rgb))] * count
+
+
+class Wave(Effect):
+
+    """
+        Moves from `color1` to `color2` across the regions,
+        in the order of `computer.regions`.
+    """
+
+    def __init__(self, color1='#0000FF', color2='#FF0000', period=2.0):
+        self.rgb1 = _hex_to_rgb(color1)
+        self.rgb2 = _hex_to_rgb(color2)
+        self.period = period
+
+    def colors(self, t, count):
+        colors = []
+        for i in range(count):
+            phase = t / self.period - i / count
+            ratio = (1 + math.sin(2 * math.pi * phase)) / 2
+            colors.append(_rgb_to_hex(*_mix(self.rgb1, self.rgb2, ratio)))
+
+        return colors
+
+
+class Spectrum(Effect):
+
+    def __init__(self, period=6.0):
+        self.period = period
+
+    def colors(self, t, count):
+        hue = (t / self.period) % 1
+        return [_rgb_to_hex(*colorsys.hsv_to_rgb(hue, 1, 1))] * count
+
+
+EFFECTS = {
+    'breathing': Breathing,
+    'wave': Wave,
+    'spectrum': Spectrum,
+}
+
+
+_Zone = namedtuple('_Zone', ('regionId', 'mode', 'color1', 'color2'))
+
+
+class _Frame:
+
+    """
+        What `Controller.Write_Theme` needs from a theme.
+    """
+
+    def __init__(self, speed, area):
+        self.speed = speed
+        self.area = area
+        self.mtime = None
+
+
+class Animator:
+
+    """
+        Streams the frames of an effect at `fps` frames per second from
+        its own thread. The frames have a deadline: when the device can not
+        keep up, the frames whose time has passed are dropped instead of
+        being queued, so the animation keeps its speed.
+
+        If `worker` (a Scheduler.DeviceWorker) is given, the frames are
+        written by it with the lowest priority, so any other command
+        interrupts them.
+    """
+
+    SPEED = 0xc800
+
+    def __init__(self, controller, effect, fps=20, worker=None):
+        self.controller = controller
+        self.effect = effect
+        self.worker = worker
+        self.fps = max(float(fps), 0.1)
+
+        computer = controller.driver.computer
+        self._regions = [(name, region.regionId)
+                         for name, region in computer.regions.items()]
+
+        self._thread = None
+        self._stop = threading.Event()
+        self._reset_stats()
+
+    def _reset_stats(self):
+        self.frames = 0
+        self.dropped = 0
+        self.skipped = 0
+        self.errors = 0
+        self._cpu = 0.0
+        self._last_colors = None
+        self._start = None
+        self._end = None
+
+    def start(self):
+        if self.is_running():
+            return
+
+        self._reset_stats()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='Animator')
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        """
+            Stop the animation and wait the end of the frame being written.
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def is_running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def _frame(self, t):
+        colors = self.effect.colors(t, len(self._regions))
+
+        area = {}
+        for (name, regionId), color in zip(self._regions, colors):
+            area[name] = (_Zone(regionId, 'fixed', color, color),)
+
+        return _Frame(self.SPEED, area)
+
+    def _write_frame(self, frame):
+        if self._stop.is_set():
+            return
+
+        # The lights are reset by the first frame, and after an error
+        try:
+            self.controller.Write_Theme(frame, self._last_colors is not None)
+            self._last_colors = frame.area
+        except TransactionCancelled:
+            self._last_colors = None
+            raise
+        except Exception:
+            self._last_colors = None
+            self.errors += 1
+            print(format_exc())
+
+    def _run(self):
+        period = 1 / self.fps
+        self._start = time()
+        cpu_start = _cpu_time()
+        number = 0
+
+        while not self._stop.is_set():
+            deadline = self._start + number * period
+            now = time()
+
+            # Drop the frames whose deadline passed while the last one was written
+            late = int((now - deadline) / period)
+            if late > 0:
+                self.dropped += late
+                number += late
+                deadline += late * period
+
+            if deadline > now:
+                if self._stop.wait(deadline - now):
+                    break
+
+            frame = self._frame(deadline - self._start)
+
+            if frame.area == self._last_colors:
+                self.skipped += 1
+            elif self.worker is None:
+                self._write_frame(frame)
+            else:
+                command = self.worker.submit(
+                    'frame', self._write_frame, frame, priority=PRIORITY_ANIMATION)
+
+                while not command.done.wait(min(period, 0.1)):
+                    if self._stop.is_set():
+                        break
+
+            self.frames += 1
+            number += 1
+            self._cpu = _cpu_time() - cpu_start
+
+        self._end = time()
+
+    def get_stats(self):
+        """
+            `cpu` is the CPU time used by the animation thread (computing and
+            encoding the frames) divided by the time that it has been running.
+        """
+        if self._start is None:
+            elapsed = 0
+        else:
+            elapsed = (self._end or time()) - self._start
+
+        return {'effect': type(self.effect).__name__.lower(),
+                'running': self.is_running(),
+                'target_fps': self.fps,
+                'fps': self.frames / elapsed if elapsed else 0.0,
+                'frames': self.frames,
+                'dropped': self.dropped,
+                'skipped': self.skipped,
+                'errors': self.errors,
+                'cpu': self._cpu / elapsed if elapsed else 0.0}
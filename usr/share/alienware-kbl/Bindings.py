@@ -49,6 +49,8 @@ class AlienwareKBL:
             'set_profile',
             'set_lights',
             'switch_lights',
+            'get_profile_index',
+            'get_profile_names',
                 'reload_configurations'):
             args = [self._user] + list(args)
 
@@ -119,45 +121,30 @@ class AlienwareKBL:
 
         return self._address
 
-    def get_profile_names(self):
+    def get_profile_index(self):
         """
-            Return a list of the existing profile names.
+            Return a list of dicts with the name, path, mtime, computer and
+            number of zones of each profile, as known by the daemon. Return
+            None if the daemon is off or it uses the profiles of another user.
         """
+        index = self._command('get_profile_index')
+        if isinstance(index, list):
+            return index
 
-        if not os.path.exists(self._paths.PROFILES_PATH):
-            return []
-
-        filenames = os.listdir(self._paths.PROFILES_PATH)
-        if len(filenames) == 0:
-            return []
-
-        names = []
-        for filename in filenames:
-            if filename.endswith('.cfg'):
-
-                with open(self._paths.PROFILES_PATH + filename, mode='rt', encoding='utf-8') as f:
-                    lines = f.readlines()
+        return None
 
-                for line in lines:
-                    variables = line.strip().split('=')
-                    if len(variables) == 2:
-                        var_name = variables[0]
-                        var_arg = variables[1]
-                        if var_name == 'name':
-                            if var_arg == '':
-                                name = os.path.basename(path)
-                            else:
-                                name = var_arg
-
-                            if name.endswith('.cfg'):
-                                name = name[:-4]
-
-                            names.append(name)
-                            break
+    def get_profile_names(self):
+        """
+            Return a list of the existing profile names.
+        """
+        names = self._command('get_profile_names')
+        if isinstance(names, list):
+            return names
 
-        names.sort()
+        return self._local_profile_names()
 
-        return names
+    def _local_profile_names(self):
+        return Configuration.READ_profile_names(self._paths.PROFILES_PATH)
 
     """
         Default Daemon Commands
@@ -175,6 +162,24 @@ class AlienwareKBL:
     def set_colors(self, mode, speed, colors1, colors2=None):
         return self._command('set_colors', mode, speed, colors1, colors2)
 
+    def start_animation(self, effect, fps=None, *args):
+        return self._command('start_animation', effect, fps, *args)
+
+    def stop_animation(self):
+        return self._command('stop_animation')
+
+    def get_animation_stats(self):
+        return self._command('get_animation_stats')
+
+    def get_queue_stats(self):
+        return self._command('get_queue_stats')
+
+    def get_session_state(self):
+        return self._command('get_session_state')
+
+    def get_stats(self, recent=0):
+        return self._command('get_stats', recent)
+
 
 if __name__ == '__main__':
 
@@ -18,6 +18,9 @@
 """
     To allow the compatibility with python2.7, `with open()` can not use
     encoding='utf-8'.  Anyways the default encoding is utf-8.
+
+    The file is only parsed again when its mtime, inode or size changed,
+    and it is written to a temporary file that is renamed over it.
 """
 
 try:
@@ -26,9 +29,11 @@ except:
     import configparser  # python3
 
 import os
+import tempfile
 import traceback
+from contextlib import contextmanager
 
-__version__ = '1.4.8~4'
+__version__ = '1.5.0'
 
 
 class CCParser(object):
@@ -46,6 +51,13 @@ class CCParser(object):
 
         self._config = configparser.ConfigParser()
 
+        # (mtime, inode, size) of the file when it was parsed
+        self._stamp = None
+
+        # number of nested `batch`, and if there are values to write
+        self._batch = 0
+        self._dirty = False
+
         if ini_path != '':
             self.set_configuration_path(ini_path)
 
@@ -79,28 +91,59 @@ CCParser instance:
             self.get_default_str()
             ))
 
-    def check_value(self, value):
+    def _file_stamp(self):
+        try:
+            stat = os.stat(self.ini_path)
+        except OSError:
+            return None
+
+        return stat.st_mtime, stat.st_ino, stat.st_size
+
+    def _read(self):
         """
-            return False if the value don't exists,
-            return True if the value exists
+            Parse the file if it changed since it was parsed. Return
+            False if it does not exist or it could not be parsed.
         """
-        if not os.path.exists(self.ini_path):
+        stamp = self._file_stamp()
+        if stamp is None:
+            self._config = configparser.ConfigParser()
+            self._stamp = None
             return False
-        else:
+
+        elif stamp != self._stamp:
+            config = configparser.ConfigParser()
+            self._config = config
+            self._stamp = stamp
+
             try:
-                self._config.read(self.ini_path)
+                config.read(self.ini_path)
             except Exception as e:
+                self._config = configparser.ConfigParser()
                 print("CCParser Warning: reading damaged file or file without section")
                 print(traceback.format_exc())
                 print()
                 return False
 
-            if not self._config.has_section(self._section):
-                return False
-            elif self._config.has_option(self._section, value):
-                return True
-            else:
-                return False
+        return True
+
+    def check_value(self, value):
+        """
+            return False if the value don't exists,
+            return True if the value exists
+        """
+        if self._batch > 0 and self._dirty:
+            config = self._config
+        elif not self._read():
+            return False
+        else:
+            config = self._config
+
+        if not config.has_section(self._section):
+            return False
+        elif config.has_option(self._section, value):
+            return True
+        else:
+            return False
 
     def get_bool(self, value):
         """
@@ -246,6 +289,8 @@ CCParser instance:
         """
             Set the path to the configuration file.
         """
+        self._stamp = None
+
         if isinstance(ini_path, str):
             self.ini_path = ini_path
             if not os.path.exists(ini_path) and self._debug:
@@ -302,37 +347,65 @@ CCParser instance:
             If the config file does not exists,
             or the directories to the path, they
             will be created.
+
+            Inside of `batch`, the values are only
+            written when the batch ends.
         """
 
         if self.ini_path != '' and isinstance(self.ini_path, str):
 
-            if not os.path.exists(os.path.dirname(self.ini_path)):
-                os.makedirs(os.path.dirname(self.ini_path))
+            if not self._dirty:
+                if not os.path.exists(self.ini_path):
+                    self._config = configparser.ConfigParser()
+                    self._stamp = None
 
-            if not os.path.exists(self.ini_path):
-                open(self.ini_path, 'wt').close()
-
-            try:
-                self._config.read(self.ini_path)
-            except Exception as e:
-                print("CCParser Warning: reading damaged file or file without section")
-                print(traceback.format_exc())
-                print()
-                return False
+                elif not self._read():
+                    return False
 
             if not self._config.has_section(self._section):
                 self._config.add_section(self._section)
 
             self._config.set(self._section, value_name, str(value))
+            self._dirty = True
 
-            with open(self.ini_path, 'w') as f:
-                self._config.write(f)
+            if self._batch == 0:
+                self._flush()
         else:
             print(
                 "CCParser Error: Trying to write the configuration without an ini path.")
             print("Configuration Path: " + str(self.get_configuration_path()))
             print()
 
+    @contextmanager
+    def batch(self):
+        """
+            Write all the values of the block at once:
+
+                with ccp.batch():
+                    ccp.write('a', 1)
+                    ccp.write('b', 2)
+        """
+        self._batch += 1
+        try:
+            yield self
+        finally:
+            self._batch -= 1
+            if self._batch == 0 and self._dirty:
+                self._flush()
+
+    def _flush(self):
+        directory = os.path.dirname(self.ini_path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+        try:
+            with write_atomic(self.ini_path) as f:
+                self._config.write(f)
+        finally:
+            self._dirty = False
+
+        self._stamp = self._file_stamp()
+
     def get_default_bool(self):
         return self._default_bool
 
@@ -351,6 +424,44 @@ CCParser instance:
     def get_configuration_path(self):
         return self.ini_path
 
+
+@contextmanager
+def write_atomic(path, **kwargs):
+    """
+        Open a temporary file next to `path` (with the `kwargs` of
+        os.fdopen) and rename it over `path` once it is written, so
+        `path` is never left half written. The file keeps the mode and
+        the owner that `path` had.
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        stat = None
+
+    fd, temp_path = tempfile.mkstemp(prefix='.', suffix='.tmp', dir=os.path.dirname(path) or '.')
+    try:
+        with os.fdopen(fd, 'w', **kwargs) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+
+        if stat is None:
+            os.chmod(temp_path, 0o644)
+        else:
+            if (stat.st_uid, stat.st_gid) != (os.getuid(), os.getgid()):
+                try:
+                    os.chown(temp_path, stat.st_uid, stat.st_gid)
+                except OSError:
+                    # Only root can give the file to another user
+                    pass
+            os.chmod(temp_path, stat.st_mode & 0o777)
+
+        os.rename(temp_path, path)
+    except:
+        os.remove(temp_path)
+        raise
+
+
 if __name__ == '__main__':
     """
         This is for testing purposes.
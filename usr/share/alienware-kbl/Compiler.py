@@ -0,0 +1,196 @@
+#!/usr/bin/python3
+#
+
+#  Copyright (C) 2026  Rafael Senties Martinelli <rafael@senties-martinelli.com>
+#
+#  This program is free software; you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License 3 as published by
+#   the Free Software Foundation.
+#
+#  This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+#   along with this program; if not, write to the Free Software Foundation,
+#   Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301  USA.
+
+"""
+    A theme is compiled to the packets that the controller must receive to
+    apply it. The daemon keeps the compiled themes so applying a theme that
+    was already applied only needs to send the bytes again.
+"""
+
+import os
+import hashlib
+from collections import OrderedDict
+from traceback import format_exc
+
+# Increase it if the compiled packets of a theme change,
+# so the themes persisted by an older version are ignored.
+COMPILER_VERSION = 3
+
+
+def theme_key(theme, computer):
+    """
+        Return the key of a theme in the cache, or None if the theme
+        has not been loaded from / saved to a file. The key is made of
+        the digest of the file, so it does not change when only the
+        mtime of the file does.
+    """
+    if getattr(theme, 'digest', None) is None:
+        return None
+
+    return (theme.digest, computer.name, theme.speed)
+
+
+def merge_blocks(blocks, computer):
+    """
+        Return `blocks`, the (area name, zones) of a theme like those of
+        `Controller.Write_Theme`, with the areas that have the same loop
+        merged in a single block. The region id of its zones is the OR of
+        the ids of the areas, so the controller receives one loop for all.
+
+        The power button, the areas with more zones than their `maxCommands`
+        and those that share bits of their id with another area (their
+        loops must be sent in order) are never merged. Two areas are not
+        merged either if the OR of their ids is also the id of a third area.
+    """
+    regions = computer.regions
+    shared = set(name for name, region in regions.items()
+                 for other_name, other in regions.items()
+                 if name != other_name and region.regionId & other.regionId)
+
+    def covered_by(mask):
+        return set(name for name, region in regions.items()
+                   if region.regionId & mask == region.regionId)
+
+    # [names, mask, loop], mask is None if the area is not merged
+    groups = []
+    by_loop = {}
+
+    for name, zones in blocks:
+        region = regions.get(name)
+        loop = tuple(zone[1:] for zone in zones)
+
+        if region is None or region.power_button or name in shared \
+                or zones == () or len(zones) > region.maxCommands:
+            groups.append([[name], None, zones])
+            continue
+
+        mask = zones[0][0]
+        for group in by_loop.get(loop, ()):
+            if covered_by(group[1] | mask) <= set(group[0] + [name]):
+                group[0].append(name)
+                group[1] |= mask
+                break
+        else:
+            group = [[name], mask, loop]
+            groups.append(group)
+            by_loop.setdefault(loop, []).append(group)
+
+    merged = []
+    for names, mask, loop in groups:
+        if mask is None:
+            merged.append((names[0], loop))
+        else:
+            merged.append(('+'.join(names), tuple((mask,) + step for step in loop)))
+
+    return merged
+
+
+class CompiledThemes:
+
+    """
+        LRU cache of the compiled themes. If `path` is given, the compiled
+        themes are also persisted in that directory.
+    """
+
+    def __init__(self, size=16, path=None):
+        self._themes = OrderedDict()
+        self._size = size
+        self._path = path
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, theme, computer, compile):
+        """
+            Return the packets of `theme`. If they are not cached
+            `compile()` is called, it must return a Constructor.
+        """
+        key = theme_key(theme, computer)
+
+        if key is None:
+            self.misses += 1
+            return bytes(compile().getbuffer())
+
+        if key in self._themes:
+            self.hits += 1
+            self._themes.move_to_end(key)
+            return self._themes[key]
+
+        data = self._load(key)
+        if data is None:
+            self.misses += 1
+            data = bytes(compile().getbuffer())
+            self._save(key, data)
+        else:
+            self.hits += 1
+
+        self._themes[key] = data
+        while len(self._themes) > self._size:
+            old_key, _ = self._themes.popitem(last=False)
+            self._remove(old_key)
+
+        return data
+
+    def clear(self):
+        for key in list(self._themes.keys()):
+            self._remove(key)
+
+        self._themes.clear()
+
+    def _filename(self, key):
+        name = repr((COMPILER_VERSION,) + key).encode('utf-8')
+        return os.path.join(self._path, hashlib.sha1(name).hexdigest())
+
+    def _load(self, key):
+        if self._path is None:
+            return None
+
+        try:
+            with open(self._filename(key), mode='rb') as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+        except Exception:
+            print(format_exc())
+            return None
+
+    def _save(self, key, data):
+        if self._path is None:
+            return
+
+        try:
+            if not os.path.exists(self._path):
+                os.makedirs(self._path)
+
+            filename = self._filename(key)
+            with open(filename + '.tmp', mode='wb') as f:
+                f.write(data)
+            os.replace(filename + '.tmp', filename)
+        except Exception:
+            print("Warning: It was not possible to persist a compiled theme.")
+            print(format_exc())
+
+    def _remove(self, key):
+        if self._path is None:
+            return
+
+        try:
+            os.remove(self._filename(key))
+        except FileNotFoundError:
+            pass
+        except Exception:
+            print(format_exc())
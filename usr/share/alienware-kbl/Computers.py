@@ -64,6 +64,7 @@ class PowerMode:
     def __init__(self, name, description, block):
         self.description = description
         self.name = name
+        self.block = block
 
 
 class Region:
@@ -179,1339 +180,222 @@ class CommonConf:
         self.BLOCK_BATT_CRITICAL = 0x09
 
 
-class M11XR1(CommonConf):
 
-    def __init__(self):
-        super().__init__()
-        self.name = TEXT_M11XR1
-
-        self.REGION_KEYBOARD = 0x0001
-        self.REGION_RIGHT_SPEAKER = 0x0020
-        self.REGION_LEFT_SPEAKER = 0x0040
-        self.REGION_ALIEN_NAME = 0x0100
-        self.REGION_MEDIA_BAR = 0x0800
-        self.REGION_POWER_BUTTON = 0x6000
-        self.REGION_ALL_BUT_POWER = 0x0f9fff
-
-        self.suportedMode['normal'] = PowerMode(
-            self.CodeAreaNames.ALIEN_FX_DEFAULT_POWER_MODE,
-            self.CodeAreaNames.ALIEN_FX_DEFAULT_POWER_MODE,
-            self.BLOCK_LOAD_ON_BOOT),
-        self.suportedMode['standby'] = PowerMode(
-            self.CodeAreaNames.STANDBY_ID,
-            TEXT_DESCRIPTION_STAND_BY,
-            self.BLOCK_STANDBY),
-        self.suportedMode['acPower'] = PowerMode(
-            self.CodeAreaNames.AC_POWER_ID,
-            TEXT_DESCRIPTION_AC_POWER,
-            self.BLOCK_AC_POWER),
-        self.suportedMode['charging'] = PowerMode(
-            self.CodeAreaNames.CHARGING_ID,
-            TEXT_DESCRIPTION_CHARGING,
-            self.BLOCK_CHARGING),
-        self.suportedMode['onBat'] = PowerMode(
-            self.CodeAreaNames.ON_BATTERY_ID,
-            TEXT_DESCRIPTION_ON_BATTERY,
-            self.BLOCK_BAT_POWER)
-
-        self.regions[
-            self.CodeAreaNames.KEYBOARD_ID] = Region(
-            self.CodeAreaNames.KEYBOARD_ID,
-            TEXT_DESCRIPTION_KEYBOARD,
-            self.REGION_KEYBOARD,
-            self.SUPPORTED_COMMANDS,
-            True,
-            True,
-            True,
-            self.default_color,
-            self.suportedMode)
-        self.regions[
-            self.CodeAreaNames.RIGHT_SPEAKER_ID] = Region(
-            self.CodeAreaNames.RIGHT_SPEAKER_ID,
-            TEXT_DESCRIPTION_RIGHT_SPEAKER,
-            self.REGION_RIGHT_SPEAKER,
-            self.SUPPORTED_COMMANDS,
-            True,
-            True,
-            True,
-            self.default_color,
-            self.suportedMode)
-        self.regions[
-            self.CodeAreaNames.LEFT_SPEAKER_ID] = Region(
-            self.CodeAreaNames.LEFT_SPEAKER_ID,
-            TEXT_DESCRIPTION_LEFT_SPEAKER,
-            self.REGION_LEFT_SPEAKER,
-            self.SUPPORTED_COMMANDS,
-            True,
-            True,
-            True,
-            self.default_color,
-            self.suportedMode)
-        self.regions[
-            self.CodeAreaNames.ALIEN_LOGO_ID] = Region(
-            self.CodeAreaNames.ALIEN_LOGO_ID,
-            TEXT_DESCRIPTION_ALIENWARE_LOGO,
-            self.REGION_ALIEN_NAME,
-            self.SUPPORTED_COMMANDS,
-            True,
-            True,
-            True,
-            self.default_color,
-            self.suportedMode)
-        self.regions[
-            self.CodeAreaNames.MEDIA_BAR_ID] = Region(
-            self.CodeAreaNames.MEDIA_BAR_ID,
-            TEXT_DESCRIPTION_MEDIA_BAR,
-            self.REGION_MEDIA_BAR,
-            self.SUPPORTED_COMMANDS,
-            True,
-            True,
-            True,
-            self.default_color,
-            self.suportedMode)
-        self.regions[
-            self.CodeAreaNames.POWER_BUTTON_ID] = Region(
-            self.CodeAreaNames.POWER_BUTTON_ID,
-            TEXT_DESCRIPTION_POWER_BUTTON,
-            self.REGION_POWER_BUTTON,
-            2,
-            False,
-            True,
-            False,
-            self.default_color,
-            self.suportedMode,
-            power_button=True)
-
-
-class M11XR2(M11XR1):
-
-    def __init__(self):
-        super().__init__()
-        self.name = TEXT_M11XR2
-
-
-class M11XR3(M11XR1):
-
-    def __init__(self):
-        super().__init__()
-        self.name = TEXT_M11XR3
-
-
-class M11XR25(M11XR1):
-
-    def __init__(self):
-        super().__init__()
-        self.name = TEXT_M11XR25
-
-
-class M14XR1(CommonConf):
-
-    def __init__(self):
-        super().__init__()
-        self.name = TEXT_M14XR1
-
-        self.REGION_RIGHT_KEYBOARD = 0x0008
-        self.REGION_RIGHT_CENTER_KEYBOARD = 0x0004
-        self.REGION_LEFT_KEYBOARD = 0x0001
-        self.REGION_LEFT_CENTER_KEYBOARD = 0x0002
-        self.REGION_RIGHT_SPEAKER = 0x0040
-        self.REGION_LEFT_SPEAKER = 0x0020
-        self.REGION_ALIEN_HEAD = 0x0080
-        self.REGION_ALIEN_NAME = 0x0100
-        self.REGION_TOUCH_PAD = 0x0200
-        self.REGION_MEDIA_BAR = 0x1c00
-        self.REGION_POWER_BUTTON = 0x2000
-        self.REGION_POWER_BUTTON_EYES = 0x4000
-        self.REGION_ALL_BUT_POWER = 0x0f9fff
-
-        self.suportedMode['normal'] = PowerMode(
-            self.CodeAreaNames.ALIEN_FX_DEFAULT_POWER_MODE,
-            self.CodeAreaNames.ALIEN_FX_DEFAULT_POWER_MODE,
-            self.BLOCK_LOAD_ON_BOOT)
-        self.suportedMode['standby'] = PowerMode(
-            self.CodeAreaNames.STANDBY_ID,
-            TEXT_DESCRIPTION_STAND_BY,
-            self.BLOCK_STANDBY)
-        self.suportedMode['acPower'] = PowerMode(
-            self.CodeAreaNames.AC_POWER_ID,
-            TEXT_DESCRIPTION_AC_POWER,
-            self.BLOCK_AC_POWER)
-        self.suportedMode['charging'] = PowerMode(
-            self.CodeAreaNames.CHARGING_ID,
-            TEXT_DESCRIPTION_CHARGING,
-            self.BLOCK_CHARGING)
-        self.suportedMode['onBat'] = PowerMode(
-            self.CodeAreaNames.ON_BATTERY_ID,
-            TEXT_DESCRIPTION_ON_BATTERY,
-            self.BLOCK_BAT_POWER)
-
-        self.regions[
-            self.CodeAreaNames.RIGHT_KEYBOARD_ID] = Region(
-            self.CodeAreaNames.RIGHT_KEYBOARD_ID,
-            TEXT_DESCRIPTION_RIGHT_KEYBOARD,
-            self.REGION_RIGHT_KEYBOARD,
-            self.SUPPORTED_COMMANDS,
-            True,
-            True,
-            True,
-            self.default_color,
-            self.suportedMode)
-        self.regions[
-            self.CodeAreaNames.RIGHT_CENTER_KEYBOARD_ID] = Region(
-            self.CodeAreaNames.RIGHT_CENTER_KEYBOARD_ID,
-            TEXT_DESCRIPTION_RIGHT_CENTER_KEYBOARD,
-            self.REGION_RIGHT_CENTER_KEYBOARD,
-            self.SUPPORTED_COMMANDS,
-            True,
-            True,
-            True,
-            self.default_color,
-            self.suportedMode)
-        self.regions[
-            self.CodeAreaNames.LEFT_KEYBOARD_ID] = Region(
-            self.CodeAreaNames.LEFT_KEYBOARD_ID,
-            TEXT_DESCRIPTION_LEFT_KEYBOARD,
-            self.REGION_LEFT_KEYBOARD,
-            self.SUPPORTED_COMMANDS,
-            True,
-            True,
-            True,
-            self.default_color,
-            self.suportedMode)
-        self.regions[
-            self.CodeAreaNames.LEFT_CENTER_KEYBOARD_ID] = Region(
-            self.CodeAreaNames.LEFT_CENTER_KEYBOARD_ID,
-            TEXT_DESCRIPTION_LEFT_CENTER_KEYBOARD,
-            self.REGION_LEFT_CENTER_KEYBOARD,
-            self.SUPPORTED_COMMANDS,
-            True,
-            True,
-            True,
-            self.default_color,
-            self.suportedMode)
-        self.regions[
-            self.CodeAreaNames.RIGHT_SPEAKER_ID] = Region(
-            self.CodeAreaNames.RIGHT_SPEAKER_ID,
-            TEXT_DESCRIPTION_RIGHT_SPEAKER,
-            self.REGION_RIGHT_SPEAKER,
-            self.SUPPORTED_COMMANDS,
-            True,
-            True,
-            True,
-            self.default_color,
-            self.suportedMode)
-        self.regions[
-            self.CodeAreaNames.LEFT_SPEAKER_ID] = Region(
-            self.CodeAreaNames.LEFT_SPEAKER_ID,
-            TEXT_DESCRIPTION_LEFT_SPEAKER,
-            self.REGION_LEFT_SPEAKER,
-            self.SUPPORTED_COMMANDS,
-            True,
-            True,
-            True,
-            self.default_color,
-            self.suportedMode)
-        self.regions[
-            self.CodeAreaNames.ALIEN_HEAD_ID] = Region(
-            self.CodeAreaNames.ALIEN_HEAD_ID,
-            TEXT_DESCRIPTION_ALIENWARE_HEAD,
-            self.REGION_ALIEN_HEAD,
-            self.SUPPORTED_COMMANDS,
-            True,
-            True,
-            True,
-            self.default_color,
-            self.suportedMode)
-        self.regions[
-            self.CodeAreaNames.ALIEN_LOGO_ID] = Region(
-            self.CodeAreaNames.ALIEN_LOGO_ID,
-            TEXT_DESCRIPTION_ALIENWARE_LOGO,
-            self.REGION_ALIEN_NAME,
-            self.SUPPORTED_COMMANDS,
-            True,
-            True,
-            True,
-            self.default_color,
-            self.suportedMode)
-        self.regions[
-            self.CodeAreaNames.TOUCH_PAD_ID] = Region(
-            self.CodeAreaNames.TOUCH_PAD_ID,
-            TEXT_DESCRIPTION_TOUCHPAD,
-            self.REGION_TOUCH_PAD,
-            self.SUPPORTED_COMMANDS,
-            True,
-            True,
-            True,
-            self.default_color,
-            self.suportedMode)
-        self.regions[
-            self.CodeAreaNames.MEDIA_BAR_ID] = Region(
-            self.CodeAreaNames.MEDIA_BAR_ID,
-            TEXT_DESCRIPTION_MEDIA_BAR,
-            self.REGION_MEDIA_BAR,
-            self.SUPPORTED_COMMANDS,
-            True,
-            True,
-            True,
-            self.default_color,
-            self.suportedMode)
-        self.regions[
-            self.CodeAreaNames.POWER_BUTTON_EYES_ID] = Region(
-            self.CodeAreaNames.POWER_BUTTON_EYES_ID,
-            TEXT_DESCRIPTION_ALIENWARE_POWERBUTTON_EYES,
-            self.REGION_POWER_BUTTON_EYES,
-            1,
-            False,
-            False,
-            True,
-            self.default_color,
-            self.suportedMode)
-        self.regions[
-            self.CodeAreaNames.POWER_BUTTON_ID] = Region(
-            self.CodeAreaNames.POWER_BUTTON_ID,
-            TEXT_DESCRIPTION_POWER_BUTTON,
-            self.REGION_POWER_BUTTON,
-            2,
-            True,
-            True,
-            True,
-            self.default_color,
-            self.suportedMode,
-            power_button=True)
-
-
-class Alienware13(CommonConf):
-
-    def __init__(self):
-        super().__init__()
-        self.name = TEXT_ALIENWARE13
-
-        self.REGION_RIGHT_KEYBOARD = 0x0001  # 0x200 seems to work too
-        self.REGION_LEFT_KEYBOARD = 0x0008
-        self.REGION_LEFT_CENTER_KEYBOARD = 0x0004
-        self.REGION_RIGHT_CENTER_KEYBOARD = 0x100
-        self.REGION_ALIEN_NAME = 0x0040
-        self.REGION_ALIEN_HEAD = 0x0100
-        self.REGION_OUTER_LID = 0x0020  # to test the modes morph, blink, etc
-        self.REGION_ALL_BUT_POWER = 0x0f9fff  # does this work?
-        self.REGION_HARD_DISK_DRIVE = 0x0200
-        self.REGION_CAPS_LOCK = 0x80
-
-        self.suportedMode['normal'] = PowerMode(
-            self.CodeAreaNames.ALIEN_FX_DEFAULT_POWER_MODE,
-            self.CodeAreaNames.ALIEN_FX_DEFAULT_POWER_MODE,
-            self.BLOCK_LOAD_ON_BOOT)
-        self.suportedMode['standby'] = PowerMode(
-            self.CodeAreaNames.STANDBY_ID,
-            TEXT_DESCRIPTION_STAND_BY,
-            self.BLOCK_STANDBY)
-        self.suportedMode['acPower'] = PowerMode(
-            self.CodeAreaNames.AC_POWER_ID,
-            TEXT_DESCRIPTION_AC_POWER,
-            self.BLOCK_AC_POWER)
-        self.suportedMode['charging'] = PowerMode(
-            self.CodeAreaNames.CHARGING_ID,
-            TEXT_DESCRIPTION_CHARGING,
-            self.BLOCK_CHARGING)
-        self.suportedMode['onBat'] = PowerMode(
-            self.CodeAreaNames.ON_BATTERY_ID,
-            TEXT_DESCRIPTION_ON_BATTERY,
-            self.BLOCK_BAT_POWER)
-
-        self.regions[
-            self.CodeAreaNames.HARD_DISK_DRIVE_ID] = Region(
-            self.CodeAreaNames.HARD_DISK_DRIVE_ID,
-            TEXT_DESCRIPTION_HDD,
-            self.REGION_HARD_DISK_DRIVE,
-            self.SUPPORTED_COMMANDS,
-            True,
-            True,
-            True,
-            self.default_color,
-            self.suportedMode)
-        self.regions[
-            self.CodeAreaNames.RIGHT_CENTER_KEYBOARD_ID] = Region(
-            self.CodeAreaNames.RIGHT_CENTER_KEYBOARD_ID,
-            TEXT_DESCRIPTION_RIGHT_CENTER_KEYBOARD,
-            self.REGION_RIGHT_CENTER_KEYBOARD,
-            self.SUPPORTED_COMMANDS,
-            True,
-            True,
-            True,
-            self.default_color,
-            self.suportedMode)
-        self.regions[
-            self.CodeAreaNames.CAPS_LOCK_ID] = Region(
-            self.CodeAreaNames.CAPS_LOCK_ID,
-            TEXT_DESCRIPTION_CAPS_LOCK,
-            self.REGION_CAPS_LOCK,
-            self.SUPPORTED_COMMANDS,
-            True,
-            True,
-            True,
-            self.default_color,
-            self.suportedMode)
-        self.regions[
-            self.CodeAreaNames.RIGHT_KEYBOARD_ID] = Region(
-            self.CodeAreaNames.RIGHT_KEYBOARD_ID,
-            TEXT_DESCRIPTION_RIGHT_KEYBOARD,
-            self.REGION_RIGHT_KEYBOARD,
-            self.SUPPORTED_COMMANDS,
-            True,
-            True,
-            True,
-            self.default_color,
-            self.suportedMode)
-        self.regions[
-            self.CodeAreaNames.RIGHT_CENTER_KEYBOARD_ID] = Region(
-            self.CodeAreaNames.RIGHT_CENTER_KEYBOARD_ID,
-            TEXT_DESCRIPTION_RIGHT_CENTER_KEYBOARD,
-            self.REGION_RIGHT_CENTER_KEYBOARD,
-            self.SUPPORTED_COMMANDS,
-            True,
-            True,
-            True,
-            self.default_color,
-            self.suportedMode)
-        self.regions[
-            self.CodeAreaNames.LEFT_KEYBOARD_ID] = Region(
-            self.CodeAreaNames.LEFT_KEYBOARD_ID,
-            TEXT_DESCRIPTION_LEFT_KEYBOARD,
-            self.REGION_LEFT_KEYBOARD,
-            self.SUPPORTED_COMMANDS,
-            True,
-            True,
-            True,
-            self.default_color,
-            self.suportedMode)
-        self.regions[
-            self.CodeAreaNames.LEFT_CENTER_KEYBOARD_ID] = Region(
-            self.CodeAreaNames.LEFT_CENTER_KEYBOARD_ID,
-            TEXT_DESCRIPTION_LEFT_CENTER_KEYBOARD,
-            self.REGION_LEFT_CENTER_KEYBOARD,
-            self.SUPPORTED_COMMANDS,
-            True,
-            True,
-            True,
-            self.default_color,
-            self.suportedMode)
-        self.regions[
-            self.CodeAreaNames.ALIEN_HEAD_ID] = Region(
-            self.CodeAreaNames.ALIEN_HEAD_ID,
-            TEXT_DESCRIPTION_ALIENWARE_HEAD,
-            self.REGION_ALIEN_HEAD,
-            self.SUPPORTED_COMMANDS,
-            True,
-            True,
-            True,
-            self.default_color,
-            self.suportedMode)
-        self.regions[
-            self.CodeAreaNames.ALIEN_LOGO_ID] = Region(
-            self.CodeAreaNames.ALIEN_LOGO_ID,
-            TEXT_DESCRIPTION_ALIENWARE_LOGO,
-            self.REGION_ALIEN_NAME,
-            self.SUPPORTED_COMMANDS,
-            True,
-            True,
-            True,
-            self.default_color,
-            self.suportedMode)
-        self.regions[
-            self.CodeAreaNames.ALIEN_OUTER_LID_ID] = Region(
-            self.CodeAreaNames.ALIEN_OUTER_LID_ID,
-            TEXT_DESCRIPTION_OUTER_LID,
-            self.REGION_OUTER_LID,
-            self.SUPPORTED_COMMANDS,
-            True,
-            True,
-            True,
-            self.default_color,
-            self.suportedMode)
-
-
-class Alienware13R3(Alienware13):
-
-    def __init__(self):
-        super().__init__()
-        self.name = TEXT_ALIENWARE13R3
+# The area ids, like `_ID.KEYBOARD_ID`
+_ID = CodeAreaNames()
+
+# The power modes of every computer:
+# key: (name, description, block)
+_POWER_MODES = (
+    ('normal', (_ID.ALIEN_FX_DEFAULT_POWER_MODE, _ID.ALIEN_FX_DEFAULT_POWER_MODE, 'BLOCK_LOAD_ON_BOOT')),
+    ('standby', (_ID.STANDBY_ID, TEXT_DESCRIPTION_STAND_BY, 'BLOCK_STANDBY')),
+    ('acPower', (_ID.AC_POWER_ID, TEXT_DESCRIPTION_AC_POWER, 'BLOCK_AC_POWER')),
+    ('charging', (_ID.CHARGING_ID, TEXT_DESCRIPTION_CHARGING, 'BLOCK_CHARGING')),
+    ('onBat', (_ID.ON_BATTERY_ID, TEXT_DESCRIPTION_ON_BATTERY, 'BLOCK_BAT_POWER')),
+)
+
+# The regions of each family of computers, in the order that they are shown:
+# (area id, description, regionId, maxCommands, canBlink, canMorph, canLight, power_button)
+REGIONS = {
+    'M11X': (
+        (_ID.KEYBOARD_ID, TEXT_DESCRIPTION_KEYBOARD, 0x0001, 15, True, True, True, False),
+        (_ID.RIGHT_SPEAKER_ID, TEXT_DESCRIPTION_RIGHT_SPEAKER, 0x0020, 15, True, True, True, False),
+        (_ID.LEFT_SPEAKER_ID, TEXT_DESCRIPTION_LEFT_SPEAKER, 0x0040, 15, True, True, True, False),
+        (_ID.ALIEN_LOGO_ID, TEXT_DESCRIPTION_ALIENWARE_LOGO, 0x0100, 15, True, True, True, False),
+        (_ID.MEDIA_BAR_ID, TEXT_DESCRIPTION_MEDIA_BAR, 0x0800, 15, True, True, True, False),
+        (_ID.POWER_BUTTON_ID, TEXT_DESCRIPTION_POWER_BUTTON, 0x6000, 2, False, True, False, True),
+    ),
+    'Alienware13': (
+        (_ID.HARD_DISK_DRIVE_ID, TEXT_DESCRIPTION_HDD, 0x0200, 15, True, True, True, False),
+        (_ID.RIGHT_CENTER_KEYBOARD_ID, TEXT_DESCRIPTION_RIGHT_CENTER_KEYBOARD, 0x0100, 15, True, True, True, False),
+        (_ID.CAPS_LOCK_ID, TEXT_DESCRIPTION_CAPS_LOCK, 0x0080, 15, True, True, True, False),
+        (_ID.RIGHT_KEYBOARD_ID, TEXT_DESCRIPTION_RIGHT_KEYBOARD, 0x0001, 15, True, True, True, False),
+        (_ID.LEFT_KEYBOARD_ID, TEXT_DESCRIPTION_LEFT_KEYBOARD, 0x0008, 15, True, True, True, False),
+        (_ID.LEFT_CENTER_KEYBOARD_ID, TEXT_DESCRIPTION_LEFT_CENTER_KEYBOARD, 0x0004, 15, True, True, True, False),
+        (_ID.ALIEN_HEAD_ID, TEXT_DESCRIPTION_ALIENWARE_HEAD, 0x0100, 15, True, True, True, False),
+        (_ID.ALIEN_LOGO_ID, TEXT_DESCRIPTION_ALIENWARE_LOGO, 0x0040, 15, True, True, True, False),
+        (_ID.ALIEN_OUTER_LID_ID, TEXT_DESCRIPTION_OUTER_LID, 0x0020, 15, True, True, True, False),
+    ),
+    'M14X': (
+        (_ID.RIGHT_KEYBOARD_ID, TEXT_DESCRIPTION_RIGHT_KEYBOARD, 0x0008, 15, True, True, True, False),
+        (_ID.RIGHT_CENTER_KEYBOARD_ID, TEXT_DESCRIPTION_RIGHT_CENTER_KEYBOARD, 0x0004, 15, True, True, True, False),
+        (_ID.LEFT_KEYBOARD_ID, TEXT_DESCRIPTION_LEFT_KEYBOARD, 0x0001, 15, True, True, True, False),
+        (_ID.LEFT_CENTER_KEYBOARD_ID, TEXT_DESCRIPTION_LEFT_CENTER_KEYBOARD, 0x0002, 15, True, True, True, False),
+        (_ID.RIGHT_SPEAKER_ID, TEXT_DESCRIPTION_RIGHT_SPEAKER, 0x0040, 15, True, True, True, False),
+        (_ID.LEFT_SPEAKER_ID, TEXT_DESCRIPTION_LEFT_SPEAKER, 0x0020, 15, True, True, True, False),
+        (_ID.ALIEN_HEAD_ID, TEXT_DESCRIPTION_ALIENWARE_HEAD, 0x0080, 15, True, True, True, False),
+        (_ID.ALIEN_LOGO_ID, TEXT_DESCRIPTION_ALIENWARE_LOGO, 0x0100, 15, True, True, True, False),
+        (_ID.TOUCH_PAD_ID, TEXT_DESCRIPTION_TOUCHPAD, 0x0200, 15, True, True, True, False),
+        (_ID.MEDIA_BAR_ID, TEXT_DESCRIPTION_MEDIA_BAR, 0x1c00, 15, True, True, True, False),
+        (_ID.POWER_BUTTON_EYES_ID, TEXT_DESCRIPTION_ALIENWARE_POWERBUTTON_EYES, 0x4000, 1, False, False, True, False),
+        (_ID.POWER_BUTTON_ID, TEXT_DESCRIPTION_POWER_BUTTON, 0x2000, 2, True, True, True, True),
+    ),
+    'M15XArea51': (
+        (_ID.LIGHT_PIPE_ID, TEXT_DESCRIPTION_LIGHT_PIPE, 0x0020, 15, True, True, True, False),
+        (_ID.KEYBOARD_ID, TEXT_DESCRIPTION_KEYBOARD, 0x0400, 15, True, True, True, False),
+        (_ID.ALIEN_HEAD_ID, TEXT_DESCRIPTION_ALIENWARE_HEAD, 0x0100, 15, True, True, True, False),
+        (_ID.ALIEN_LOGO_ID, TEXT_DESCRIPTION_ALIENWARE_LOGO, 0x0080, 15, True, True, True, False),
+        (_ID.TOUCH_PAD_ID, TEXT_DESCRIPTION_TOUCHPAD, 0x0001, 15, True, True, True, False),
+        (_ID.MEDIA_BAR_ID, TEXT_DESCRIPTION_MEDIA_BAR, 0x10000, 15, True, True, True, False),
+        (_ID.POWER_BUTTON_ID, TEXT_DESCRIPTION_POWER_BUTTON, 0x8000, 1, False, False, True, True),
+    ),
+    'Alienware15': (
+        (_ID.TACTX_ID, TEXT_DESCRIPTION_TACTX, 0x2000, 15, True, True, True, False),
+        (_ID.RIGHT_KEYBOARD_ID, TEXT_DESCRIPTION_RIGHT_KEYBOARD, 0x0001, 15, True, True, True, False),
+        (_ID.RIGHT_CENTER_KEYBOARD_ID, TEXT_DESCRIPTION_RIGHT_CENTER_KEYBOARD, 0x0002, 15, True, True, True, False),
+        (_ID.LEFT_KEYBOARD_ID, TEXT_DESCRIPTION_LEFT_KEYBOARD, 0x0008, 15, True, True, True, False),
+        (_ID.LEFT_CENTER_KEYBOARD_ID, TEXT_DESCRIPTION_LEFT_CENTER_KEYBOARD, 0x0004, 15, True, True, True, False),
+        (_ID.RIGHT_SPEAKER_ID, TEXT_DESCRIPTION_RIGHT_SPEAKER, 0x1000, 15, True, True, True, False),
+        (_ID.LEFT_SPEAKER_ID, TEXT_DESCRIPTION_LEFT_SPEAKER, 0x0800, 15, True, True, True, False),
+        (_ID.ALIEN_HEAD_ID, TEXT_DESCRIPTION_ALIENWARE_HEAD, 0x0020, 15, True, True, True, False),
+        (_ID.ALIEN_LOGO_ID, TEXT_DESCRIPTION_ALIENWARE_LOGO, 0x0040, 15, True, True, True, False),
+        (_ID.TOUCH_PAD_ID, TEXT_DESCRIPTION_TOUCHPAD, 0x0400, 15, True, True, True, False),
+        (_ID.MEDIA_BAR_ID, TEXT_DESCRIPTION_MEDIA_BAR, 0x0080, 15, True, True, True, False),
+        (_ID.POWER_BUTTON_EYES_ID, TEXT_DESCRIPTION_ALIENWARE_POWERBUTTON_EYES, 0x4000, 1, False, False, True, False),
+        (_ID.POWER_BUTTON_ID, TEXT_DESCRIPTION_POWER_BUTTON, 0x0100, 2, True, True, True, True),
+    ),
+    'M17X': (
+        (_ID.RIGHT_KEYBOARD_ID, TEXT_DESCRIPTION_RIGHT_KEYBOARD, 0x0008, 15, True, True, True, False),
+        (_ID.RIGHT_CENTER_KEYBOARD_ID, TEXT_DESCRIPTION_RIGHT_CENTER_KEYBOARD, 0x0002, 15, True, True, True, False),
+        (_ID.LEFT_KEYBOARD_ID, TEXT_DESCRIPTION_LEFT_KEYBOARD, 0x0001, 15, True, True, True, False),
+        (_ID.LEFT_CENTER_KEYBOARD_ID, TEXT_DESCRIPTION_LEFT_CENTER_KEYBOARD, 0x0004, 15, True, True, True, False),
+        (_ID.RIGHT_SPEAKER_ID, TEXT_DESCRIPTION_RIGHT_SPEAKER, 0x0040, 15, True, True, True, False),
+        (_ID.LEFT_SPEAKER_ID, TEXT_DESCRIPTION_LEFT_SPEAKER, 0x0020, 15, True, True, True, False),
+        (_ID.ALIEN_HEAD_ID, TEXT_DESCRIPTION_ALIENWARE_HEAD, 0x0080, 15, True, True, True, False),
+        (_ID.ALIEN_LOGO_ID, TEXT_DESCRIPTION_ALIENWARE_LOGO, 0x0100, 15, True, True, True, False),
+        (_ID.TOUCH_PAD_ID, TEXT_DESCRIPTION_TOUCHPAD, 0x0200, 15, True, True, True, False),
+        (_ID.MEDIA_BAR_ID, TEXT_DESCRIPTION_MEDIA_BAR, 0x1c00, 15, True, True, True, False),
+        (_ID.POWER_BUTTON_EYES_ID, TEXT_DESCRIPTION_ALIENWARE_POWERBUTTON_EYES, 0x4000, 1, False, False, True, False),
+        (_ID.POWER_BUTTON_ID, TEXT_DESCRIPTION_POWER_BUTTON, 0x2000, 2, True, True, True, True),
+    ),
+    'M17XR2': (
+        (_ID.RIGHT_KEYBOARD_ID, TEXT_DESCRIPTION_RIGHT_KEYBOARD, 0x0001, 15, True, True, True, False),
+        (_ID.RIGHT_CENTER_KEYBOARD_ID, TEXT_DESCRIPTION_RIGHT_CENTER_KEYBOARD, 0x0002, 15, True, True, True, False),
+        (_ID.LEFT_KEYBOARD_ID, TEXT_DESCRIPTION_LEFT_KEYBOARD, 0x0004, 15, True, True, True, False),
+        (_ID.LEFT_CENTER_KEYBOARD_ID, TEXT_DESCRIPTION_LEFT_CENTER_KEYBOARD, 0x0008, 15, True, True, True, False),
+        (_ID.RIGHT_SPEAKER_ID, TEXT_DESCRIPTION_RIGHT_SPEAKER, 0x0020, 15, True, True, True, False),
+        (_ID.LEFT_SPEAKER_ID, TEXT_DESCRIPTION_LEFT_SPEAKER, 0x0040, 15, True, True, True, False),
+        (_ID.ALIEN_HEAD_ID, TEXT_DESCRIPTION_ALIENWARE_HEAD, 0x0080, 15, True, True, True, False),
+        (_ID.ALIEN_LOGO_ID, TEXT_DESCRIPTION_ALIENWARE_LOGO, 0x0100, 15, True, True, True, False),
+        (_ID.TOUCH_PAD_ID, TEXT_DESCRIPTION_TOUCHPAD, 0x0200, 15, True, True, True, False),
+        (_ID.MEDIA_BAR_ID, TEXT_DESCRIPTION_MEDIA_BAR, 0x1c00, 15, True, True, True, False),
+        (_ID.POWER_BUTTON_EYES_ID, TEXT_DESCRIPTION_ALIENWARE_POWERBUTTON_EYES, 0x4000, 1, False, False, True, False),
+        (_ID.POWER_BUTTON_ID, TEXT_DESCRIPTION_POWER_BUTTON, 0x2000, 2, True, True, True, True),
+    ),
+    'M18X': (
+        (_ID.RIGHT_KEYBOARD_ID, TEXT_DESCRIPTION_RIGHT_KEYBOARD, 0x0001, 15, True, True, True, False),
+        (_ID.RIGHT_CENTER_KEYBOARD_ID, TEXT_DESCRIPTION_RIGHT_CENTER_KEYBOARD, 0x0002, 15, True, True, True, False),
+        (_ID.LEFT_KEYBOARD_ID, TEXT_DESCRIPTION_LEFT_KEYBOARD, 0x0008, 15, True, True, True, False),
+        (_ID.LEFT_CENTER_KEYBOARD_ID, TEXT_DESCRIPTION_LEFT_CENTER_KEYBOARD, 0x0004, 15, True, True, True, False),
+        (_ID.RIGHT_SPEAKER_ID, TEXT_DESCRIPTION_RIGHT_SPEAKER, 0x0020, 15, True, True, True, False),
+        (_ID.LEFT_SPEAKER_ID, TEXT_DESCRIPTION_LEFT_SPEAKER, 0x0040, 15, True, True, True, False),
+        (_ID.ALIEN_HEAD_ID, TEXT_DESCRIPTION_ALIENWARE_HEAD, 0x0080, 15, True, True, True, False),
+        (_ID.ALIEN_LOGO_ID, TEXT_DESCRIPTION_ALIENWARE_LOGO, 0x0100, 15, True, True, True, False),
+        (_ID.TOUCH_PAD_ID, TEXT_DESCRIPTION_TOUCHPAD, 0x0200, 15, True, True, True, False),
+        (_ID.MEDIA_BAR_ID, TEXT_DESCRIPTION_MEDIA_BAR, 0x1c00, 15, True, True, True, False),
+        (_ID.POWER_BUTTON_EYES_ID, TEXT_DESCRIPTION_ALIENWARE_POWERBUTTON_EYES, 0x4000, 1, False, False, True, False),
+        (_ID.POWER_BUTTON_ID, TEXT_DESCRIPTION_POWER_BUTTON, 0x2000, 2, True, True, True, True),
+    ),
+}
 
+#
+# If you add a new computer please send me an email/open a bug repport so I can add it to the main program too.
+# The names are taken from wikipedia:  https://en.wikipedia.org/wiki/Alienware
+#
+# name: (id vendor, id product, family of REGIONS, parent model)
+#
+MODELS = {
+    TEXT_M11XR1: (0x187c, 0x0514, 'M11X', None),
+    TEXT_M11XR2: (0x187c, 0x0515, 'M11X', TEXT_M11XR1),
+    TEXT_M11XR3: (0x187c, 0x0522, 'M11X', TEXT_M11XR1),
+    TEXT_M11XR25: (0x187c, 0x0516, 'M11X', TEXT_M11XR1),
+    TEXT_ALIENWARE13: (0x187c, 0x0527, 'Alienware13', None),
+    TEXT_ALIENWARE13R3: (0x187c, 0x0529, 'Alienware13', TEXT_ALIENWARE13),
 
-class M14XR2(M14XR1):
+    # M14XR2 is differenciated from M14XR1 by reading
+    # the device information. > Gaming' take a look to Engine.py
+    TEXT_M14XR1: (0x187c, 0x0521, 'M14X', None),
+    TEXT_M14XR2: (0x187c, 0x0521, 'M14X', TEXT_M14XR1),
+    TEXT_M14XR3: (0x187c, 0x0525, 'M14X', TEXT_M14XR1),
 
-    def __init__(self):
-        super().__init__()
-        self.name = TEXT_M14XR2
+    TEXT_M15XAREA51: (0x187c, 0x0511, 'M15XArea51', None),
+    TEXT_ALIENWARE15: (0x187c, 0x0528, 'Alienware15', None),
+    TEXT_ALIENWARE15R3: (0x187c, 0x0530, 'Alienware15', TEXT_ALIENWARE15),
 
+    TEXT_M17X: (0x187c, 0x0524, 'M17X', None),
+    TEXT_M17XR2: (0x187c, 0x0512, 'M17XR2', None),
+    TEXT_M17XR3: (0x187c, 0x0520, 'M17X', TEXT_M17X),
 
-class M14XR3(M14XR1):
+    TEXT_M18XR2: (0x187c, 0x0518, 'M18X', None),
+    TEXT_M18XRX: (0x187c, 0x0523, 'M18X', TEXT_M18XR2),
+}
 
-    def __init__(self):
-        super().__init__()
-        self.name = TEXT_M14XR3
 
+class Model(CommonConf):
 
-class M15XArea51(CommonConf):
+    """
+        A computer built from its row of MODELS and the
+        regions of its family. `MODEL` is the name of the row.
+    """
 
-    def __init__(self):
-        super().__init__()
-        self.name = TEXT_M15XAREA51
-
-        self.REGION_TOUCH_PAD = 0x000001
-        self.REGION_LIGHTPIPE = 0x000020
-        self.REGION_ALIEN_LOGO = 0x000080
-        self.REGION_ALIEN_HEAD = 0x000100
-        self.REGION_KEY_BOARD = 0x000400
-        self.REGION_TOUCH_PANEL = 0x010000
-        self.REGION_POWER_BUTTON = 0x008000
-        self.REGION_ALL_BUT_POWER = 0x0f9fff
-
-        self.suportedMode['normal'] = PowerMode(
-            self.CodeAreaNames.ALIEN_FX_DEFAULT_POWER_MODE,
-            self.CodeAreaNames.ALIEN_FX_DEFAULT_POWER_MODE,
-            self.BLOCK_LOAD_ON_BOOT)
-        self.suportedMode['standby'] = PowerMode(
-            self.CodeAreaNames.STANDBY_ID,
-            TEXT_DESCRIPTION_STAND_BY,
-            self.BLOCK_STANDBY)
-        self.suportedMode['acPower'] = PowerMode(
-            self.CodeAreaNames.AC_POWER_ID,
-            TEXT_DESCRIPTION_AC_POWER,
-            self.BLOCK_AC_POWER)
-        self.suportedMode['charging'] = PowerMode(
-            self.CodeAreaNames.CHARGING_ID,
-            TEXT_DESCRIPTION_CHARGING,
-            self.BLOCK_CHARGING)
-        self.suportedMode['onBat'] = PowerMode(
-            self.CodeAreaNames.ON_BATTERY_ID,
-            TEXT_DESCRIPTION_ON_BATTERY,
-            self.BLOCK_BAT_POWER)
-
-        self.regions[
-            self.CodeAreaNames.LIGHT_PIPE_ID] = Region(
-            self.CodeAreaNames.LIGHT_PIPE_ID,
-            TEXT_DESCRIPTION_LIGHT_PIPE,
-            self.REGION_LIGHTPIPE,
-            self.SUPPORTED_COMMANDS,
-            True,
-            True,
-            True,
-            self.default_color,
-            self.suportedMode)
-        self.regions[
-            self.CodeAreaNames.KEYBOARD_ID] = Region(
-            self.CodeAreaNames.KEYBOARD_ID,
-            TEXT_DESCRIPTION_KEYBOARD,
-            self.REGION_KEY_BOARD,
-            self.SUPPORTED_COMMANDS,
-            True,
-            True,
-            True,
-            self.default_color,
-            self.suportedMode)
-        self.regions[
-            self.CodeAreaNames.ALIEN_HEAD_ID] = Region(
-            self.CodeAreaNames.ALIEN_HEAD_ID,
-            TEXT_DESCRIPTION_ALIENWARE_HEAD,
-            self.REGION_ALIEN_HEAD,
-            self.SUPPORTED_COMMANDS,
-            True,
-            True,
-            True,
-            self.default_color,
-            self.suportedMode)
-        self.regions[
-            self.CodeAreaNames.ALIEN_LOGO_ID] = Region(
-            self.CodeAreaNames.ALIEN_LOGO_ID,
-            TEXT_DESCRIPTION_ALIENWARE_LOGO,
-            self.REGION_ALIEN_LOGO,
-            self.SUPPORTED_COMMANDS,
-            True,
-            True,
-            True,
-            self.default_color,
-            self.suportedMode)
-        self.regions[
-            self.CodeAreaNames.TOUCH_PAD_ID] = Region(
-            self.CodeAreaNames.TOUCH_PAD_ID,
-            TEXT_DESCRIPTION_TOUCHPAD,
-            self.REGION_TOUCH_PAD,
-            self.SUPPORTED_COMMANDS,
-            True,
-            True,
-            True,
-            self.default_color,
-            self.suportedMode)
-        self.regions[
-            self.CodeAreaNames.MEDIA_BAR_ID] = Region(
-            self.CodeAreaNames.MEDIA_BAR_ID,
-            TEXT_DESCRIPTION_MEDIA_BAR,
-            self.REGION_TOUCH_PANEL,
-            self.SUPPORTED_COMMANDS,
-            True,
-            True,
-            True,
-            self.default_color,
-            self.suportedMode)
-        self.regions[
-            self.CodeAreaNames.POWER_BUTTON_ID] = Region(
-            self.CodeAreaNames.POWER_BUTTON_ID,
-            TEXT_DESCRIPTION_POWER_BUTTON,
-            self.REGION_POWER_BUTTON,
-            1,
-            False,
-            False,
-            True,
-            self.default_color,
-            self.suportedMode,
-            power_button=True)
-
-
-class Alienware15(CommonConf):
+    MODEL = None
 
     def __init__(self):
         super().__init__()
-        self.name = TEXT_ALIENWARE15
-
-        self.REGION_RIGHT_KEYBOARD = 0x0001
-        self.REGION_RIGHT_CENTER_KEYBOARD = 0x0002
-        self.REGION_LEFT_KEYBOARD = 0x8
-        self.REGION_LEFT_CENTER_KEYBOARD = 0x4
-        self.REGION_LEFT_SPEAKER = 0x800
-        self.REGION_RIGHT_SPEAKER = 0x1000
-        self.REGION_POWER_BUTTON = 0x0100
-        self.REGION_TOUCH_PAD = 0x400
-        self.REGION_ALL_BUT_POWER = 0x7fff
-        self.REGION_ALIEN_NAME = 0x0040
-        self.REGION_ALIEN_HEAD = 0x0020
-        self.REGION_MEDIA_BAR = 0x0080
-        self.REGION_TACTX = 0x2000
-        self.REGION_POWER_BUTTON_EYES = 0x4000
-        # 0x1800 primitive speaker-both
-
-        self.suportedMode['normal'] = PowerMode(
-            self.CodeAreaNames.ALIEN_FX_DEFAULT_POWER_MODE,
-            self.CodeAreaNames.ALIEN_FX_DEFAULT_POWER_MODE,
-            self.BLOCK_LOAD_ON_BOOT)
-        self.suportedMode['standby'] = PowerMode(
-            self.CodeAreaNames.STANDBY_ID,
-            TEXT_DESCRIPTION_STAND_BY,
-            self.BLOCK_STANDBY)
-        self.suportedMode['acPower'] = PowerMode(
-            self.CodeAreaNames.AC_POWER_ID,
-            TEXT_DESCRIPTION_AC_POWER,
-            self.BLOCK_AC_POWER)
-        self.suportedMode['charging'] = PowerMode(
-            self.CodeAreaNames.CHARGING_ID,
-            TEXT_DESCRIPTION_CHARGING,
-            self.BLOCK_CHARGING)
-        self.suportedMode['onBat'] = PowerMode(
-            self.CodeAreaNames.ON_BATTERY_ID,
-            TEXT_DESCRIPTION_ON_BATTERY,
-            self.BLOCK_BAT_POWER)
-
-        self.regions[
-            self.CodeAreaNames.TACTX_ID] = Region(
-            self.CodeAreaNames.TACTX_ID,
-            TEXT_DESCRIPTION_TACTX,
-            self.REGION_TACTX,
-            self.SUPPORTED_COMMANDS,
-            True,
-            True,
-            True,
-            self.default_color,
-            self.suportedMode)
-        self.regions[
-            self.CodeAreaNames.RIGHT_KEYBOARD_ID] = Region(
-            self.CodeAreaNames.RIGHT_KEYBOARD_ID,
-            TEXT_DESCRIPTION_RIGHT_KEYBOARD,
-            self.REGION_RIGHT_KEYBOARD,
-            self.SUPPORTED_COMMANDS,
-            True,
-            True,
-            True,
-            self.default_color,
-            self.suportedMode)
-        self.regions[
-            self.CodeAreaNames.RIGHT_CENTER_KEYBOARD_ID] = Region(
-            self.CodeAreaNames.RIGHT_CENTER_KEYBOARD_ID,
-            TEXT_DESCRIPTION_RIGHT_CENTER_KEYBOARD,
-            self.REGION_RIGHT_CENTER_KEYBOARD,
-            self.SUPPORTED_COMMANDS,
-            True,
-            True,
-            True,
-            self.default_color,
-            self.suportedMode)
-        self.regions[
-            self.CodeAreaNames.LEFT_KEYBOARD_ID] = Region(
-            self.CodeAreaNames.LEFT_KEYBOARD_ID,
-            TEXT_DESCRIPTION_LEFT_KEYBOARD,
-            self.REGION_LEFT_KEYBOARD,
-            self.SUPPORTED_COMMANDS,
-            True,
-            True,
-            True,
-            self.default_color,
-            self.suportedMode)
-        self.regions[
-            self.CodeAreaNames.LEFT_CENTER_KEYBOARD_ID] = Region(
-            self.CodeAreaNames.LEFT_CENTER_KEYBOARD_ID,
-            TEXT_DESCRIPTION_LEFT_CENTER_KEYBOARD,
-            self.REGION_LEFT_CENTER_KEYBOARD,
-            self.SUPPORTED_COMMANDS,
-            True,
-            True,
-            True,
-            self.default_color,
-            self.suportedMode)
-        self.regions[
-            self.CodeAreaNames.RIGHT_SPEAKER_ID] = Region(
-            self.CodeAreaNames.RIGHT_SPEAKER_ID,
-            TEXT_DESCRIPTION_RIGHT_SPEAKER,
-            self.REGION_RIGHT_SPEAKER,
-            self.SUPPORTED_COMMANDS,
-            True,
-            True,
-            True,
-            self.default_color,
-            self.suportedMode)
-        self.regions[
-            self.CodeAreaNames.LEFT_SPEAKER_ID] = Region(
-            self.CodeAreaNames.LEFT_SPEAKER_ID,
-            TEXT_DESCRIPTION_LEFT_SPEAKER,
-            self.REGION_LEFT_SPEAKER,
-            self.SUPPORTED_COMMANDS,
-            True,
-            True,
-            True,
-            self.default_color,
-            self.suportedMode)
-        self.regions[
-            self.CodeAreaNames.ALIEN_HEAD_ID] = Region(
-            self.CodeAreaNames.ALIEN_HEAD_ID,
-            TEXT_DESCRIPTION_ALIENWARE_HEAD,
-            self.REGION_ALIEN_HEAD,
-            self.SUPPORTED_COMMANDS,
-            True,
-            True,
-            True,
-            self.default_color,
-            self.suportedMode)
-        self.regions[
-            self.CodeAreaNames.ALIEN_LOGO_ID] = Region(
-            self.CodeAreaNames.ALIEN_LOGO_ID,
-            TEXT_DESCRIPTION_ALIENWARE_LOGO,
-            self.REGION_ALIEN_NAME,
-            self.SUPPORTED_COMMANDS,
-            True,
-            True,
-            True,
-            self.default_color,
-            self.suportedMode)
-        self.regions[
-            self.CodeAreaNames.TOUCH_PAD_ID] = Region(
-            self.CodeAreaNames.TOUCH_PAD_ID,
-            TEXT_DESCRIPTION_TOUCHPAD,
-            self.REGION_TOUCH_PAD,
-            self.SUPPORTED_COMMANDS,
-            True,
-            True,
-            True,
-            self.default_color,
-            self.suportedMode)
-        self.regions[
-            self.CodeAreaNames.MEDIA_BAR_ID] = Region(
-            self.CodeAreaNames.MEDIA_BAR_ID,
-            TEXT_DESCRIPTION_MEDIA_BAR,
-            self.REGION_MEDIA_BAR,
-            self.SUPPORTED_COMMANDS,
-            True,
-            True,
-            True,
-            self.default_color,
-            self.suportedMode)
-        self.regions[
-            self.CodeAreaNames.POWER_BUTTON_EYES_ID] = Region(
-            self.CodeAreaNames.POWER_BUTTON_EYES_ID,
-            TEXT_DESCRIPTION_ALIENWARE_POWERBUTTON_EYES,
-            self.REGION_POWER_BUTTON_EYES,
-            1,
-            False,
-            False,
-            True,
-            self.default_color,
-            self.suportedMode)
-        self.regions[
-            self.CodeAreaNames.POWER_BUTTON_ID] = Region(
-            self.CodeAreaNames.POWER_BUTTON_ID,
-            TEXT_DESCRIPTION_POWER_BUTTON,
-            self.REGION_POWER_BUTTON,
-            2,
-            True,
-            True,
-            True,
-            self.default_color,
-            self.suportedMode,
-            power_button=True)
-
-
-class Alienware15R3(Alienware15):
+        self.name = self.MODEL
 
-    def __init__(self):
-        super().__init__()
-        self.name = TEXT_ALIENWARE15R3
+        for key, (name, description, block) in _POWER_MODES:
+            self.suportedMode[key] = PowerMode(name, description, getattr(self, block))
 
+        for (area_id, description, regionId, maxCommands,
+             canBlink, canMorph, canLight, power_button) in REGIONS[MODELS[self.MODEL][2]]:
 
-class M17X(CommonConf):
+            self.regions[area_id] = Region(
+                area_id,
+                description,
+                regionId,
+                maxCommands,
+                canBlink,
+                canMorph,
+                canLight,
+                self.default_color,
+                self.suportedMode,
+                power_button=power_button)
 
-    def __init__(self):
-        super().__init__()
-        self.name = TEXT_M17X
-
-        self.REGION_RIGHT_KEYBOARD = 0x0008
-        self.REGION_RIGHT_CENTER_KEYBOARD = 0x0002
-        self.REGION_LEFT_KEYBOARD = 0x0001
-        self.REGION_LEFT_CENTER_KEYBOARD = 0x0004
-        self.REGION_RIGHT_SPEAKER = 0x0040
-        self.REGION_LEFT_SPEAKER = 0x0020
-        self.REGION_ALIEN_HEAD = 0x0080
-        self.REGION_ALIEN_NAME = 0x0100
-        self.REGION_TOUCH_PAD = 0x0200
-        self.REGION_MEDIA_BAR = 0x1c00
-        self.REGION_POWER_BUTTON = 0x2000
-        self.REGION_POWER_BUTTON_EYES = 0x4000
-        self.REGION_ALL_BUT_POWER = 0x0f9fff
-
-        self.suportedMode['normal'] = PowerMode(
-            self.CodeAreaNames.ALIEN_FX_DEFAULT_POWER_MODE,
-            self.CodeAreaNames.ALIEN_FX_DEFAULT_POWER_MODE,
-            self.BLOCK_LOAD_ON_BOOT)
-        self.suportedMode['standby'] = PowerMode(
-            self.CodeAreaNames.STANDBY_ID,
-            TEXT_DESCRIPTION_STAND_BY,
-            self.BLOCK_STANDBY)
-        self.suportedMode['acPower'] = PowerMode(
-            self.CodeAreaNames.AC_POWER_ID,
-            TEXT_DESCRIPTION_AC_POWER,
-            self.BLOCK_AC_POWER)
-        self.suportedMode['charging'] = PowerMode(
-            self.CodeAreaNames.CHARGING_ID,
-            TEXT_DESCRIPTION_CHARGING,
-            self.BLOCK_CHARGING)
-        self.suportedMode['onBat'] = PowerMode(
-            self.CodeAreaNames.ON_BATTERY_ID,
-            TEXT_DESCRIPTION_ON_BATTERY,
-            self.BLOCK_BAT_POWER)
-
-        self.regions[
-            self.CodeAreaNames.RIGHT_KEYBOARD_ID] = Region(
-            self.CodeAreaNames.RIGHT_KEYBOARD_ID,
-            TEXT_DESCRIPTION_RIGHT_KEYBOARD,
-            self.REGION_RIGHT_KEYBOARD,
-            self.SUPPORTED_COMMANDS,
-            True,
-            True,
-            True,
-            self.default_color,
-            self.suportedMode)
-        self.regions[
-            self.CodeAreaNames.RIGHT_CENTER_KEYBOARD_ID] = Region(
-            self.CodeAreaNames.RIGHT_CENTER_KEYBOARD_ID,
-            TEXT_DESCRIPTION_RIGHT_CENTER_KEYBOARD,
-            self.REGION_RIGHT_CENTER_KEYBOARD,
-            self.SUPPORTED_COMMANDS,
-            True,
-            True,
-            True,
-            self.default_color,
-            self.suportedMode)
-        self.regions[
-            self.CodeAreaNames.LEFT_KEYBOARD_ID] = Region(
-            self.CodeAreaNames.LEFT_KEYBOARD_ID,
-            TEXT_DESCRIPTION_LEFT_KEYBOARD,
-            self.REGION_LEFT_KEYBOARD,
-            self.SUPPORTED_COMMANDS,
-            True,
-            True,
-            True,
-            self.default_color,
-            self.suportedMode)
-        self.regions[
-            self.CodeAreaNames.LEFT_CENTER_KEYBOARD_ID] = Region(
-            self.CodeAreaNames.LEFT_CENTER_KEYBOARD_ID,
-            TEXT_DESCRIPTION_LEFT_CENTER_KEYBOARD,
-            self.REGION_LEFT_CENTER_KEYBOARD,
-            self.SUPPORTED_COMMANDS,
-            True,
-            True,
-            True,
-            self.default_color,
-            self.suportedMode)
-        self.regions[
-            self.CodeAreaNames.RIGHT_SPEAKER_ID] = Region(
-            self.CodeAreaNames.RIGHT_SPEAKER_ID,
-            TEXT_DESCRIPTION_RIGHT_SPEAKER,
-            self.REGION_RIGHT_SPEAKER,
-            self.SUPPORTED_COMMANDS,
-            True,
-            True,
-            True,
-            self.default_color,
-            self.suportedMode)
-        self.regions[
-            self.CodeAreaNames.LEFT_SPEAKER_ID] = Region(
-            self.CodeAreaNames.LEFT_SPEAKER_ID,
-            TEXT_DESCRIPTION_LEFT_SPEAKER,
-            self.REGION_LEFT_SPEAKER,
-            self.SUPPORTED_COMMANDS,
-            True,
-            True,
-            True,
-            self.default_color,
-            self.suportedMode)
-        self.regions[
-            self.CodeAreaNames.ALIEN_HEAD_ID] = Region(
-            self.CodeAreaNames.ALIEN_HEAD_ID,
-            TEXT_DESCRIPTION_ALIENWARE_HEAD,
-            self.REGION_ALIEN_HEAD,
-            self.SUPPORTED_COMMANDS,
-            True,
-            True,
-            True,
-            self.default_color,
-            self.suportedMode)
-        self.regions[
-            self.CodeAreaNames.ALIEN_LOGO_ID] = Region(
-            self.CodeAreaNames.ALIEN_LOGO_ID,
-            TEXT_DESCRIPTION_ALIENWARE_LOGO,
-            self.REGION_ALIEN_NAME,
-            self.SUPPORTED_COMMANDS,
-            True,
-            True,
-            True,
-            self.default_color,
-            self.suportedMode)
-        self.regions[
-            self.CodeAreaNames.TOUCH_PAD_ID] = Region(
-            self.CodeAreaNames.TOUCH_PAD_ID,
-            TEXT_DESCRIPTION_TOUCHPAD,
-            self.REGION_TOUCH_PAD,
-            self.SUPPORTED_COMMANDS,
-            True,
-            True,
-            True,
-            self.default_color,
-            self.suportedMode)
-        self.regions[
-            self.CodeAreaNames.MEDIA_BAR_ID] = Region(
-            self.CodeAreaNames.MEDIA_BAR_ID,
-            TEXT_DESCRIPTION_MEDIA_BAR,
-            self.REGION_MEDIA_BAR,
-            self.SUPPORTED_COMMANDS,
-            True,
-            True,
-            True,
-            self.default_color,
-            self.suportedMode)
-        self.regions[
-            self.CodeAreaNames.POWER_BUTTON_EYES_ID] = Region(
-            self.CodeAreaNames.POWER_BUTTON_EYES_ID,
-            TEXT_DESCRIPTION_ALIENWARE_POWERBUTTON_EYES,
-            self.REGION_POWER_BUTTON_EYES,
-            1,
-            False,
-            False,
-            True,
-            self.default_color,
-            self.suportedMode)
-        self.regions[
-            self.CodeAreaNames.POWER_BUTTON_ID] = Region(
-            self.CodeAreaNames.POWER_BUTTON_ID,
-            TEXT_DESCRIPTION_POWER_BUTTON,
-            self.REGION_POWER_BUTTON,
-            2,
-            True,
-            True,
-            True,
-            self.default_color,
-            self.suportedMode,
-            power_button=True)
-
-
-class M17XR2(CommonConf):
 
-    def __init__(self):
-        super().__init__()
-        self.name = TEXT_M17XR2
-
-        self.REGION_RIGHT_KEYBOARD = 0x0001
-        self.REGION_RIGHT_CENTER_KEYBOARD = 0x0002
-        self.REGION_LEFT_KEYBOARD = 0x0004
-        self.REGION_LEFT_CENTER_KEYBOARD = 0x0008
-        self.REGION_RIGHT_SPEAKER = 0x0020
-        self.REGION_LEFT_SPEAKER = 0x0040
-        self.REGION_ALIEN_HEAD = 0x0080
-        self.REGION_ALIEN_NAME = 0x0100
-        self.REGION_TOUCH_PAD = 0x0200
-        self.REGION_MEDIA_BAR = 0x1c00
-        self.REGION_POWER_BUTTON = 0x2000
-        self.REGION_POWER_BUTTON_EYES = 0x4000
-        self.REGION_ALL_BUT_POWER = 0x0f9fff
-
-        self.suportedMode['normal'] = PowerMode(
-            self.CodeAreaNames.ALIEN_FX_DEFAULT_POWER_MODE,
-            self.CodeAreaNames.ALIEN_FX_DEFAULT_POWER_MODE,
-            self.BLOCK_LOAD_ON_BOOT)
-        self.suportedMode['standby'] = PowerMode(
-            self.CodeAreaNames.STANDBY_ID,
-            TEXT_DESCRIPTION_STAND_BY,
-            self.BLOCK_STANDBY)
-        self.suportedMode['acPower'] = PowerMode(
-            self.CodeAreaNames.AC_POWER_ID,
-            TEXT_DESCRIPTION_AC_POWER,
-            self.BLOCK_AC_POWER)
-        self.suportedMode['charging'] = PowerMode(
-            self.CodeAreaNames.CHARGING_ID,
-            TEXT_DESCRIPTION_CHARGING,
-            self.BLOCK_CHARGING)
-        self.suportedMode['onBat'] = PowerMode(
-            self.CodeAreaNames.ON_BATTERY_ID,
-            TEXT_DESCRIPTION_ON_BATTERY,
-            self.BLOCK_BAT_POWER)
-
-        self.regions[
-            self.CodeAreaNames.RIGHT_KEYBOARD_ID] = Region(
-            self.CodeAreaNames.RIGHT_KEYBOARD_ID,
-            TEXT_DESCRIPTION_RIGHT_KEYBOARD,
-            self.REGION_RIGHT_KEYBOARD,
-            self.SUPPORTED_COMMANDS,
-            True,
-            True,
-            True,
-            self.default_color,
-            self.suportedMode)
-        self.regions[
-            self.CodeAreaNames.RIGHT_CENTER_KEYBOARD_ID] = Region(
-            self.CodeAreaNames.RIGHT_CENTER_KEYBOARD_ID,
-            TEXT_DESCRIPTION_RIGHT_CENTER_KEYBOARD,
-            self.REGION_RIGHT_CENTER_KEYBOARD,
-            self.SUPPORTED_COMMANDS,
-            True,
-            True,
-            True,
-            self.default_color,
-            self.suportedMode)
-        self.regions[
-            self.CodeAreaNames.LEFT_KEYBOARD_ID] = Region(
-            self.CodeAreaNames.LEFT_KEYBOARD_ID,
-            TEXT_DESCRIPTION_LEFT_KEYBOARD,
-            self.REGION_LEFT_KEYBOARD,
-            self.SUPPORTED_COMMANDS,
-            True,
-            True,
-            True,
-            self.default_color,
-            self.suportedMode)
-        self.regions[
-            self.CodeAreaNames.LEFT_CENTER_KEYBOARD_ID] = Region(
-            self.CodeAreaNames.LEFT_CENTER_KEYBOARD_ID,
-            TEXT_DESCRIPTION_LEFT_CENTER_KEYBOARD,
-            self.REGION_LEFT_CENTER_KEYBOARD,
-            self.SUPPORTED_COMMANDS,
-            True,
-            True,
-            True,
-            self.default_color,
-            self.suportedMode)
-        self.regions[
-            self.CodeAreaNames.RIGHT_SPEAKER_ID] = Region(
-            self.CodeAreaNames.RIGHT_SPEAKER_ID,
-            TEXT_DESCRIPTION_RIGHT_SPEAKER,
-            self.REGION_RIGHT_SPEAKER,
-            self.SUPPORTED_COMMANDS,
-            True,
-            True,
-            True,
-            self.default_color,
-            self.suportedMode)
-        self.regions[
-            self.CodeAreaNames.LEFT_SPEAKER_ID] = Region(
-            self.CodeAreaNames.LEFT_SPEAKER_ID,
-            TEXT_DESCRIPTION_LEFT_SPEAKER,
-            self.REGION_LEFT_SPEAKER,
-            self.SUPPORTED_COMMANDS,
-            True,
-            True,
-            True,
-            self.default_color,
-            self.suportedMode)
-        self.regions[
-            self.CodeAreaNames.ALIEN_HEAD_ID] = Region(
-            self.CodeAreaNames.ALIEN_HEAD_ID,
-            TEXT_DESCRIPTION_ALIENWARE_HEAD,
-            self.REGION_ALIEN_HEAD,
-            self.SUPPORTED_COMMANDS,
-            True,
-            True,
-            True,
-            self.default_color,
-            self.suportedMode)
-        self.regions[
-            self.CodeAreaNames.ALIEN_LOGO_ID] = Region(
-            self.CodeAreaNames.ALIEN_LOGO_ID,
-            TEXT_DESCRIPTION_ALIENWARE_LOGO,
-            self.REGION_ALIEN_NAME,
-            self.SUPPORTED_COMMANDS,
-            True,
-            True,
-            True,
-            self.default_color,
-            self.suportedMode)
-        self.regions[
-            self.CodeAreaNames.TOUCH_PAD_ID] = Region(
-            self.CodeAreaNames.TOUCH_PAD_ID,
-            TEXT_DESCRIPTION_TOUCHPAD,
-            self.REGION_TOUCH_PAD,
-            self.SUPPORTED_COMMANDS,
-            True,
-            True,
-            True,
-            self.default_color,
-            self.suportedMode)
-        self.regions[
-            self.CodeAreaNames.MEDIA_BAR_ID] = Region(
-            self.CodeAreaNames.MEDIA_BAR_ID,
-            TEXT_DESCRIPTION_MEDIA_BAR,
-            self.REGION_MEDIA_BAR,
-            self.SUPPORTED_COMMANDS,
-            True,
-            True,
-            True,
-            self.default_color,
-            self.suportedMode)
-        self.regions[
-            self.CodeAreaNames.POWER_BUTTON_EYES_ID] = Region(
-            self.CodeAreaNames.POWER_BUTTON_EYES_ID,
-            TEXT_DESCRIPTION_ALIENWARE_POWERBUTTON_EYES,
-            self.REGION_POWER_BUTTON_EYES,
-            1,
-            False,
-            False,
-            True,
-            self.default_color,
-            self.suportedMode)
-        self.regions[
-            self.CodeAreaNames.POWER_BUTTON_ID] = Region(
-            self.CodeAreaNames.POWER_BUTTON_ID,
-            TEXT_DESCRIPTION_POWER_BUTTON,
-            self.REGION_POWER_BUTTON,
-            2,
-            True,
-            True,
-            True,
-            self.default_color,
-            self.suportedMode,
-            power_button=True)
-
-
-class M17XR3(M17X):
+# A class per model, so `getattr(Computers, name)()` builds the computer `name`
+for _name, (_, _, _, _parent) in MODELS.items():
+    globals()[_name] = type(_name, (globals()[_parent] if _parent else Model,), {'MODEL': _name})
 
-    def __init__(self):
-        super().__init__()
-        self.name = TEXT_M17XR3
 
+class Computer:
 
-class M18XR2(CommonConf):
+    """
+        `computer` is only built the first time that it is used,
+        `model` can be the class of the computer or an instance.
+    """
 
-    def __init__(self):
-        super().__init__()
-        self.name = TEXT_M18XR2
-
-        self.REGION_RIGHT_KEYBOARD = 0x0001
-        self.REGION_RIGHT_CENTER_KEYBOARD = 0x0002
-        self.REGION_LEFT_KEYBOARD = 0x0008
-        self.REGION_LEFT_CENTER_KEYBOARD = 0x0004
-        self.REGION_RIGHT_SPEAKER = 0x0020
-        self.REGION_LEFT_SPEAKER = 0x0040
-        self.REGION_ALIEN_HEAD = 0x0080
-        self.REGION_ALIEN_NAME = 0x0100
-        self.REGION_TOUCH_PAD = 0x0200
-        self.REGION_MEDIA_BAR = 0x1c00
-        self.REGION_POWER_BUTTON = 0x2000
-        self.REGION_POWER_BUTTON_EYES = 0x4000
-        self.REGION_ALL_BUT_POWER = 0x0f9fff
-
-        self.suportedMode['normal'] = PowerMode(
-            self.CodeAreaNames.ALIEN_FX_DEFAULT_POWER_MODE,
-            self.CodeAreaNames.ALIEN_FX_DEFAULT_POWER_MODE,
-            self.BLOCK_LOAD_ON_BOOT)
-        self.suportedMode['standby'] = PowerMode(
-            self.CodeAreaNames.STANDBY_ID,
-            TEXT_DESCRIPTION_STAND_BY,
-            self.BLOCK_STANDBY)
-        self.suportedMode['acPower'] = PowerMode(
-            self.CodeAreaNames.AC_POWER_ID,
-            TEXT_DESCRIPTION_AC_POWER,
-            self.BLOCK_AC_POWER)
-        self.suportedMode['charging'] = PowerMode(
-            self.CodeAreaNames.CHARGING_ID,
-            TEXT_DESCRIPTION_CHARGING,
-            self.BLOCK_CHARGING)
-        self.suportedMode['onBat'] = PowerMode(
-            self.CodeAreaNames.ON_BATTERY_ID,
-            TEXT_DESCRIPTION_ON_BATTERY,
-            self.BLOCK_BAT_POWER)
-
-        self.regions[
-            self.CodeAreaNames.RIGHT_KEYBOARD_ID] = Region(
-            self.CodeAreaNames.RIGHT_KEYBOARD_ID,
-            TEXT_DESCRIPTION_RIGHT_KEYBOARD,
-            self.REGION_RIGHT_KEYBOARD,
-            self.SUPPORTED_COMMANDS,
-            True,
-            True,
-            True,
-            self.default_color,
-            self.suportedMode)
-        self.regions[
-            self.CodeAreaNames.RIGHT_CENTER_KEYBOARD_ID] = Region(
-            self.CodeAreaNames.RIGHT_CENTER_KEYBOARD_ID,
-            TEXT_DESCRIPTION_RIGHT_CENTER_KEYBOARD,
-            self.REGION_RIGHT_CENTER_KEYBOARD,
-            self.SUPPORTED_COMMANDS,
-            True,
-            True,
-            True,
-            self.default_color,
-            self.suportedMode)
-        self.regions[
-            self.CodeAreaNames.LEFT_KEYBOARD_ID] = Region(
-            self.CodeAreaNames.LEFT_KEYBOARD_ID,
-            TEXT_DESCRIPTION_LEFT_KEYBOARD,
-            self.REGION_LEFT_KEYBOARD,
-            self.SUPPORTED_COMMANDS,
-            True,
-            True,
-            True,
-            self.default_color,
-            self.suportedMode)
-        self.regions[
-            self.CodeAreaNames.LEFT_CENTER_KEYBOARD_ID] = Region(
-            self.CodeAreaNames.LEFT_CENTER_KEYBOARD_ID,
-            TEXT_DESCRIPTION_LEFT_CENTER_KEYBOARD,
-            self.REGION_LEFT_CENTER_KEYBOARD,
-            self.SUPPORTED_COMMANDS,
-            True,
-            True,
-            True,
-            self.default_color,
-            self.suportedMode)
-        self.regions[
-            self.CodeAreaNames.RIGHT_SPEAKER_ID] = Region(
-            self.CodeAreaNames.RIGHT_SPEAKER_ID,
-            TEXT_DESCRIPTION_RIGHT_SPEAKER,
-            self.REGION_RIGHT_SPEAKER,
-            self.SUPPORTED_COMMANDS,
-            True,
-            True,
-            True,
-            self.default_color,
-            self.suportedMode)
-        self.regions[
-            self.CodeAreaNames.LEFT_SPEAKER_ID] = Region(
-            self.CodeAreaNames.LEFT_SPEAKER_ID,
-            TEXT_DESCRIPTION_LEFT_SPEAKER,
-            self.REGION_LEFT_SPEAKER,
-            self.SUPPORTED_COMMANDS,
-            True,
-            True,
-            True,
-            self.default_color,
-            self.suportedMode)
-        self.regions[
-            self.CodeAreaNames.ALIEN_HEAD_ID] = Region(
-            self.CodeAreaNames.ALIEN_HEAD_ID,
-            TEXT_DESCRIPTION_ALIENWARE_HEAD,
-            self.REGION_ALIEN_HEAD,
-            self.SUPPORTED_COMMANDS,
-            True,
-            True,
-            True,
-            self.default_color,
-            self.suportedMode)
-        self.regions[
-            self.CodeAreaNames.ALIEN_LOGO_ID] = Region(
-            self.CodeAreaNames.ALIEN_LOGO_ID,
-            TEXT_DESCRIPTION_ALIENWARE_LOGO,
-            self.REGION_ALIEN_NAME,
-            self.SUPPORTED_COMMANDS,
-            True,
-            True,
-            True,
-            self.default_color,
-            self.suportedMode)
-        self.regions[
-            self.CodeAreaNames.TOUCH_PAD_ID] = Region(
-            self.CodeAreaNames.TOUCH_PAD_ID,
-            TEXT_DESCRIPTION_TOUCHPAD,
-            self.REGION_TOUCH_PAD,
-            self.SUPPORTED_COMMANDS,
-            True,
-            True,
-            True,
-            self.default_color,
-            self.suportedMode)
-        self.regions[
-            self.CodeAreaNames.MEDIA_BAR_ID] = Region(
-            self.CodeAreaNames.MEDIA_BAR_ID,
-            TEXT_DESCRIPTION_MEDIA_BAR,
-            self.REGION_MEDIA_BAR,
-            self.SUPPORTED_COMMANDS,
-            True,
-            True,
-            True,
-            self.default_color,
-            self.suportedMode)
-        self.regions[
-            self.CodeAreaNames.POWER_BUTTON_EYES_ID] = Region(
-            self.CodeAreaNames.POWER_BUTTON_EYES_ID,
-            TEXT_DESCRIPTION_ALIENWARE_POWERBUTTON_EYES,
-            self.REGION_POWER_BUTTON_EYES,
-            1,
-            False,
-            False,
-            True,
-            self.default_color,
-            self.suportedMode)
-        self.regions[
-            self.CodeAreaNames.POWER_BUTTON_ID] = Region(
-            self.CodeAreaNames.POWER_BUTTON_ID,
-            TEXT_DESCRIPTION_POWER_BUTTON,
-            self.REGION_POWER_BUTTON,
-            2,
-            True,
-            True,
-            True,
-            self.default_color,
-            self.suportedMode,
-            power_button=True)
-
-
-class M18XRX(M18XR2):
+    def __init__(self, name, vendorId, productId, model):
+        self.name = name
+        self.vendorId = vendorId
+        self.productId = productId
 
-    def __init__(self):
-        super().__init__()
-        self.name = TEXT_M18XRX
+        if isinstance(model, CommonConf):
+            self._computer = model
+            self._model = None
+        else:
+            self._computer = None
+            self._model = model
 
+    @property
+    def computer(self):
+        if self._computer is None:
+            self._computer = self._model()
 
-class Computer:
+        return self._computer
 
-    def __init__(self, name, vendorId, productId, computer):
-        self.name = name
-        self.vendorId = vendorId
-        self.productId = productId
-        self.computer = computer
+    def is_built(self):
+        return self._computer is not None
 
 
 class AllComputers():
@@ -1540,33 +424,13 @@ class AllComputers():
     ALIENFX_BUSY = 0x11
     ALIENFX_UNKOWN_COMMAND = 0x12
 
-    #
-    # If you add a new computer please send me an email/open a bug repport so I can add it to the main program too.
-    # The names are taken from wikipedia:  https://en.wikipedia.org/wiki/Alienware
-    #
-    computerList = {
-        # id vendor, id product
-        TEXT_M11XR1: Computer(TEXT_M11XR1, 0x187c, 0x0514, M11XR1()),
-        TEXT_M11XR2: Computer(TEXT_M11XR2, 0x187c, 0x0515, M11XR2()),
-        TEXT_M11XR3: Computer(TEXT_M11XR3, 0x187c, 0x0522, M11XR3()),
-        TEXT_M11XR25: Computer(TEXT_M11XR25, 0x187c, 0x0516, M11XR25()),
-        TEXT_ALIENWARE13: Computer(TEXT_ALIENWARE13, 0x187c, 0x0527, Alienware13()),
-        TEXT_ALIENWARE13R3: Computer(TEXT_ALIENWARE13R3, 0x187c, 0x0529, Alienware13R3()),
-
-        # M14XR2 is differenciated from M14XR1 by reading
-        TEXT_M14XR1: Computer(TEXT_M14XR1, 0x187c, 0x0521, M14XR1()),
-        # the device information. > Gaming' take a look to Engine.py
-        TEXT_M14XR2: Computer(TEXT_M14XR2, 0x187c, 0x0521, M14XR2()),
-        TEXT_M14XR3: Computer(TEXT_M14XR3, 0x187c, 0x0525, M14XR3()),
-
-        TEXT_M15XAREA51: Computer(TEXT_M15XAREA51, 0x187c, 0x0511, M15XArea51()),
-        TEXT_ALIENWARE15: Computer(TEXT_ALIENWARE15, 0x187c, 0x0528, Alienware15()),
-        TEXT_ALIENWARE15R3: Computer(TEXT_ALIENWARE15R3, 0x187c, 0x0530, Alienware15R3()),
-
-        TEXT_M17X: Computer(TEXT_M17X, 0x187c, 0x0524, M17X()),
-        TEXT_M17XR2: Computer(TEXT_M17XR2, 0x187c, 0x0512, M17XR2()),
-        TEXT_M17XR3: Computer(TEXT_M17XR3, 0x187c, 0x0520, M17XR3()),
-
-        TEXT_M18XRX: Computer(TEXT_M18XRX, 0x187c, 0x0523, M18XRX()),
-        TEXT_M18XR2: Computer(TEXT_M18XR2, 0x187c, 0x0518, M18XR2()),
-    }
+    computerList = {name: Computer(name, vendorId, productId, globals()[name])
+                    for name, (vendorId, productId, _, _) in MODELS.items()}
+
+    # (id vendor, id product): names of the computers that use them, sorted
+    computerIndex = {}
+
+
+for _name in sorted(AllComputers.computerList.keys()):
+    _item = AllComputers.computerList[_name]
+    AllComputers.computerIndex.setdefault((_item.vendorId, _item.productId), []).append(_name)
@@ -22,19 +22,71 @@
     zones and modes (fixed, morph, blink) that will be applied to the keyboard.
 """
 
+import io
 import os
+import re
+import json
+import hashlib
+from itertools import chain
 from traceback import format_exc
 
 # local imports
+from CCParser import write_atomic
 from Computers import *
 from Paths import *
 
+# The profiles are written as JSON lines: a header with the name,
+# the computer and the speed of the profile, then a line per area:
+#
+#   {"format": "alienware-kbl-profile", "version": 1, "name": ..., "computer": ..., "speed": ...}
+#   {"area": "LK", "zones": [["fixed", "#0000FF", "#0000FF"], ...]}
+#
+# Since the version 2 an area line can have the key of a power mode of the
+# computer (`Computers.CommonConf.suportedMode`), those areas are saved in
+# the block of the power mode and the firmware shows them by itself:
+#
+#   {"power": "onBat", "area": "LK", "zones": [["fixed", "#000000", "#000000"]]}
+#
+# The files of the older versions (`key=value` lines) are still read.
+PROFILE_FORMAT = 'alienware-kbl-profile'
+PROFILE_VERSION = 2
+
+MODES = ('fixed', 'morph', 'blink')
+
+_COLOR = re.compile('^#?[0-9A-Fa-f]{6}$')
+
+
+class ProfileError(ValueError):
+    pass
+
+
 profiles = {}
 
+# path: profile, of the profiles loaded from a file
+_files = {}
+
+# path: (mtime, inode) of the files that could not be loaded,
+# they are not read again until they change
+_failed = {}
+
+
+def _file_key(path):
+    """
+        Return the mtime and the inode of a file, or None if it does not exist.
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+
+    return stat.st_mtime, stat.st_ino
+
 
 def LOAD_profiles(computer, profiles_path):
     global profiles
     profiles = {}
+    _files.clear()
+    _failed.clear()
 
     # Load the existing profiles
     #
@@ -45,7 +97,10 @@ def LOAD_profiles(computer, profiles_path):
 
         for file in files:
             if file.endswith('.cfg'):
-                LOAD_profile(computer, profiles_path + file)
+                path = profiles_path + file
+                key = _file_key(path)
+                if not LOAD_profile(computer, path):
+                    _failed[path] = key
 
     # Add the default profile
     #
@@ -53,16 +108,76 @@ def LOAD_profiles(computer, profiles_path):
         CREATE_default_profile(computer, profiles_path)
 
 
+def UPDATE_profiles(computer, profiles_path, paths=None):
+    """
+        Load again only the profiles whose files changed, were added or were
+        removed since they were loaded. `paths` are the files to check, by
+        default all those of `profiles_path`. Return True if a profile changed.
+    """
+    if paths is None:
+        if not os.path.exists(profiles_path):
+            LOAD_profiles(computer, profiles_path)
+            return True
+
+        paths = set(_files.keys())
+        paths.update(profiles_path + file
+                     for file in os.listdir(profiles_path) if file.endswith('.cfg'))
+
+    changed = False
+
+    for path in paths:
+        if not path.endswith('.cfg'):
+            continue
+
+        key = _file_key(path)
+        mtime = None if key is None else key[0]
+
+        if path in _failed:
+            if _failed[path] == key:
+                continue
+            del _failed[path]
+
+        profile = _files.get(path)
+        if profile is not None:
+            if profile.mtime == mtime:
+                continue
+
+            del _files[path]
+            if profiles.get(profile.name) is profile:
+                del profiles[profile.name]
+            changed = True
+
+        if mtime is not None:
+            if LOAD_profile(computer, path):
+                changed = True
+            else:
+                _failed[path] = key
+
+    if len(profiles.keys()) <= 0:
+        CREATE_default_profile(computer, profiles_path)
+        changed = True
+
+    return changed
+
+
 def LOAD_profile(computer, path):
     new_config = New(computer)
     new_config.path = path
-    new_config.load(path)
+    try:
+        new_config.load(path)
+    except ProfileError as e:
+        print("Warning: The profile `{}` was not loaded: {}".format(path, e))
+        return False
+
+    _files[path] = new_config
+    return True
 
 
 def CREATE_default_profile(computer, profiles_path):
     config = New(computer)
     config.create_profile('Default', profiles_path + 'Default.cfg')
     config.save()
+    _files[config.path] = config
 
 
 def GET_last_configuration():
@@ -83,6 +198,87 @@ def GET_last_configuration():
     return profile_numb, profile_name
 
 
+def GET_profile_index():
+    """
+        Return the name, path, mtime, computer and number of
+        zones of each loaded profile, sorted by name.
+    """
+    return [{'name': name,
+             'path': profile.path,
+             'mtime': profile.mtime,
+             'computer': profile.computer.name,
+             'zones': sum(len(area) for area in profile.area.values())}
+            for name, profile in sorted(profiles.items())]
+
+
+def READ_profile_names(profiles_path):
+    """
+        Return the sorted names of the profiles of `profiles_path` without
+        loading them: only the header, or the lines before `name=`, are read.
+    """
+    if not os.path.exists(profiles_path):
+        return []
+
+    names = []
+    for entry in os.scandir(profiles_path):
+        if not entry.name.endswith('.cfg'):
+            continue
+
+        with open(entry.path, mode='rt', encoding='utf-8') as f:
+            first = f.readline()
+            if first.startswith('{'):
+                try:
+                    names.append(_profile_name(_read_header(first)['name'], entry.path))
+                except ProfileError:
+                    pass
+                continue
+
+            for line in chain((first,), f):
+                variables = line.strip().split('=')
+                if len(variables) == 2 and variables[0] == 'name':
+                    names.append(_profile_name(variables[1], entry.path))
+                    break
+
+    names.sort()
+
+    return names
+
+
+def _profile_name(value, path):
+    """
+        The name of a profile is the value of `name=` in its
+        file, or the name of the file if the value is empty.
+    """
+    if value == '':
+        name = os.path.basename(path)
+    else:
+        name = value
+
+    if name.endswith('.cfg'):
+        name = name[:-4]
+
+    return name
+
+
+def _read_header(line):
+    try:
+        header = json.loads(line)
+    except ValueError as e:
+        raise ProfileError("wrong header: {}".format(e))
+
+    if not isinstance(header, dict) or header.get('format') != PROFILE_FORMAT:
+        raise ProfileError("it is not a profile")
+
+    version = header.get('version')
+    if not isinstance(version, int) or version > PROFILE_VERSION:
+        raise ProfileError("unsupported version: {}".format(version))
+
+    if not isinstance(header.get('name'), str):
+        raise ProfileError("missing name")
+
+    return header
+
+
 class New:
 
     def __init__(self, computer):
@@ -92,6 +288,16 @@ class New:
         self.speed = 65280
         self.time = None
 
+        # power mode key: {area name: AreaData}, the areas saved
+        # in the blocks of the power modes of the computer
+        self.power = {}
+
+        # mtime of the file when it was loaded or saved
+        self.mtime = None
+
+        # sha1 of the file when it was loaded or saved
+        self.digest = None
+
     def create_profile(self, name, path, speed=False):
         self.name = name
         self.set_speed(speed)
@@ -117,37 +323,163 @@ class New:
                 "Warning: Duplicated area `{}`, `{}`".format(
                     area.name, self.area.keys()))
 
-    def save(self):
-        with open(self.path, encoding='utf-8', mode='wt') as f:
-            f.write('name={0}\n'.format(self.name))
-            f.write('computer={0}\n'.format(self.computer.name))
-            f.write('speed={0}\n\n\n'.format(self.speed))
+    def add_power_area(self, power, area):
+        """
+            Add `area` to the areas of the power mode `power`, a
+            key of `computer.suportedMode`, and return its AreaData.
+        """
+        areas = self.power.setdefault(power, {})
+        if area.name not in areas:
+            areas[area.name] = AreaData(area)
 
-            for key in sorted(self.area.keys()):
-                area = self.area[key]
+        return areas[area.name]
 
-                f.write('area={0}\n'.format(area.name))
-                for zone_data in area:
-                    f.write('mode={0}\n'.format(zone_data.mode))
-                    f.write('color1={0}\n'.format(zone_data.color1))
-                    f.write('color2={0}\n'.format(zone_data.color2))
-                f.write('\n')
+    def save(self):
+        # The profiles without power modes can still be read by the version 1
+        header = {'format': PROFILE_FORMAT,
+                  'version': PROFILE_VERSION if self.power else 1,
+                  'name': self.name,
+                  'computer': self.computer.name,
+                  'speed': self.speed}
+
+        lines = [json.dumps(header, ensure_ascii=False)]
+        for power, areas in chain(((None, self.area),), sorted(self.power.items())):
+            for key in sorted(areas.keys()):
+                area = areas[key]
+                entry = {}
+                if power is not None:
+                    entry['power'] = power
+
+                entry['area'] = area.name
+                entry['zones'] = [[zone_data.mode, zone_data.color1, zone_data.color2]
+                                  for zone_data in area]
+
+                lines.append(json.dumps(entry, ensure_ascii=False, separators=(',', ':')))
+        lines.append('')
+        text = '\n'.join(lines)
+
+        with write_atomic(self.path, encoding='utf-8') as f:
+            f.write(text)
 
         self.update_time()
+        self.mtime = self.time
+        self.digest = hashlib.sha1(text.encode('utf-8')).hexdigest()
 
     def load(self, path):
-
-        lines = []
-        with open(path, encoding='utf-8', mode='rt') as f:
-            lines = f.readlines()
-
-        current_area, color1, color2, mode, = False, False, False, False
+        """
+            Read the profile of `path`, in the current format or in the
+            `key=value` one. Raise ProfileError if it can not be read.
+        """
+        self.mtime = os.path.getmtime(path)
 
         # This variable is mostly to check for missing areas in the configuration file.
         # once everything has been imported, if something is missing the
         # default conf will be added.
         added_areas = []
 
+        with open(path, mode='rb') as f:
+            data = f.read()
+
+        self.digest = hashlib.sha1(data).hexdigest()
+        lines = io.StringIO(data.decode('utf-8'), newline=None)
+
+        first = lines.readline()
+        if first.startswith('{'):
+            self._load_lines(first, lines, path, added_areas)
+        else:
+            self._load_legacy(chain((first,), lines), path, added_areas)
+
+        #
+        # Add the missing areas to the conf
+        #
+        for area_name in self.computer.regions.keys():
+            if area_name not in added_areas:
+                print(
+                    "Warning: Missing area:{}, in profile: {}".format(
+                        area_name, self.name))
+                current_area = self.computer.regions[area_name]
+                self.add_area(current_area)
+                self.add_zone(ZoneData(current_area.regionId,
+                                       self.computer.default_mode,
+                                       current_area,
+                                       self.computer.default_color,
+                                       self.computer.default_color
+                                       ))
+
+        #
+        # Add the configuration
+        #
+        profiles[self.name] = self
+
+    def _add_loaded_area(self, area_name, added_areas):
+        if area_name in self.computer.regions.keys():
+            added_areas.append(area_name)
+            current_area = self.computer.regions[area_name]
+            self.add_area(current_area)
+            return current_area
+
+        print(
+            "Warning: Wrong area name: {}, missing in dict: ".format(
+                area_name, self.computer.regions))
+        return False
+
+    def _load_lines(self, header, lines, path, added_areas):
+        header = _read_header(header)
+        self.name = _profile_name(header['name'], path)
+        self.set_speed(header.get('speed', self.speed))
+
+        # The colors already checked, most of them are repeated
+        colors = set()
+
+        for number, line in enumerate(lines, 2):
+            if not line.strip():
+                continue
+
+            try:
+                entry = json.loads(line)
+                area_name = entry['area']
+                zones = entry['zones']
+                power = entry.get('power')
+            except (ValueError, KeyError, TypeError, AttributeError):
+                raise ProfileError("wrong line {}".format(number))
+
+            if power is None:
+                current_area = self._add_loaded_area(area_name, added_areas)
+                if not current_area:
+                    continue
+
+                area_data = self.area[current_area.name]
+
+            elif power in self.computer.suportedMode.keys() and power != 'normal' \
+                    and area_name in self.computer.regions.keys():
+                current_area = self.computer.regions[area_name]
+                area_data = self.add_power_area(power, current_area)
+
+            else:
+                print("Warning: Wrong power mode `{}` or area `{}`, in profile: {}".format(
+                    power, area_name, self.name))
+                continue
+
+            for zone in zones:
+                try:
+                    mode, color1, color2 = zone
+                    valid = mode in MODES and (color1 in colors or _COLOR.match(color1)) and (
+                        color2 in colors or _COLOR.match(color2))
+                except (ValueError, TypeError):
+                    valid = False
+
+                if not valid:
+                    print("Warning: Wrong zone `{}` of the area `{}`, in profile: {}".format(
+                        zone, area_name, self.name))
+                    continue
+
+                colors.add(color1)
+                colors.add(color2)
+                area_data.add_zone(ZoneData(current_area.regionId, mode, current_area, color1, color2))
+
+    def _load_legacy(self, lines, path, added_areas):
+        current_area, color1, color2, mode, = False, False, False, False
+
         #
         # Parse the configuration file
         #
@@ -161,30 +493,13 @@ class New:
                     var_arg = variables[1]
 
                     if var_name == 'name':
-                        if var_arg == '':
-                            name = os.path.basename(path)
-                        else:
-                            name = var_arg
-
-                        if name.endswith('.cfg'):
-                            name = name[:-4]
-
-                        self.name = name
+                        self.name = _profile_name(var_arg, path)
 
                     elif var_name == 'speed':
                         self.set_speed(var_arg)
 
                     elif var_name == 'area':
-                        area_name = var_arg
-
-                        if area_name in self.computer.regions.keys():
-                            added_areas.append(area_name)
-                            current_area = self.computer.regions[area_name]
-                            self.add_area(current_area)
-                        else:
-                            print(
-                                "Warning: Wrong area name: {}, missing in dict: ".format(
-                                    area_name, self.computer.regions))
+                        current_area = self._add_loaded_area(var_arg, added_areas)
 
                     elif var_name == 'type' or var_name == 'mode':
                         mode = var_arg
@@ -205,28 +520,6 @@ class New:
                                 color2))
                         color1, color2, mode = False, False, False
 
-        #
-        # Add the missing areas to the conf
-        #
-        for area_name in self.computer.regions.keys():
-            if area_name not in added_areas:
-                print(
-                    "Warning: Missing area:{}, in profile: {}".format(
-                        area_name, self.name))
-                current_area = self.computer.regions[area_name]
-                self.add_area(current_area)
-                self.add_zone(ZoneData(current_area.regionId,
-                                       self.computer.default_mode,
-                                       current_area,
-                                       self.computer.default_color,
-                                       self.computer.default_color
-                                       ))
-
-        #
-        # Add the configuration
-        #
-        profiles[self.name] = self
-
     def set_speed(self, speed):
         try:
             speed = int(speed)
@@ -20,13 +20,23 @@
 import Pyro4
 import os
 import pwd
+import threading
 from traceback import format_exc
-from time import time, sleep
+import time
 from common import getuser
 from CCParser import CCParser
 
 # local imports
 import Configuration
+from Animation import Animator, EFFECTS
+from Compiler import CompiledThemes
+from FastServer import FastServer
+from Hotplug import HotplugMonitor, ADD, REMOVE
+from Metrics import Metrics, MetricsExporter
+from Watcher import DirectoryWatcher
+from Pacing import Pacer, PACING_ADAPTIVE
+from Scheduler import DeviceWorker
+from Tracing import Tracer
 from Engine import *
 from Paths import Paths
 from Texts import *
@@ -38,32 +48,103 @@ class ConnectDaemon:
         self.daemon = Pyro4.Daemon()
         self.paths = Paths()
 
-        uri = self.daemon.register(Daemon(self))
+        akbl_daemon = Daemon(self)
+        uri = self.daemon.register(akbl_daemon)
         with open(self.paths.DAEMON_PYRO_PATH, encoding='utf-8', mode='wt') as f:
             f.write(str(uri))
 
+        # Fast path for the command line
+        try:
+            FastServer(akbl_daemon, self.paths.DAEMON_SOCKET_PATH).start()
+        except Exception:
+            print("Warning: It was not possible to listen on the socket `{}`".format(
+                self.paths.DAEMON_SOCKET_PATH))
+            print(format_exc())
+
         self.daemon.requestLoop()
 
 
 class Daemon:
 
+    # Seconds that a connected device has to be claimed
+    RECONNECT_TIMEOUT = 5
+
     def __init__(self, loop_self):
 
-        self._driver = Driver()
-        if self._driver.not_found:
+        self._paths = Paths()
+        _global_ccp = CCParser(
+            self._paths.GLOBAL_CONFIG,
+            'Global alienware-kbl Configuration')
+
+        # The environment variable AKBL_SIMULATE has priority over the configuration.
+        # The model of a simulated device is not cached, it could differ from the real one.
+        #
+        simulate = os.environ.get('AKBL_SIMULATE') or _global_ccp.get_str_defval('simulate', '')
+        self._driver = Driver(
+            simulate,
+            device_cache=None if simulate else self._paths.DEVICE_CACHE_PATH)
+        if self._driver.not_found and getattr(self._driver, 'bus', None) is None:
             print("Warning: The computer is not supported")
             exit(1)
 
+        # Connections and disconnections of the device. The daemon waits
+        # for the device if it is not connected, and when it comes back
+        # the last command that set the lights is executed again.
+        #
+        self._worker = None
+        self._state = None
+        self._device_added = threading.Event()
+        self._added_at = None
+        self._hotplug_stats = {'hotplug': _global_ccp.get_str_defval('hotplug', 'netlink'),
+                               'removals': 0,
+                               'recoveries': 0,
+                               'failed_recoveries': 0,
+                               'last_recovery_time': None,
+                               'max_recovery_time': 0.0}
+
+        if self._hotplug_stats['hotplug'] == 'off':
+            self._hotplug = None
+        else:
+            self._hotplug = HotplugMonitor(
+                self._driver.bus,
+                AllComputers.computerIndex.keys(),
+                self._device_changed,
+                self._hotplug_stats['hotplug'] == 'netlink')
+            self._hotplug.start()
+
+        if self._driver.not_found:
+            if self._hotplug is None:
+                print("Warning: The computer is not supported")
+                exit(1)
+
+            print("Warning: No supported device is connected, waiting for it.")
+            while True:
+                try:
+                    if self._driver.Reconnect():
+                        break
+                except DeviceNotFound as e:
+                    print("Warning: The device could not be claimed, waiting for it: {}".format(e))
+
+                self._device_added.wait()
+                self._device_added.clear()
+
         self.loop_self = loop_self
 
         # Get the user that the daemon should use
         #
-        self._paths = Paths()
-        _global_ccp = CCParser(
-            self._paths.GLOBAL_CONFIG,
-            'Global alienware-kbl Configuration')
         self._user = _global_ccp.get_str_defval('boot_user', 'root')
 
+        # Compiled themes
+        #
+        if _global_ccp.get_bool_defval('persist_compiled_themes', False):
+            compiled_path = self._paths.COMPILED_THEMES_PATH
+        else:
+            compiled_path = None
+
+        self._compiled = CompiledThemes(
+            _global_ccp.get_int_defval('compiled_themes_cache_size', 16),
+            compiled_path)
+
         # Check if the user of the configuration file exists
         #
         try:
@@ -84,52 +165,263 @@ class Daemon:
             self._paths.CONFIGURATION_PATH,
             'GUI Configuration')
 
-        self._controller = Controller(self._driver)
+        self._driver.pacer = Pacer(
+            self._driver.computer_name,
+            _global_ccp.get_str_defval('write_pacing', PACING_ADAPTIVE),
+            self._paths.PACING_PATH)
+
+        if _global_ccp.get_bool_defval('tracing', False):
+            self._driver.tracer = Tracer()
+
+        # The hashes of the blocks saved in a simulated device are not kept,
+        # the next one starts with empty blocks.
+        self._controller = Controller(
+            self._driver,
+            None if simulate else self._paths.SAVED_BLOCKS_PATH)
+        self._controller.incremental_writes = _global_ccp.get_bool_defval('incremental_writes', False)
+
+        # The commands that change the lights are executed by the worker,
+        # the only thread that writes to the device. A pending command is
+        # replaced by a newer call of the same method, and never across
+        # set_lights, switch_lights or stop_animation, which also interrupt
+        # the upload being written.
+        self._worker = DeviceWorker(self._controller)
+
+        self._animator = None
+        self._animation_fps = _global_ccp.get_float_defval('animation_fps', 20)
 
         self._indicator_pyro = False
         self._computer = self._driver.computer
 
-        self.reload_configurations(self._user)
-        self.set_lights(self._user, self._ccp.get_bool_defval('boot', True))
+        self._profiles_path = None
+        self._profiles_watcher = None
 
-    def _iluminate_keyboard(self):
+        self._reload_configurations(self._user)
 
-        self._lights_state = True
+        try:
+            self._set_lights(self._user, self._ccp.get_bool_defval('boot', True))
+        except DeviceTimeout as e:
+            print("Warning: The lights could not be set at boot: {}".format(e))
 
-        self._controller.Set_Loop_Conf(
-            False, self._computer.BLOCK_LOAD_ON_BOOT)
-        self._controller.Add_Speed_Conf(self._theme.speed)
+        # Metrics for the textfile collector of node_exporter
+        #
+        metrics_path = _global_ccp.get_str_defval('metrics_path', '')
+        if metrics_path == '':
+            self._metrics = None
+        else:
+            self._metrics = MetricsExporter(
+                self._collect_metrics,
+                metrics_path,
+                _global_ccp.get_float_defval('metrics_interval', 15))
+            self._metrics.start()
+
+    def _iluminate_keyboard(self, incremental=True):
+        """
+            Apply the current theme. Unless `incremental` is False, only the
+            areas that changed since the last apply are sent to the device.
+        """
+
+        self._lights_state = True
 
         try:  # Patch (#12)
+            mtime = os.path.getmtime(self._theme.path)
             os.utime(self._theme.path, None)
+
+            # The file did not change since it was loaded, so the
+            # watcher must not load it again for the new mtime.
+            if mtime == self._theme.mtime:
+                self._theme.mtime = os.path.getmtime(self._theme.path)
         except Exception as e:
             print(
                 '''Warning: It was not possible to `os.utime` the theme's path: \n{}'''.format(
                     self._theme.path))
             print(format_exc())
 
-        try:
-            self._indicator_send_code(100)
-            self._indicator_pyro.load_profiles(
-                list(
-                    Configuration.profiles.keys()),
-                self.profile_name,
-                self._lights_state)
-        except Exception as e:
-            print(format_exc())
+        if self._indicator_pyro:
+            try:
+                self._indicator_send_code(100)
+                self._indicator_pyro.load_profiles(
+                    list(
+                        Configuration.profiles.keys()),
+                    self.profile_name,
+                    self._lights_state)
+            except Exception as e:
+                print(format_exc())
 
-        for key in sorted(self._theme.area.keys()):
-            area = self._theme.area[key]
-            for zone in area:
-                self._controller.Add_Loop_Conf(zone.regionId,
-                                               zone.mode,
-                                               zone.color1,
-                                               zone.color2)
+        # The areas of the power modes are saved in the device before the
+        # lights are written, since saving a block resets them.
+        self._controller.Write_Power_Blocks(self._theme)
 
-            self._controller.End_Loop_Conf()
+        self._controller.Write_Theme(
+            self._theme, incremental, self._compiled)
 
-        self._controller.End_Transfert_Conf()
-        self._controller.Write_Conf()
+    def _watch_profiles(self):
+        if self._profiles_watcher is not None:
+            self._profiles_watcher.close()
+
+        self._profiles_watcher = DirectoryWatcher(
+            self._profiles_path, self._profiles_changed)
+        self._profiles_watcher.start()
+
+    def _profiles_changed(self, paths):
+        """
+            Called by the watcher, the profiles are updated by the
+            worker so they do not change while they are being used.
+        """
+        self._worker.submit(None, self._update_profiles, paths)
+
+    def _index_profiles(self):
+        """
+            The index and the names of the profiles are only built again when
+            they change, they are served as they are to the clients.
+        """
+        self._profile_index = Configuration.GET_profile_index()
+        self._profile_names = [profile['name'] for profile in self._profile_index]
+
+    def _update_profiles(self, paths):
+        if not Configuration.UPDATE_profiles(self._computer, self._profiles_path, paths):
+            return
+
+        self._index_profiles()
+
+        if self.profile_name in Configuration.profiles.keys():
+            self._theme = Configuration.profiles[self.profile_name]
+
+        if self._indicator_pyro:
+            try:
+                self._indicator_pyro.load_profiles(
+                    list(
+                        Configuration.profiles.keys()),
+                    self.profile_name,
+                    self._lights_state)
+            except Exception as e:
+                print(format_exc())
+
+    def _stop_animation(self):
+        if self._animator is not None:
+            self._animator.stop()
+            self._worker.discard('frame')
+
+    def _device_changed(self, action, ids):
+        """
+            Called by the hotplug monitor when a supported device
+            is connected or disconnected.
+        """
+        driver = self._driver
+
+        if action == REMOVE:
+            if driver.connected and not driver.not_found \
+                    and ids == (driver.vendorId, driver.productId):
+                print("Warning: The device was disconnected.")
+                driver.Device_Removed()
+                self._hotplug_stats['removals'] += 1
+                self._stop_animation()
+
+        elif action == ADD:
+            self._added_at = time.time()
+            if self._worker is None:
+                self._device_added.set()
+            elif not driver.connected:
+                self._worker.submit(None, self._reconnect, preempt=True)
+
+    def _reconnect(self):
+        """
+            Claim the device that was connected again, and execute the
+            last command that set the lights. The device may need some
+            time to be ready, it is tried until RECONNECT_TIMEOUT.
+        """
+        if self._driver.connected:
+            return
+
+        deadline = time.time() + self.RECONNECT_TIMEOUT
+        delay = 0.05
+
+        while True:
+            try:
+                if self._driver.Reconnect():
+                    break
+            except DeviceNotFound as e:
+                error = e
+            else:
+                error = "the device was not found"
+
+            if time.time() + delay > deadline:
+                print("Warning: The device could not be claimed again: {}".format(error))
+                self._hotplug_stats['failed_recoveries'] += 1
+                return
+
+            time.sleep(delay)
+            delay = min(delay * 2, 1)
+
+        self._controller.applied_theme = None
+        self._controller.last_reset = None
+        if self._state is not None:
+            function, args = self._state
+            function(*args)
+
+        recovery = time.time() - self._added_at
+        stats = self._hotplug_stats
+        stats['recoveries'] += 1
+        stats['last_recovery_time'] = recovery
+        stats['max_recovery_time'] = max(stats['max_recovery_time'], recovery)
+
+    def _collect_metrics(self):
+        queue = self._worker.get_stats()
+        wait = self._controller.wait_stats
+        pacer = self._driver.pacer
+        compiled = self._compiled
+        lookups = compiled.hits + compiled.misses
+
+        metrics = Metrics()
+        metrics.add('device_info', 'gauge', 'The computer of the device.',
+                    1, {'computer': self._computer.name})
+        metrics.add('device_connected', 'gauge', 'Whether the device is connected.',
+                    self._driver.connected)
+        metrics.add('device_removals_total', 'counter', 'Disconnections of the device.',
+                    self._hotplug_stats['removals'])
+
+        metrics.add('commands_submitted_total', 'counter', 'Commands received that change the lights.',
+                    queue['submitted'])
+        metrics.add('commands_executed_total', 'counter', 'Commands executed.',
+                    queue['executed'])
+        metrics.add('commands_coalesced_total', 'counter', 'Commands replaced by a newer one.',
+                    queue['coalesced'])
+        metrics.add('commands_cancelled_total', 'counter', 'Commands interrupted by another one.',
+                    queue['cancelled'])
+        metrics.add('command_errors_total', 'counter', 'Commands that failed.',
+                    queue['errors'])
+        metrics.add('queue_depth', 'gauge', 'Commands waiting to be executed.',
+                    queue['depth'])
+        metrics.add('queue_max_depth', 'gauge', 'Most commands that have been waiting at once.',
+                    queue['max_depth'])
+
+        metrics.add('device_transactions_total', 'counter', 'Requests written to the device.',
+                    self._driver.transactions)
+        metrics.add('device_packets_total', 'counter', 'Packets written to the device.',
+                    pacer.packets)
+        metrics.add('device_write_retries_total', 'counter', 'Packets written again after an error.',
+                    pacer.retries)
+
+        metrics.add('wait_loops_total', 'counter', 'Readiness loops (WaitForOk and Reset).',
+                    wait['calls'])
+        metrics.add('wait_iterations_total', 'counter', 'Status checks of the readiness loops.',
+                    wait['iterations'])
+        metrics.add('wait_timeouts_total', 'counter', 'Readiness loops that timed out.',
+                    wait['timeouts'])
+        metrics.add('wait_seconds_total', 'counter', 'Time spent in the readiness loops.',
+                    wait['wait_time'])
+
+        metrics.add('compiled_themes_hits_total', 'counter', 'Themes found in the compiled cache.',
+                    compiled.hits)
+        metrics.add('compiled_themes_misses_total', 'counter', 'Themes that had to be compiled.',
+                    compiled.misses)
+        metrics.add('compiled_themes_hit_ratio', 'gauge', 'Hits of the compiled cache per lookup.',
+                    compiled.hits / lookups if lookups else float('nan'))
+
+        metrics.add_summary('command_seconds', 'Time to execute each command, like applying a profile.',
+                            self._worker.get_execution_time(), 'command')
+
+        return metrics
 
     def _indicator_send_code(self, val):
         if self._indicator_pyro:
@@ -148,12 +440,27 @@ class Daemon:
 
     @Pyro4.expose
     def reload_configurations(self, user, indicator=True, set_default=True):
+        """
+            The profiles are reloaded by the worker, so they
+            do not change while they are being used.
+        """
+        self._worker.submit(None, self._reload_configurations, user, indicator, set_default)
 
+    def _reload_configurations(self, user, indicator=True, set_default=True):
         if user != self._user:
             self._user = user
             self._paths = Paths(user)
 
-        Configuration.LOAD_profiles(self._computer, self._paths.PROFILES_PATH)
+        # The profiles are only loaded again entirely if the
+        # user changed, otherwise only the modified files are.
+        if self._profiles_path != self._paths.PROFILES_PATH:
+            Configuration.LOAD_profiles(self._computer, self._paths.PROFILES_PATH)
+            self._profiles_path = self._paths.PROFILES_PATH
+            self._watch_profiles()
+        else:
+            Configuration.UPDATE_profiles(self._computer, self._profiles_path)
+
+        self._index_profiles()
 
         if set_default:
             _, self.profile_name = Configuration.GET_last_configuration()
@@ -180,17 +487,23 @@ class Daemon:
 
             + 'profile' is the profile name
         """
+        self._worker.submit('set_profile', self._set_profile, user, profile)
+
+    def _set_profile(self, user, profile):
         if user != self._user:
-            self._user = user
-            self._paths = Paths(user)
+            self._reload_configurations(user, False, False)
 
-        self.reload_configurations(user, False, False)
+        # The profile may be new and its file not seen by the watcher yet
+        if profile not in Configuration.profiles.keys():
+            self._update_profiles(None)
 
         if profile in Configuration.profiles.keys():
+            self._state = (self._set_lights, (user, True))
+            self._stop_animation()
             self._theme = Configuration.profiles[profile]
             self.profile_name = profile
-            self._iluminate_keyboard()
-            self._iluminate_keyboard()
+            self._iluminate_keyboard(False)
+            self._iluminate_keyboard(False)
 
     @Pyro4.expose
     def switch_lights(self, user):
@@ -198,10 +511,13 @@ class Daemon:
             If the lights are on, put them off
             or if the lights are off put them on
         """
+        self._worker.submit(None, self._switch_lights, user, preempt=True)
+
+    def _switch_lights(self, user):
         if self._lights_state:
-            self.set_lights(user, False)
+            self._set_lights(user, False)
         else:
-            self.set_lights(user, True)
+            self._set_lights(user, True)
 
     @Pyro4.expose
     def set_lights(self, user, state):
@@ -210,6 +526,12 @@ class Daemon:
 
             + 'state' can be a boolean or a string
         """
+        self._worker.submit(None, self._set_lights, user, state, preempt=True)
+
+    def _set_lights(self, user, state):
+        self._state = (self._set_lights, (user, state))
+        self._stop_animation()
+
         if state in (False, 'False', 'false'):
 
             keep_alive_zones = self._ccp.get_str_defval(
@@ -245,7 +567,7 @@ class Daemon:
             self._indicator_send_code(150)
         else:
             if user != self._user:
-                self.reload_configurations(user)
+                self._reload_configurations(user)
 
             self._iluminate_keyboard()
 
@@ -263,6 +585,9 @@ class Daemon:
               If both arguments are used, both arguments must have
               the same number of items.
         """
+        self._worker.submit('set_colors', self._set_colors, mode, speed, colors1, colors2)
+
+    def _set_colors(self, mode, speed, colors1, colors2=None):
 
         if mode not in ('fixed', 'morph', 'blink'):
             print("Warning: Wrong mode", mode)
@@ -290,26 +615,105 @@ class Daemon:
             print("Warning: The colors list do not have the same lenght")
             return
 
+        self._state = (self._set_colors, (mode, speed // 256, colors1, colors2))
+        self._stop_animation()
         self._lights_state = True
-        self._controller.Set_Loop_Conf(
-            False, self._computer.BLOCK_LOAD_ON_BOOT)
-        self._controller.Add_Speed_Conf(speed)
 
-        for zone in self._computer.regions.keys():
-            for i in range(len(colors1)):
+        # The same loop for every area, they are merged by Build_Theme
+        blocks = [(key, tuple((region.regionId, mode, color1, color2)
+                              for color1, color2 in zip(colors1, colors2)))
+                  for key, region in sorted(self._computer.regions.items())]
+
+        self._controller.Build_Theme(speed, blocks)
+        self._controller.Write_Conf()
+
+    @Pyro4.expose
+    def start_animation(self, effect, fps=None, *args):
+        """
+            Animate the lights until another command changes them.
 
-                self._controller.Add_Loop_Conf(
-                    self._computer.regions[zone].regionId, mode, colors1[i], colors2[i])
+            + The available effects are: 'breathing', 'wave', 'spectrum'
 
-            self._controller.End_Loop_Conf()
+            + fps is the number of frames per second, by default the
+              `animation_fps` of the global configuration.
 
-        self._controller.End_Transfert_Conf()
-        self._controller.Write_Conf()
+            + args are passed to the effect: 'breathing' takes a color and a
+              period, 'wave' two colors and a period, 'spectrum' a period.
+        """
+        if effect not in EFFECTS:
+            print("Warning: Wrong effect", effect)
+            return False
+
+        try:
+            effect = EFFECTS[effect](*args)
+        except Exception:
+            print("Warning: Wrong arguments for the effect", effect)
+            print(format_exc())
+            return False
+
+        if fps is None:
+            fps = self._animation_fps
+
+        self._worker.submit('start_animation', self._start_animation, effect, fps)
+
+    def _start_animation(self, effect, fps):
+        self._state = (self._start_animation, (effect, fps))
+        self._stop_animation()
+        self._lights_state = True
+        self._animator = Animator(self._controller, effect, fps, self._worker)
+        self._animator.start()
+
+    @Pyro4.expose
+    def stop_animation(self):
+        self._worker.submit(None, self._stop_animation)
+
+    @Pyro4.expose
+    def get_queue_stats(self):
+        """
+            Return the depth of the command queue, the number of commands
+            dropped because a newer one replaced them and the average
+            time that the commands wait before being executed.
+        """
+        return self._worker.get_stats()
+
+    @Pyro4.expose
+    def get_animation_stats(self):
+        """
+            Return the achieved frames per second, the dropped frames and
+            the CPU usage of the current (or last) animation.
+        """
+        if self._animator is None:
+            return {}
+
+        return self._animator.get_stats()
 
     """
         Bindings for the graphical interphase
     """
 
+    @Pyro4.expose
+    def get_profile_index(self, user):
+        """
+            Return the name, path, mtime, computer and number of zones of
+            each profile, sorted by name. Return False if `user` is not the
+            user whose profiles are loaded.
+        """
+        if user != self._user:
+            return False
+
+        return self._profile_index
+
+    @Pyro4.expose
+    def get_profile_names(self, user):
+        """
+            Return the sorted names of the profiles. Return False if
+            `user` is not the user whose profiles are loaded.
+        """
+        if user != self._user:
+            return False
+
+        return self._profile_names
+
     @Pyro4.expose
     def get_computer_name(self):
         return self._driver.computer.name
@@ -319,12 +723,45 @@ class Daemon:
         return (self._computer.name, self._driver.vendorId,
                 self._driver.productId, str(self._driver.dev))
 
+    @Pyro4.expose
+    def get_stats(self, recent=0):
+        """
+            Return the histograms of the time to write each command and of
+            the readiness loops, if the tracing is enabled, with the
+            `recent` last packets written and the metrics of the loops.
+        """
+        if self._driver.tracer is None:
+            tracing = {'enabled': False}
+        else:
+            tracing = self._driver.tracer.get_stats(recent)
+
+        return {'tracing': tracing,
+                'wait': dict(self._controller.wait_stats)}
+
+    @Pyro4.expose
+    def get_session_state(self):
+        """
+            Return the state of the USB session with the device, the number
+            of disconnections and the seconds between the connection of the
+            device and the moment that its lights were set again.
+        """
+        state = self._driver.Get_Session_State()
+        state.update(self._hotplug_stats)
+        return state
+
+    def _forget_applied_theme(self):
+        self._controller.applied_theme = None
+        self._controller.last_reset = None
+
     @Pyro4.expose
     def modify_lights_state(self, bool):
         """
             This method does not changes the lights of the keyboard,
             it only updates the daemon and the indicator
         """
+        # The lights were changed by someone else, the next apply must be full
+        self._worker.submit(None, self._forget_applied_theme)
+
         if bool in (False, 'False', 'false'):
             self._lights_state = False
             self._indicator_send_code(150)
@@ -16,27 +16,77 @@
 #   along with this program; if not, write to the Free Software Foundation,
 #   Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301  USA.
 
-import sys
-import os
-from common import getuser
+"""
+    The modules are imported by the arguments that need them,
+    so toggling the lights does not load the rest of the program.
+"""
 
-# local imports
-from Paths import Paths
-PATHS = Paths()
-from Texts import *
+import sys
 
 
-def send_command(command, *args):
-    AKBLConnection = AlienwareKBL()
+def send_command(connection, command, *args):
+    import os
+    from Paths import Paths
 
-    if not os.path.exists(PATHS.SYSTEMCTL_PATH) or not AKBLConnection.ping():
+    if not os.path.exists(Paths().SYSTEMCTL_PATH):
+        from Texts import TEXT_ERROR_DAEMON_OFF
         print(TEXT_ERROR_DAEMON_OFF)
     else:
-        AKBLConnection._command(command, *args)
+        connection._command(command, *args)
+
+
+def get_pyro_connection():
+    """
+        Return an AlienwareKBL connected to the daemon, or None.
+    """
+    try:
+        # This exception is used when pyro
+        # is not installed.
+        from AlienwareKBL import AlienwareKBL
+
+        connection = AlienwareKBL()
+        if connection.ping():
+            return connection
+    except:
+        pass
+
+    return None
+
+
+# Arguments that are first sent through the socket of
+# the daemon (FastClient), without loading Pyro4.
+_FAST_COMMANDS = {
+    '--daemon-is-on': 'ping',
+    '--off': 'off',
+    '--on': 'on',
+    '--change': 'change',
+    '--set-profile': 'profile'}
+
+
+def _send_fast_command(arg, args):
+    """
+        Return True if the command was handled through the socket.
+    """
+    import FastClient
+
+    command = _FAST_COMMANDS[arg]
+    if command == 'profile':
+        if len(args) != 1:
+            return False
+    else:
+        args = []
+
+    response = FastClient.send(command, *args)
+
+    if command == 'ping':
+        if response:
+            print(True)
+        return bool(response)
+
+    return response is not None
 
 
 if __name__ == '__main__':
-    import pwd
 
     total = len(sys.argv)
 
@@ -44,15 +94,22 @@ if __name__ == '__main__':
         arg = str(sys.argv[1])
 
         if arg == '--help' or arg == '-h':
+            from Texts import TEXT_HELP
             print(TEXT_HELP)
 
         elif arg == '--license' or arg == '-l':
+            from Texts import TEXT_LICENSE
             print(TEXT_LICENSE)
 
         elif arg in ('--set-boot-user', '--get-boot-user'):
+            import pwd
+            from common import getuser
             from CCParser import CCParser
+            from Paths import Paths
+            from Texts import TEXT_NON_LINUX_USER, TEXT_ONLY_ROOT
+
             ccp = CCParser(
-                PATHS.GLOBAL_CONFIG,
+                Paths().GLOBAL_CONFIG,
                 'Global alienware-kbl Configuration')
 
             if arg == '--set-boot-user':
@@ -73,36 +130,44 @@ if __name__ == '__main__':
             else:
                 print(ccp.get_str_defval('boot_user', 'root'))
 
-        else:
-            try:
-                # This exception is used when pyro
-                # is not installed.
-                from AlienwareKBL import AlienwareKBL
+        elif arg in _FAST_COMMANDS and _send_fast_command(arg, sys.argv[2:]):
+            pass
 
-                AKBLConnection = AlienwareKBL()
+        elif arg == '--daemon-is-on':
+            print(get_pyro_connection() is not None)
 
-                if AKBLConnection.ping():
-                    AKBL_DAEMON = True
-                else:
-                    AKBL_DAEMON = False
-            except:
-                AKBL_DAEMON = False
+        elif arg == '--stats':
+            connection = get_pyro_connection()
+
+            if connection is None:
+                from Texts import TEXT_ERROR_DAEMON_OFF
+                print(TEXT_ERROR_DAEMON_OFF)
+            else:
+                from Tracing import format_stats
 
-            if arg == '--daemon-is-on':
-                print(AKBL_DAEMON)
+                stats = connection.get_stats()
+                if stats:
+                    print(format_stats(stats))
 
-            elif arg in ('--off', '--on', '--change', '--set-profile') and not AKBL_DAEMON:
+        elif arg in _FAST_COMMANDS:
+            connection = get_pyro_connection()
+
+            if connection is None:
+                from Texts import TEXT_ERROR_DAEMON_OFF
                 print(TEXT_ERROR_DAEMON_OFF)
 
             elif arg == '--off':
-                send_command('set_lights', False)
+                send_command(connection, 'set_lights', False)
             elif arg == '--on':
-                send_command('set_lights', True)
+                send_command(connection, 'set_lights', True)
             elif arg == '--change':
-                send_command('switch_lights')
+                send_command(connection, 'switch_lights')
             elif arg == '--set-profile':
-                send_command('set_profile', sys.argv[2])
-            else:
-                print(TEXT_WRONG_ARGUMENT)
+                send_command(connection, 'set_profile', sys.argv[2])
+
+        else:
+            from Texts import TEXT_WRONG_ARGUMENT
+            print(TEXT_WRONG_ARGUMENT)
     else:
+        from Texts import TEXT_WRONG_ARGUMENT
         print(TEXT_WRONG_ARGUMENT)
@@ -20,17 +20,53 @@
 
 import sys
 import os
+import json
 import time
-import usb
-from copy import copy
+import struct
+import hashlib
+
+try:
+    import usb
+    from usb.core import USBError
+except ImportError:
+    # pyusb is not needed to use the simulated device
+    usb = None
+    from Simulator import USBError
 
 # local imports
+from CCParser import CCParser
+from Compiler import merge_blocks
 from Computers import AllComputers, CommonConf
+from Pacing import Pacer
+
+
+class DeviceNotFound(Exception):
+    pass
+
+
+class DeviceTimeout(TimeoutError):
+
+    """
+        The device did not become ready before the deadline.
+    """
+
+    def __init__(self, message, iterations, wait_time):
+        super().__init__(message)
+        self.iterations = iterations
+        self.wait_time = wait_time
+
+
+class TransactionCancelled(Exception):
+
+    """
+        The `cancel` event of the driver was set while a request was
+        being written. The device may have received part of it.
+    """
 
 
 class Driver(AllComputers):
 
-    def __init__(self):
+    def __init__(self, simulate=None, device_cache=None):
         # Define I/O Reqquest types
         self.SEND_REQUEST_TYPE = 0x21
         self.SEND_REQUEST = 0x09
@@ -41,6 +77,55 @@ class Driver(AllComputers):
         self.READ_VALUE = 0x101
         self.READ_INDEX = 0x0
 
+        # When True, the Constructors build the legend of each packet
+        self.trace = False
+
+        # A Tracing.Tracer that measures the transfers, or None
+        self.tracer = None
+
+        # Requests written with `WriteDevice`
+        self.transactions = 0
+
+        # Decides the time to wait before writing each packet
+        self.pacer = Pacer()
+
+        # Times that a packet is written before giving up
+        self.WRITE_ATTEMPTS = 4
+
+        # A threading.Event, when it is set the request being written is
+        # interrupted at the next packet with TransactionCancelled.
+        self.cancel = None
+
+        # USB session: the device is configured once by `Take_over`, and
+        # only again after an USB error marks the session as lost.
+        self.claimed = False
+        self.lost = False
+        self.claims = 0
+        self.reclaims = 0
+
+        # False from the moment that the device was disconnected until
+        # `Reconnect` finds it again, meanwhile every write fails at once.
+        self.connected = True
+
+        # File where the model that was found is kept, so the next
+        # drivers of this boot do not need to look for it.
+        self.device_cache = device_cache
+
+        # The bus where the device is looked for: pyusb, or the simulated
+        # bus if the name of the computer to simulate is given.
+        if simulate is None:
+            simulate = os.environ.get('AKBL_SIMULATE', '')
+
+        if simulate:
+            from Simulator import SimulatedBus
+            self.bus = SimulatedBus.for_computer(simulate)
+        elif usb is None:
+            print("Warning: pyusb is not installed.")
+            self.not_found = True
+            return
+        else:
+            self.bus = usb.core
+
         # Initializing !
         # find our device
         if not self.FindDevice():
@@ -70,7 +155,7 @@ class Driver(AllComputers):
                 return False
 
             try:
-                dev = usb.core.find(idVendor=id_vendor, idProduct=id_product)
+                dev = self.bus.find(idVendor=id_vendor, idProduct=id_product)
 
                 if dev is not None:
 
@@ -79,6 +164,7 @@ class Driver(AllComputers):
                     self.productId = id_product
                     self.dev = dev
                     self.computer = CommonConf()
+                    self.claimed = False
 
                     self.Take_over()
                     return True
@@ -90,53 +176,258 @@ class Driver(AllComputers):
         #
         #   Normal initialization
         #
-        for computer in sorted(self.computerList.keys()):
-            dev = usb.core.find(
-                idVendor=self.computerList[computer].vendorId,
-                idProduct=self.computerList[computer].productId)
+        if self._find_cached_device():
+            return True
+
+        # Walk the bus once, when several supported devices are connected
+        # the one of the first computer by name is used, like before.
+        found = None
+        for dev in self.bus.find(find_all=True):
+            names = self.computerIndex.get((dev.idVendor, dev.idProduct))
+            if names and (found is None or names[0] < found[0]):
+                found = (names[0], dev)
+
+        if found is None:
+            return False
+
+        computer, dev = found
 
-            if dev is not None:
+        # This hack was made to differenciate the M14XR1 from the R2
+        if computer == 'M14XR1' and 'Gaming' in str(dev):
+            computer = 'M14XR2'
 
-                # This hack was made to differenciate the M14XR1 from the R2
-                if computer == 'M14XR1' and 'Gaming' in str(dev):
-                    computer = 'M14XR2'
+        self._set_device(computer, dev)
+        self._write_device_cache()
 
-                self.computer_name = computer
-                self.computer = self.computerList[computer].computer
-                self.vendorId = self.computerList[computer].vendorId
-                self.productId = self.computerList[computer].productId
-                self.dev = dev
+        return True
+
+    def _set_device(self, computer, dev):
+        self.computer_name = computer
+        self.computer = self.computerList[computer].computer
+        self.vendorId = self.computerList[computer].vendorId
+        self.productId = self.computerList[computer].productId
+        self.dev = dev
+        self.claimed = False
+
+    def _find_cached_device(self):
+        """
+            Look only for the device of the model in `device_cache`.
+        """
+        if self.device_cache is None:
+            return False
+
+        try:
+            with open(self.device_cache, encoding='utf-8', mode='rt') as f:
+                cache = json.load(f)
+
+            item = self.computerList[cache['computer']]
+            if (item.vendorId, item.productId) != (cache['vendorId'], cache['productId']):
+                return False
+        except (OSError, ValueError, KeyError, TypeError):
+            return False
+
+        dev = self.bus.find(idVendor=item.vendorId, idProduct=item.productId)
+        if dev is None:
+            return False
 
-                return True
+        self._set_device(item.name, dev)
+        return True
+
+    def _write_device_cache(self):
+        if self.device_cache is None:
+            return
+
+        cache = {'computer': self.computer_name,
+                 'vendorId': self.vendorId,
+                 'productId': self.productId}
 
-        return False
+        try:
+            temp_path = '{}.{}'.format(self.device_cache, os.getpid())
+            with open(temp_path, encoding='utf-8', mode='wt') as f:
+                json.dump(cache, f)
+            os.replace(temp_path, self.device_cache)
+        except OSError:
+            pass  # only root can write in /run
+
+    def WriteDevice(self, request, check_status=True):
+        """
+            Send the packets of `request`, which can be a Constructor or
+            a bytes-like object made of one or more packets. If
+            `check_status` is False, the pacer does not read the status
+            after the packets, like while the device runs its loops.
+        """
+        if not isinstance(request, Constructor):
+            view = memoryview(request)
+            length = self.computer.DATA_LENGTH
+            request = [view[offset:offset + length]
+                       for offset in range(0, len(view), length)]
 
-    def WriteDevice(self, MSG):
-        if len(MSG[0].packet) == self.computer.DATA_LENGTH:
-            for msg in MSG:
-                time.sleep(0.02)
+        if not self.connected:
+            raise DeviceNotFound("The device is disconnected")
+
+        cancel = self.cancel
+        check_status = check_status and self.pacer.check_status
+        self.transactions += 1
+
+        for packet in request:
+            if cancel is not None and cancel.is_set():
+                raise TransactionCancelled("The request was cancelled")
+
+            self._write_packet(packet, check_status)
+
+        self.pacer.end_transaction()
+
+    def _write_packet(self, packet, check_status):
+        """
+            Write a packet, and trace the time of the transfer
+            that succeeded without the delay of the pacer.
+        """
+        pacer = self.pacer
+        tracer = self.tracer
+
+        for attempt in range(1, self.WRITE_ATTEMPTS + 1):
+            pacer.wait()
+            if tracer is not None:
+                start = time.perf_counter()
+
+            try:
                 self.dev.ctrl_transfer(
                     self.SEND_REQUEST_TYPE,
                     self.SEND_REQUEST,
                     self.SEND_VALUE,
                     self.SEND_INDEX,
-                    msg.packet)
-        else:
-            self.dev.ctrl_transfer(
-                self.SEND_REQUEST_TYPE,
-                self.SEND_REQUEST,
-                self.SEND_VALUE,
-                self.SEND_INDEX,
-                MSG)
+                    packet)
+            except USBError:
+                self.Session_Lost()
+                if attempt == self.WRITE_ATTEMPTS:
+                    raise
+                pacer.failure()
+                self.Take_over()
+                continue
+
+            if tracer is not None:
+                tracer.write(self.computer, packet, time.perf_counter() - start, attempt)
+
+            # The status is not checked after the commands that change it
+            checked = check_status and packet[1] not in (
+                self.computer.COMMAND_GET_STATUS,
+                self.computer.COMMAND_TRANSMIT_EXECUTE,
+                self.computer.COMMAND_RESET)
+
+            if checked:
+                status = self._wait_while_busy()
+                if status == self.computer.STATE_UNKNOWN_COMMAND \
+                        and attempt < self.WRITE_ATTEMPTS:
+                    # The packet was garbled, send it again
+                    pacer.failure()
+                    continue
+
+            pacer.success(checked)
+            return
+
+    def _wait_while_busy(self):
+        """
+            Read the status of the device until it is not busy, and return it.
+            This is used by the adaptive pacing to know if the last packet
+            was sent too fast.
+        """
+        status_packet = bytes([self.computer.START_BYTE,
+                               self.computer.COMMAND_GET_STATUS]) \
+            + bytes([self.computer.FILL_BYTE]) * (self.computer.DATA_LENGTH - 2)
+        tracer = self.tracer
+
+        for attempt in range(1, self.WRITE_ATTEMPTS + 1):
+            if tracer is not None:
+                start = time.perf_counter()
+
+            try:
+                self.dev.ctrl_transfer(
+                    self.SEND_REQUEST_TYPE,
+                    self.SEND_REQUEST,
+                    self.SEND_VALUE,
+                    self.SEND_INDEX,
+                    status_packet)
+
+                if tracer is not None:
+                    tracer.write(self.computer, status_packet, time.perf_counter() - start, 1)
+
+                # The read is traced by ReadDevice
+                status = self.ReadDevice(None)[0]
+            except USBError:
+                self.Session_Lost()
+                if attempt == self.WRITE_ATTEMPTS:
+                    raise
+                self.pacer.failure()
+                self.Take_over()
+                self.pacer.wait()
+                continue
+
+            if status != self.computer.STATE_BUSY:
+                return status
 
-    def ReadDevice(self, msg):
-        msg = self.dev.ctrl_transfer(
-            self.READ_REQUEST_TYPE, self.READ_REQUEST, self.READ_VALUE, self.READ_INDEX, len(
-                msg[0].packet))
+            self.pacer.failure(busy=True)
+            self.pacer.wait()
 
-        return msg
+        return status
+
+    def ReadDevice(self, request):
+        if not self.connected:
+            raise DeviceNotFound("The device is disconnected")
+
+        tracer = self.tracer
+
+        for attempt in (1, 2):
+            if tracer is not None:
+                start = time.perf_counter()
+
+            try:
+                data = self.dev.ctrl_transfer(
+                    self.READ_REQUEST_TYPE,
+                    self.READ_REQUEST,
+                    self.READ_VALUE,
+                    self.READ_INDEX,
+                    self.computer.DATA_LENGTH)
+            except USBError:
+                self.Session_Lost()
+                if attempt == 2:
+                    raise
+                self.Take_over()
+                continue
+
+            if tracer is not None:
+                tracer.read(time.perf_counter() - start)
+            return data
+
+    def Take_over(self, force=False):
+        """
+            Claim the device, unless it is already claimed.
+        """
+        if self.claimed and not force:
+            return
+        elif not self.connected:
+            raise DeviceNotFound("The device is disconnected")
 
-    def Take_over(self):
+        try:
+            self._configure()
+        except USBError as e:
+            # The device may have been re-enumerated,
+            # so the current handle is no longer valid.
+            dev = self.bus.find(idVendor=self.vendorId, idProduct=self.productId)
+            if dev is None:
+                raise DeviceNotFound(
+                    "The device is no longer connected. Error: {}".format(e))
+
+            self.dev = dev
+            self._configure()
+
+        self.claims += 1
+        if self.lost:
+            self.reclaims += 1
+            self.lost = False
+
+        self.claimed = True
+
+    def _configure(self):
         try:
             self.dev.set_configuration()
         except:
@@ -146,23 +437,105 @@ class Driver(AllComputers):
             except Exception as e:
                 raise DeviceNotFound(
                     "Can't set the configuration. Error: {}".format(e))
-                sys.exit(1)
+
+    def Device_Removed(self):
+        """
+            Called when the device was disconnected.
+        """
+        self.connected = False
+        self.Session_Lost()
+
+    def Reconnect(self):
+        """
+            Look for the device again and claim it. Return False if it
+            was not found, raise DeviceNotFound if it could not be claimed.
+        """
+        if not self.FindDevice():
+            return False
+
+        self.not_found = False
+        self.connected = True
+        self.Take_over(force=True)
+
+        return True
+
+    def Session_Lost(self):
+        """
+            Called after an USB error, the next write will claim the device again.
+        """
+        self.claimed = False
+        self.lost = True
+
+    def Get_Session_State(self):
+        return {'connected': self.connected,
+                'claimed': self.claimed,
+                'lost': self.lost,
+                'claims': self.claims,
+                're-claimed': self.reclaims}
 
 
 class Controller:
 
-    def __init__(self, driver):
+    # Readiness handshake: the status is read again after WAIT_FIRST_DELAY,
+    # then the delay doubles up to WAIT_MAX_DELAY. DeviceTimeout is raised
+    # if the device is not ready after WAIT_TIMEOUT seconds.
+    WAIT_FIRST_DELAY = 0.005
+    WAIT_MAX_DELAY = 0.25
+    WAIT_TIMEOUT = 5
+
+    def __init__(self, driver, saved_blocks_path=None):
         self.driver = driver
 
+        # Metrics of `WaitForOk` and `Reset`
+        self.wait_stats = {'calls': 0,
+                           'iterations': 0,
+                           'wait_time': 0.0,
+                           'timeouts': 0,
+                           'last_iterations': 0,
+                           'last_wait_time': 0.0}
+
+        # (speed, {area name: zones}) of the last theme written with
+        # `Write_Theme`, or None if the lights may have changed since.
+        self.applied_theme = None
+
+        # If True, `Write_Theme` only sends the areas that changed, without
+        # resetting the lights. It is the key `incremental_writes` of the
+        # global configuration, off by default: it relies on the firmware
+        # keeping the loops of the regions that are not sent.
+        self.incremental_writes = False
+
+        # The reset command last sent by `WaitForOk` or `Reset`, or None if
+        # it is unknown. `Reset` is skipped if the device is ready after it.
+        self.last_reset = None
+
+        # <computer>_block_<block>: sha1 of the packets saved in the block by
+        # `Write_Power_Blocks`, or '' if they are unknown. The hashes are kept
+        # in `saved_blocks_path`, so the blocks are not saved again after a reboot.
+        self.saved_blocks = {}
+        self.block_stats = {'saved': 0, 'skipped': 0}
+
+        if saved_blocks_path is not None:
+            self._blocks_ccp = CCParser(saved_blocks_path, 'Saved Blocks')
+        else:
+            self._blocks_ccp = None
+
     def Bye(self):
         sys.exit(0)
 
     def Set_Loop(self, action):
+        self.applied_theme = None
         self.WaitForOk()
         self.driver.WriteDevice(action)
 
     def Set_Loop_Conf(self, Save=False, block=0x01):
-        self.request = Constructor(self.driver, Save, block)
+        self.applied_theme = None
+
+        # Usually one loop per region, plus the speed and the end of transfert
+        size = len(self.driver.computer.regions) * 2 + 4
+        if Save:
+            size *= 2
+
+        self.request = Constructor(self.driver, Save, block, size)
 
     def Add_Loop_Conf(self, area, mode, color1, color2=None):
 
@@ -191,12 +564,168 @@ class Controller:
     def End_Transfert_Conf(self):
         self.request.End_Transfert()
 
-    def Write_Conf(self):
-        self.WaitForOk()
+    def Write_Conf(self, reset=True):
+        self.WaitForOk(reset)
         self.driver.WriteDevice(self.request)
 
+    @staticmethod
+    def Theme_Blocks(areas):
+        """
+            Return the (area name, zones) of `areas`, a dict of area
+            name: Configuration.AreaData, sorted by area name.
+        """
+        return [(key, tuple((zone.regionId, zone.mode, zone.color1, zone.color2)
+                            for zone in areas[key]))
+                for key in sorted(areas.keys())]
+
+    def Build_Theme(self, speed, blocks, save=False, block=None, merge=True):
+        """
+            Return a Constructor with the loops of `blocks`, a list
+            of (area name, zones) like the ones of `Write_Theme`.
+            If `save` is True, the loops are saved in `block`. Unless
+            `merge` is False, the areas with the same loop are sent
+            together (see Compiler.merge_blocks).
+        """
+        if block is None:
+            block = self.driver.computer.BLOCK_LOAD_ON_BOOT
+
+        if merge:
+            blocks = merge_blocks(blocks, self.driver.computer)
+
+        # Building the packets does not change the lights
+        applied = self.applied_theme
+        self.Set_Loop_Conf(save, block)
+        self.applied_theme = applied
+        self.Add_Speed_Conf(speed)
+
+        for _, zones in blocks:
+            for regionId, mode, color1, color2 in zones:
+                self.Add_Loop_Conf(regionId, mode, color1, color2)
+
+            self.End_Loop_Conf()
+
+        self.End_Transfert_Conf()
+        return self.request
+
+    def Write_Theme(self, theme, incremental=True, cache=None):
+        """
+            Write the areas of a theme (Configuration.New).
+
+            If `incremental` is True and the last theme written had the same
+            speed and areas, nothing is written if no zone changed. Otherwise
+            the lights are reset and all the theme is written, unless
+            `incremental_writes` is True: then only the loops of the areas
+            whose zones changed are transmitted, without resetting the lights,
+            expecting the firmware to keep the loops of the other regions. The
+            theme is written entirely if the status of the device is neither
+            ready nor busy.
+
+            `cache` can be a Compiler.CompiledThemes, it is used to
+            get the packets of the theme when all of it is written.
+        """
+        blocks = self.Theme_Blocks(theme.area)
+
+        applied = self.applied_theme
+        full = not incremental or applied is None or applied[0] != theme.speed \
+            or sorted(applied[1].keys()) != [key for key, _ in blocks]
+
+        if not full:
+            changed = [(key, zones)
+                       for key, zones in blocks if applied[1][key] != zones]
+            if changed == []:
+                return
+
+            if self.incremental_writes and self.Get_Status() in (
+                    self.driver.computer.STATE_READY, self.driver.computer.STATE_BUSY):
+                blocks = changed
+            else:
+                full = True
+
+        if not full:
+            request = self.Build_Theme(theme.speed, blocks)
+        elif cache is not None:
+            request = cache.get(
+                theme,
+                self.driver.computer,
+                lambda: self.Build_Theme(theme.speed, blocks))
+        else:
+            request = self.Build_Theme(theme.speed, blocks)
+
+        self.applied_theme = None
+        if full:
+            self.WaitForOk()
+            self.driver.WriteDevice(request)
+            self.applied_theme = (theme.speed, dict(blocks))
+        else:
+            # The device stays busy while it runs the loops, so its
+            # status does not tell if the packets are sent too fast.
+            self.driver.WriteDevice(request, check_status=False)
+            applied[1].update(blocks)
+            self.applied_theme = applied
+
+    def Write_Power_Blocks(self, theme):
+        """
+            Save the areas of the power modes of a theme (Configuration.New.power)
+            in their blocks, the firmware shows them when the power mode of the
+            computer changes. The blocks whose packets have the hash of the last
+            ones saved are skipped, return the number of blocks written.
+
+            The device is reset before each block, so the lights must be
+            written again if a block was saved.
+        """
+        written = 0
+
+        for key in sorted(theme.power.keys()):
+            power_mode = self.driver.computer.suportedMode.get(key)
+            if power_mode is None:
+                continue
+
+            request = self.Build_Theme(
+                theme.speed, self.Theme_Blocks(theme.power[key]), True, power_mode.block)
+            digest = hashlib.sha1(request.getbuffer()).hexdigest()
+
+            block_key = '{}_block_{}'.format(self.driver.computer.name, power_mode.block)
+            if self._Saved_Block(block_key) == digest:
+                self.block_stats['skipped'] += 1
+                continue
+
+            # If the upload fails, the content of the block is unknown
+            self._Set_Saved_Block(block_key, '')
+
+            self.applied_theme = None
+            self.WaitForOk()
+            self.driver.WriteDevice(request)
+
+            self._Set_Saved_Block(block_key, digest)
+            self.block_stats['saved'] += 1
+            written += 1
+
+        return written
+
+    def _Saved_Block(self, block_key):
+        if block_key not in self.saved_blocks:
+            if self._blocks_ccp is not None:
+                self.saved_blocks[block_key] = self._blocks_ccp.get_str_defval(block_key, '')
+            else:
+                self.saved_blocks[block_key] = ''
+
+        return self.saved_blocks[block_key]
+
+    def _Set_Saved_Block(self, block_key, digest):
+        if self._Saved_Block(block_key) == digest:
+            return
+
+        self.saved_blocks[block_key] = digest
+
+        if self._blocks_ccp is not None:
+            try:
+                self._blocks_ccp.write(block_key, digest)
+            except OSError as e:
+                print("Warning: The hash of the saved block could not be written: {}".format(e))
+
     def Set_Color(self, Area, Color, Save=False, Apply=False, block=0x01):
         """Set the Color of an Area """
+        self.applied_theme = None
 
         request = Constructor(self.driver, Save, block)
         if not isinstance(Area, list):
@@ -225,6 +754,7 @@ class Controller:
             Save=False,
             Apply=False,
             block=0x01):
+        self.applied_theme = None
         self.WaitForOk()
         request = Constructor(self.driver, Save, block)
         if not isinstance(Area, list):
@@ -254,6 +784,7 @@ class Controller:
             Save=False,
             Apply=False,
             block=0x01):
+        self.applied_theme = None
         self.WaitForOk()
         request = Constructor(self.driver, Save, block)
         if not isinstance(Area, list):
@@ -277,56 +808,204 @@ class Controller:
             request.End_Transfert()
             self.driver.WriteDevice(request)
 
-    def WaitForOk(self):
+    def _backoff(self, name):
+        """
+            Generator used by the readiness loops. It yields before each
+            iteration, sleeping with an exponential backoff between them,
+            and raises DeviceTimeout when the deadline is reached. The
+            metrics are updated when it is closed.
+        """
+        start = time.time()
+        deadline = start + self.WAIT_TIMEOUT
+        delay = self.WAIT_FIRST_DELAY
+        iterations = 0
+
+        try:
+            while True:
+                iterations += 1
+                yield iterations
+
+                now = time.time()
+                if now >= deadline:
+                    self.wait_stats['timeouts'] += 1
+                    raise DeviceTimeout(
+                        "{}: the device was not ready after {} iterations and {:.2f} seconds.".format(
+                            name, iterations, now - start),
+                        iterations,
+                        now - start)
+
+                time.sleep(min(delay, deadline - now))
+                delay = min(delay * 2, self.WAIT_MAX_DELAY)
+        finally:
+            wait_time = time.time() - start
+            stats = self.wait_stats
+            stats['calls'] += 1
+            stats['iterations'] += iterations
+            stats['wait_time'] += wait_time
+            stats['last_iterations'] = iterations
+            stats['last_wait_time'] = wait_time
+
+            tracer = getattr(self.driver, 'tracer', None)
+            if tracer is not None:
+                tracer.wait(name, iterations, wait_time)
+
+    def WaitForOk(self, reset=True):
         self.driver.Take_over()
         self.Get_State()
         request = Constructor(self.driver)
-        request.Reset_all()
-        self.driver.WriteDevice(request)
-        while not self.Get_State():
-            request.raz()
-            request.Get_Status()
+        if reset:
             request.Reset_all()
             self.driver.WriteDevice(request)
+            self.last_reset = self.driver.computer.RESET_ALL_LIGHTS_ON
+
+        backoff = self._backoff('WaitForOk')
+        try:
+            for _ in backoff:
+                if self.Get_State():
+                    break
+
+                if reset:
+                    request.raz()
+                    request.Get_Status()
+                    request.Reset_all()
+                    self.driver.WriteDevice(request)
+        finally:
+            backoff.close()
+
         return True
 
-    def Get_State(self):
+    def Cancel_Transaction(self):
+        """
+            Discard with a reset the packets of a transaction
+            that was interrupted before being executed.
+        """
+        self.applied_theme = None
+        self.WaitForOk()
+
+    def Get_Status(self):
+        """
+            Return the status byte of the device.
+        """
         self.driver.Take_over()
         request = Constructor(self.driver)
         request.Get_Status()
         self.driver.WriteDevice(request)
-        msg = self.driver.ReadDevice(request)
-        return msg[0] == self.driver.computer.STATE_READY
+        return self.driver.ReadDevice(request)[0]
+
+    def Get_State(self):
+        return self.Get_Status() == self.driver.computer.STATE_READY
 
     def Reset(self, res_cmd):
+        self.applied_theme = None
         self.driver.Take_over()
         request = Constructor(self.driver)
-        while True:
-            request.Get_Status()
-            self.driver.WriteDevice(request)
-            msg = self.driver.ReadDevice(request)
-            if msg[0] == 0x10:
-                break
-            request.raz()
-            request.Get_Status()
-            request.Reset(res_cmd)
-            self.driver.WriteDevice(request)
-            msg = self.driver.ReadDevice(request)
-            if msg[0] == 0x10:
-                break
+
+        backoff = self._backoff('Reset')
+        try:
+            for _ in backoff:
+                request.Get_Status()
+                self.driver.WriteDevice(request)
+                msg = self.driver.ReadDevice(request)
+                if msg[0] == self.driver.computer.STATE_READY:
+                    # A ready device only needs the reset if another one was
+                    # sent since, like the one that discards an interrupted
+                    # transaction before the lights are turned off.
+                    if self.last_reset == res_cmd:
+                        break
+
+                    request.raz()
+                    request.Reset(res_cmd)
+                    self.driver.WriteDevice(request)
+                    self.last_reset = res_cmd
+                    break
+                request.raz()
+                request.Get_Status()
+                request.Reset(res_cmd)
+                self.driver.WriteDevice(request)
+                self.last_reset = res_cmd
+                msg = self.driver.ReadDevice(request)
+                if msg[0] == self.driver.computer.STATE_READY:
+                    break
+        finally:
+            backoff.close()
+
         return True
 
 
-class Constructor(list):
+class Constructor:
 
-    def __init__(self, driver, save=False, block=0x01):
-        self.raz()
+    """
+        The packets of a transaction are encoded in a single bytearray of
+        `size` * DATA_LENGTH bytes that grows only if more packets are added.
+        Iterating a Constructor gives a memoryview of each packet, so nothing
+        is copied before the packets reach `ctrl_transfer`.
+
+        The legends of the packets are only built if `trace` is True.
+    """
+
+    # The nine bytes of a command: START_BYTE, command, and seven arguments
+    _PACKET = struct.Struct('9B')
+
+    def __init__(self, driver, save=False, block=0x01, size=8, trace=None):
         self.computer = driver.computer
-        self.void = [self.computer.FILL_BYTE] * self.computer.DATA_LENGTH
+        self.length = self.computer.DATA_LENGTH
+        self.fill = self.computer.FILL_BYTE
+        self.void = bytes([self.fill]) * self.length
+        self.arena = bytearray(self.void * max(size, 1))
+        self.count = 0
         self.Id = 0x01
         self.save = save
         self.block = block
 
+        if trace is None:
+            trace = getattr(driver, 'trace', False)
+
+        self.trace = trace
+        self.legends = []
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        view = memoryview(self.arena)
+        for offset in range(0, self.count * self.length, self.length):
+            yield view[offset:offset + self.length]
+
+    def packet(self, index):
+        offset = index * self.length
+        return memoryview(self.arena)[offset:offset + self.length]
+
+    def getbuffer(self):
+        """
+            Return a memoryview of all the packets of the transaction.
+        """
+        return memoryview(self.arena)[:self.count * self.length]
+
+    def _new(self, command, b2, b3, b4, b5, b6, b7, b8):
+        """
+            Write a packet at the end of the arena.
+        """
+        offset = self.count * self.length
+
+        if offset + self.length > len(self.arena):
+            # A new arena is created instead of resizing the current one,
+            # so the memoryviews that were already given remain valid.
+            arena = bytearray(self.void * (self.count * 2))
+            arena[:offset] = self.arena[:offset]
+            self.arena = arena
+
+        elif self.length > 9:
+            self.arena[offset:offset + self.length] = self.void
+
+        self._PACKET.pack_into(
+            self.arena,
+            offset,
+            self.computer.START_BYTE,
+            command,
+            b2, b3, b4, b5, b6, b7, b8)
+
+        self.count += 1
+
     def Save(self, end=False):
         if self.save:
             if not end:
@@ -335,53 +1014,36 @@ class Constructor(list):
                 self.Set_Save()
 
     def Show_Request(self):
-        for i in self:
-            packet = ''
-            for j in i.packet:
-                packet += hex(int(j)) + ' '
+        for legend, packet in zip(self.legends, self):
+            print(legend, ' '.join(hex(byte) for byte in packet))
 
     def Set_Speed(self, Speed=0xc800):
         self.Save()
-        cmd = copy(self.void)
-        legend = "Set Speed: {}".format(Speed)
-        cmd[0] = self.computer.START_BYTE
-        cmd[1] = self.computer.COMMAND_SET_SPEED
-        cmd[3] = int(Speed / 256)
-        cmd[4] = int(Speed - (Speed / 256) * 256)
-        self.append(Request(legend, cmd))
+        fill = self.fill
+
+        # The low byte of the speed has always been sent as FILL_BYTE
+        self._new(self.computer.COMMAND_SET_SPEED,
+                  fill, int(Speed / 256), fill, fill, fill, fill, fill)
+
+        if self.trace:
+            self.legends.append("Set Speed: {}".format(Speed))
 
     def Set_Blink_Color(self, Area, Color):
         self.Save()
-        cmd = copy(self.void)
-        legend = "Set Blink Color"
-        cmd[0] = self.computer.START_BYTE
-        cmd[1] = self.computer.COMMAND_SET_BLINK_COLOR
-        cmd[2] = self.Id
-        cmd[3] = Area[0]
-        cmd[4] = Area[1]
-        cmd[5] = Area[2]
-        cmd[6] = Color[0]
-        cmd[7] = Color[1]
-
-        self.append(Request(legend, cmd))
+        self._new(self.computer.COMMAND_SET_BLINK_COLOR,
+                  self.Id, Area[0], Area[1], Area[2], Color[0], Color[1], self.fill)
+
+        if self.trace:
+            self.legends.append("Set Blink Color")
 
     def Set_Morph_Color(self, Area, Color1, Color2):
         self.Save()
-        cmd = copy(self.void)
-        legend = "Set Morph Color"
-
-        Color12 = Color1[1] + Color2[0]
-        cmd[0] = self.computer.START_BYTE
-        cmd[1] = self.computer.COMMAND_SET_MORPH_COLOR
-        cmd[2] = self.Id
-        cmd[3] = Area[0]
-        cmd[4] = Area[1]
-        cmd[5] = Area[2]
-        cmd[6] = Color1[0]
-        cmd[7] = Color12
-        cmd[8] = Color2[1]
-
-        self.append(Request(legend, cmd))
+        self._new(self.computer.COMMAND_SET_MORPH_COLOR,
+                  self.Id, Area[0], Area[1], Area[2],
+                  Color1[0], Color1[1] + Color2[0], Color2[1])
+
+        if self.trace:
+            self.legends.append("Set Morph Color")
 
     def Area(self, areas):  # gotta check the power button to understand it ...
         """
@@ -424,37 +1086,28 @@ class Constructor(list):
         return ret
 
     def Set_Color(self, Area, Color, Id=0x01):
-
         self.Save()
-        cmd = copy(self.void)
-        legend = "Set Color"
-        cmd[0] = self.computer.START_BYTE
-        cmd[1] = self.computer.COMMAND_SET_COLOR
-        cmd[2] = self.Id
-        cmd[3] = Area[0]
-        cmd[4] = Area[1]
-        cmd[5] = Area[2]
-        cmd[6] = Color[0]
-        cmd[7] = Color[1]
-
-        self.append(Request(legend, cmd))
+        self._new(self.computer.COMMAND_SET_COLOR,
+                  self.Id, Area[0], Area[1], Area[2], Color[0], Color[1], self.fill)
+
+        if self.trace:
+            self.legends.append("Set Color")
 
     def Set_Save_Block(self, block):
-        cmd = copy(self.void)
-        legend = "Save block: {}".format(block)
-        cmd[0] = self.computer.START_BYTE
-        cmd[1] = self.computer.COMMAND_SAVE_NEXT
-        cmd[2] = block
+        fill = self.fill
+        self._new(self.computer.COMMAND_SAVE_NEXT,
+                  block, fill, fill, fill, fill, fill, fill)
 
-        self.append(Request(legend, cmd))
+        if self.trace:
+            self.legends.append("Save block: {}".format(block))
 
     def Set_Save(self):
-        cmd = copy(self.void)
-        legend = "Set Save"
-        cmd[0] = self.computer.START_BYTE
-        cmd[1] = self.computer.COMMAND_SAVE
+        fill = self.fill
+        self._new(self.computer.COMMAND_SAVE,
+                  fill, fill, fill, fill, fill, fill, fill)
 
-        self.append(Request(legend, cmd))
+        if self.trace:
+            self.legends.append("Set Save")
 
     def Color(self, color):
         color = color.replace('#', '')
@@ -477,22 +1130,15 @@ class Constructor(list):
         return c
 
     def Get_Status(self):
-        cmd = copy(self.void)
-        legend = "Get Status"
-        cmd[0] = self.computer.START_BYTE
-        cmd[1] = self.computer.COMMAND_GET_STATUS
+        fill = self.fill
+        self._new(self.computer.COMMAND_GET_STATUS,
+                  fill, fill, fill, fill, fill, fill, fill)
 
-        self.append(Request(legend, cmd))
+        if self.trace:
+            self.legends.append("Get Status")
 
     def Reset_all(self):
-        self.Save()
-        cmd = copy(self.void)
-        legend = "Reset All Lights On"
-        cmd[0] = self.computer.START_BYTE
-        cmd[1] = self.computer.COMMAND_RESET
-        cmd[2] = self.computer.RESET_ALL_LIGHTS_ON
-
-        self.append(Request(legend, cmd))
+        self.Reset(self.computer.RESET_ALL_LIGHTS_ON)
 
     def Reset(self, command):
         if command in [self.computer.RESET_ALL_LIGHTS_ON,
@@ -501,43 +1147,35 @@ class Constructor(list):
                        self.computer.RESET_SLEEP_LIGHTS_ON
                        ]:
             self.Save()
-            cmd = copy(self.void)
-            legend = "Reset All Lights On"
-            cmd[0] = self.computer.START_BYTE
-            cmd[1] = self.computer.COMMAND_RESET
-            cmd[2] = command
+            fill = self.fill
+            self._new(self.computer.COMMAND_RESET,
+                      command, fill, fill, fill, fill, fill, fill)
 
-            self.append(Request(legend, cmd))
+            if self.trace:
+                self.legends.append("Reset: {}".format(command))
         else:
             print("Engine > Constructor error: WRONG RESET COMMAND")
 
     def End_Loop(self):
         self.Save()
-        cmd = copy(self.void)
-        legend = "End Loop"
-        cmd[0] = self.computer.START_BYTE
-        cmd[1] = self.computer.COMMAND_LOOP_BLOCK_END
-
+        fill = self.fill
+        self._new(self.computer.COMMAND_LOOP_BLOCK_END,
+                  fill, fill, fill, fill, fill, fill, fill)
         self.Id += 0x01
-        self.append(Request(legend, cmd))
+
+        if self.trace:
+            self.legends.append("End Loop")
 
     def End_Transfert(self):
         self.Save(end=True)
         if not self.save:
-            cmd = copy(self.void)
-            legend = "End Transfert"
-            cmd[0] = self.computer.START_BYTE
-            cmd[1] = self.computer.COMMAND_TRANSMIT_EXECUTE
+            fill = self.fill
+            self._new(self.computer.COMMAND_TRANSMIT_EXECUTE,
+                      fill, fill, fill, fill, fill, fill, fill)
 
-            self.append(Request(legend, cmd))
+            if self.trace:
+                self.legends.append("End Transfert")
 
     def raz(self):
-        while len(self) > 0:
-            self.pop()
-
-
-class Request:
-
-    def __init__(self, legend, packet):
-        self.legend = legend
-        self.packet = packet
+        self.count = 0
+        del self.legends[:]
@@ -0,0 +1,74 @@
+#!/usr/bin/python3
+#
+
+#  Copyright (C) 2026  Rafael Senties Martinelli <rafael@senties-martinelli.com>
+#
+#  This program is free software; you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License 3 as published by
+#   the Free Software Foundation.
+#
+#  This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+#   along with this program; if not, write to the Free Software Foundation,
+#   Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301  USA.
+
+"""
+    Client of the Unix socket of the daemon, for the commands that must
+    be fast like those of the command line. It does not import Pyro4 nor
+    the other modules of alienware-kbl.
+
+    The protocol is a line of UTF-8 text per request: the command and
+    its arguments separated by tabs. The daemon answers a line with `OK`
+    or `ERROR <message>`. The user is the owner of the connecting process.
+"""
+
+import os
+import socket
+
+# It is the same as Paths.DAEMON_SOCKET_PATH, which
+# is not imported to keep the client fast.
+SOCKET_PATH = '/run/alienware-kbl.sock'
+
+COMMANDS = ('ping', 'on', 'off', 'change', 'profile')
+
+RESPONSE_OK = 'OK'
+RESPONSE_ERROR = 'ERROR'
+
+
+def get_socket_path():
+    return os.environ.get('AKBL_SOCKET') or SOCKET_PATH
+
+
+def send(command, *args, path=None, timeout=2):
+    """
+        Send a command to the daemon and return True if it was accepted,
+        False if it was refused or None if the daemon could not be reached.
+    """
+    request = '\t'.join((command,) + tuple(str(arg) for arg in args)) + '\n'
+
+    try:
+        connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        connection.settimeout(timeout)
+        try:
+            connection.connect(path or get_socket_path())
+            connection.sendall(request.encode('utf-8'))
+            with connection.makefile('rb') as f:
+                response = f.readline().decode('utf-8').rstrip('\n')
+        finally:
+            connection.close()
+    except OSError:
+        return None
+
+    if response == RESPONSE_OK:
+        return True
+
+    print(response)
+    return False
+
+
+def ping(path=None):
+    return send('ping', path=path) is True
@@ -0,0 +1,139 @@
+#!/usr/bin/python3
+#
+
+#  Copyright (C) 2026  Rafael Senties Martinelli <rafael@senties-martinelli.com>
+#
+#  This program is free software; you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License 3 as published by
+#   the Free Software Foundation.
+#
+#  This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+#   along with this program; if not, write to the Free Software Foundation,
+#   Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301  USA.
+
+"""
+    The Unix socket of the daemon, see FastClient.py for the protocol.
+"""
+
+import os
+import pwd
+import socket
+import struct
+import threading
+from traceback import format_exc
+
+# local imports
+from FastClient import RESPONSE_OK, RESPONSE_ERROR
+
+
+class FastServer:
+
+    """
+        Accepts the connections of the clients in its own thread, and
+        answers each one in a thread of its own, so a client that does not
+        send its request does not delay the others. The commands are only
+        put in the queue of the daemon, so each request is answered right
+        away.
+
+        A connection is closed if nothing is read from it for READ_TIMEOUT
+        seconds, and at most MAX_CONNECTIONS are answered at once: the
+        others are refused.
+    """
+
+    READ_TIMEOUT = 0.25
+    MAX_CONNECTIONS = 16
+
+    def __init__(self, daemon, path):
+        self.daemon = daemon
+        self.path = path
+        self.requests = 0
+        self.refused = 0
+
+        if os.path.exists(path):
+            os.remove(path)
+
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._socket.bind(path)
+        # Like with Pyro, every user can send commands
+        os.chmod(path, 0o666)
+        self._socket.listen(self.MAX_CONNECTIONS)
+
+        self._lock = threading.Lock()
+        self._connections = threading.BoundedSemaphore(self.MAX_CONNECTIONS)
+
+        self._thread = threading.Thread(target=self._run, name='FastServer')
+        self._thread.daemon = True
+
+    def start(self):
+        self._thread.start()
+
+    def close(self):
+        self._socket.close()
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+    def _run(self):
+        while True:
+            try:
+                connection, _ = self._socket.accept()
+            except OSError:
+                return  # closed
+
+            if not self._connections.acquire(blocking=False):
+                self.refused += 1
+                connection.close()
+                continue
+
+            thread = threading.Thread(target=self._serve, args=(connection,))
+            thread.daemon = True
+            thread.start()
+
+    def _serve(self, connection):
+        try:
+            connection.settimeout(self.READ_TIMEOUT)
+            self._handle(connection)
+        except socket.timeout:
+            pass  # the client did not send its request in time
+        except Exception:
+            print(format_exc())
+        finally:
+            connection.close()
+            self._connections.release()
+
+    def _handle(self, connection):
+        credentials = connection.getsockopt(
+            socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize('3i'))
+        _, uid, _ = struct.unpack('3i', credentials)
+        user = pwd.getpwuid(uid).pw_name
+
+        with connection.makefile('rb') as f:
+            for line in f:
+                with self._lock:
+                    self.requests += 1
+                response = self._execute(user, line.decode('utf-8').rstrip('\n').split('\t'))
+                connection.sendall((response + '\n').encode('utf-8'))
+
+    def _execute(self, user, request):
+        command, args = request[0], request[1:]
+
+        if command == 'ping' and args == []:
+            pass
+        elif command == 'on' and args == []:
+            self.daemon.set_lights(user, True)
+        elif command == 'off' and args == []:
+            self.daemon.set_lights(user, False)
+        elif command == 'change' and args == []:
+            self.daemon.switch_lights(user)
+        elif command == 'profile' and len(args) == 1:
+            self.daemon.set_profile(user, args[0])
+        else:
+            return '{} wrong command: {}'.format(RESPONSE_ERROR, ' '.join(request))
+
+        return RESPONSE_OK
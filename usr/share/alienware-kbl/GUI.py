@@ -33,6 +33,7 @@ from copy import deepcopy
 # local imports
 import Configuration
 from Engine import *
+from Scheduler import DeviceWorker
 from Texts import *
 from ZoneWidget import *
 from CCParser import CCParser
@@ -335,6 +336,8 @@ class GUI(Gtk.Window):
         """
             Program Variables / Diver / Controller
         """
+        self.device_worker = None
+
         if getuser() == 'root':
             self.driver = Driver()
             self.testing_driver = Driver()
@@ -367,6 +370,7 @@ class GUI(Gtk.Window):
 
             if getuser() == 'root':
                 self.controller = Controller(self.driver)
+                self.device_worker = DeviceWorker(self.controller)
                 self.computer = self.driver.computer
             else:
                 computer_name = AKBLConnection._command('get_computer_name')
@@ -655,6 +659,18 @@ class GUI(Gtk.Window):
 
             sleep(0.1)
 
+    def DEVICE_command(self, key, function, preempt=False):
+        """
+            When the GUI owns the controller, `function` is executed by its
+            device worker (see Scheduler.CommandQueue.submit for `key` and
+            `preempt`). Otherwise it only talks to the daemon and it is
+            executed by a new thread.
+        """
+        if self.device_worker is not None:
+            self.device_worker.submit(key, function, preempt=preempt)
+        else:
+            threading.Thread(target=function).start()
+
     def TURN_lights_off(self):
 
         Gdk.threads_enter()
@@ -790,22 +806,9 @@ class GUI(Gtk.Window):
             if AKBL_DAEMON:
                 AKBLConnection._command('modify_lights_state', True)
 
-            self.controller.Set_Loop_Conf(
-                False, self.driver.computer.BLOCK_LOAD_ON_BOOT)
-            self.controller.Add_Speed_Conf(self.theme.speed)
-
-            for key in sorted(self.theme.area.keys()):
-                area = self.theme.area[key]
-                for zone in area:
-                    self.controller.Add_Loop_Conf(zone.regionId,
-                                                  zone.mode,
-                                                  zone.color1,
-                                                  zone.color2)
-
-                self.controller.End_Loop_Conf()
-
-            self.controller.End_Transfert_Conf()
-            self.controller.Write_Conf()
+            # When the daemon is running it may also write to the device, so
+            # the areas that this controller wrote may not be the current ones.
+            self.controller.Write_Theme(self.theme, incremental=not AKBL_DAEMON)
 
         Gdk.threads_enter()
         self.label_user_message.set_text('')
@@ -930,16 +933,16 @@ class GUI(Gtk.Window):
 
     def on_imagemenuitem_apply_configuration_activate(
             self, widget=None, data=None):
-        threading.Thread(target=self.ILUMINATE_keyboard).start()
+        self.DEVICE_command('iluminate', self.ILUMINATE_keyboard)
 
     def on_imagemenuitem_save_activate(self, widget=None, data=None):
         threading.Thread(target=self.SAVE_configuration_file).start()
 
     def on_imagemenuitem_lights_on_activate(self, button, data=None):
-        threading.Thread(target=self.ILUMINATE_keyboard).start()
+        self.DEVICE_command('iluminate', self.ILUMINATE_keyboard)
 
     def on_imagemenuitem_lights_off_activate(self, widget):
-        threading.Thread(target=self.TURN_lights_off).start()
+        self.DEVICE_command(None, self.TURN_lights_off, True)
 
     def on_imagemenuitem_quit_activate(self, widget, data=None):
         self.thread_zones = False
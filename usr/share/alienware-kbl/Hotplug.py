@@ -0,0 +1,156 @@
+#!/usr/bin/python3
+#
+
+#  Copyright (C) 2026  Rafael Senties Martinelli <rafael@senties-martinelli.com>
+#
+#  This program is free software; you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License 3 as published by
+#   the Free Software Foundation.
+#
+#  This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+#   along with this program; if not, write to the Free Software Foundation,
+#   Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301  USA.
+
+"""
+    Watch the USB devices that are connected and disconnected, with the
+    uevents of the kernel (the netlink socket that udev listens to), or
+    by polling the bus when the socket is not available.
+"""
+
+import socket
+import threading
+from traceback import format_exc
+
+NETLINK_KOBJECT_UEVENT = 15
+
+# The group of the events sent by the kernel, those of udev have a header
+UEVENT_KERNEL_GROUP = 1
+
+ADD = 'add'
+REMOVE = 'remove'
+
+
+def parse_uevent(data):
+    """
+        Return (action, (vendorId, productId)) if `data` is the uevent of
+        an USB device, or None.
+    """
+    fields = {}
+    for field in data.split(b'\0')[1:]:
+        key, _, value = field.partition(b'=')
+        fields[key] = value
+
+    if fields.get(b'SUBSYSTEM') != b'usb' or fields.get(b'DEVTYPE') != b'usb_device':
+        return None
+
+    try:
+        # PRODUCT=<vendor>/<product>/<bcdDevice> in hexadecimal
+        vendor, product, _ = fields[b'PRODUCT'].split(b'/')
+        ids = (int(vendor, 16), int(product, 16))
+    except (KeyError, ValueError):
+        return None
+
+    return fields.get(b'ACTION', b'').decode('ascii', 'replace'), ids
+
+
+class HotplugMonitor:
+
+    """
+        Calls `callback(action, (vendorId, productId))` from its own thread
+        when a device of `ids` is connected (ADD) or disconnected (REMOVE).
+        `bus` is only used to poll, it is pyusb's `usb.core` or a
+        Simulator.SimulatedBus.
+    """
+
+    POLL_INTERVAL = 2
+
+    # How often the netlink thread checks if it was closed
+    SOCKET_TIMEOUT = 1
+
+    def __init__(self, bus, ids, callback, use_netlink=True):
+        self.bus = bus
+        self.ids = frozenset(ids)
+        self.callback = callback
+        self.netlink = False
+
+        self._stop = threading.Event()
+        self._socket = None
+
+        if use_netlink:
+            try:
+                self._socket = socket.socket(
+                    socket.AF_NETLINK, socket.SOCK_DGRAM, NETLINK_KOBJECT_UEVENT)
+                self._socket.bind((0, UEVENT_KERNEL_GROUP))
+                self._socket.settimeout(self.SOCKET_TIMEOUT)
+                self.netlink = True
+            except (OSError, AttributeError) as e:
+                if self._socket is not None:
+                    self._socket.close()
+                    self._socket = None
+                print("Warning: The USB events are not available ({}), the bus will be polled.".format(e))
+
+        if self.netlink:
+            target = self._run_netlink
+        else:
+            target = self._run_poll
+
+        self._thread = threading.Thread(target=target, name='HotplugMonitor')
+        self._thread.daemon = True
+
+    def start(self):
+        self._thread.start()
+
+    def close(self):
+        self._stop.set()
+
+    def _run_netlink(self):
+        try:
+            while not self._stop.is_set():
+                try:
+                    data = self._socket.recv(16 * 1024)
+                except socket.timeout:
+                    continue
+
+                event = parse_uevent(data)
+                if event is not None and event[0] in (ADD, REMOVE) and event[1] in self.ids:
+                    self._notify(*event)
+        except OSError:
+            if not self._stop.is_set():
+                print(format_exc())
+        finally:
+            self._socket.close()
+
+    def _scan(self):
+        try:
+            return set((dev.idVendor, dev.idProduct)
+                       for dev in self.bus.find(find_all=True)) & self.ids
+        except Exception:
+            print(format_exc())
+            return None
+
+    def _run_poll(self):
+        connected = self._scan() or set()
+
+        while not self._stop.wait(self.POLL_INTERVAL):
+            new_connected = self._scan()
+            if new_connected is None:
+                continue
+
+            for ids in connected - new_connected:
+                self._notify(REMOVE, ids)
+
+            for ids in new_connected - connected:
+                self._notify(ADD, ids)
+
+            connected = new_connected
+
+    def _notify(self, action, ids):
+        try:
+            self.callback(action, ids)
+        except Exception:
+            print(format_exc())
@@ -0,0 +1,165 @@
+#!/usr/bin/python3
+#
+
+#  Copyright (C) 2026  Rafael Senties Martinelli <rafael@senties-martinelli.com>
+#
+#  This program is free software; you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License 3 as published by
+#   the Free Software Foundation.
+#
+#  This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+#   along with this program; if not, write to the Free Software Foundation,
+#   Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301  USA.
+
+"""
+    Writes the metrics of the daemon in the text format of Prometheus, to
+    a file that the textfile collector of node_exporter reads. The file is
+    replaced at once, so the collector never reads it half written.
+"""
+
+import os
+import tempfile
+import threading
+from traceback import format_exc
+
+# The quantiles of the summaries
+QUANTILES = (0.5, 0.9, 0.99)
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _labels(labels):
+    if not labels:
+        return ''
+
+    return '{' + ','.join('{}="{}"'.format(name, _escape(value))
+                          for name, value in sorted(labels.items())) + '}'
+
+
+def _number(value):
+    if value is True or value is False:
+        value = int(value)
+    elif value != value:
+        return 'NaN'
+
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Metrics:
+
+    """
+        The metric families of a file, in the order that they are added.
+    """
+
+    def __init__(self, prefix='akbl_'):
+        self.prefix = prefix
+        self._lines = []
+
+    def add(self, name, kind, description, value, labels=None):
+        """
+            Add a counter or a gauge with a single value.
+        """
+        self.add_family(name, kind, description, ((labels, value),))
+
+    def add_family(self, name, kind, description, samples):
+        """
+            Add a counter or a gauge, `samples` are (labels, value).
+        """
+        name = self.prefix + name
+        self._lines.append('# HELP {} {}'.format(name, description))
+        self._lines.append('# TYPE {} {}'.format(name, kind))
+
+        for labels, value in samples:
+            self._lines.append('{}{} {}'.format(name, _labels(labels), _number(value)))
+
+    def add_summary(self, name, description, histograms, label):
+        """
+            Add a summary per Tracing.LatencyHistogram of the dict
+            `histograms`, whose keys are the values of the label `label`.
+            The histograms must not be recorded meanwhile, like the copies
+            of `CommandQueue.get_execution_time`.
+        """
+        name = self.prefix + name
+        self._lines.append('# HELP {} {}'.format(name, description))
+        self._lines.append('# TYPE {} summary'.format(name))
+
+        for key in sorted(histograms.keys()):
+            histogram = histograms[key]
+            for quantile in QUANTILES:
+                self._lines.append('{}{} {}'.format(
+                    name,
+                    _labels({label: key, 'quantile': quantile}),
+                    _number(histogram.percentile(quantile * 100))))
+
+            self._lines.append('{}_sum{} {}'.format(name, _labels({label: key}), _number(histogram.total)))
+            self._lines.append('{}_count{} {}'.format(name, _labels({label: key}), histogram.count))
+
+    def text(self):
+        return '\n'.join(self._lines) + '\n'
+
+
+class MetricsExporter:
+
+    """
+        Writes the Metrics returned by `collect()` in `path` every
+        `interval` seconds, from its own thread.
+    """
+
+    def __init__(self, collect, path, interval=15):
+        self.collect = collect
+        self.path = path
+        self.interval = max(interval, 1)
+        self.writes = 0
+        self.errors = 0
+
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='MetricsExporter')
+        self._thread.daemon = True
+
+    def start(self):
+        self._thread.start()
+
+    def close(self):
+        self._stop.set()
+
+    def write(self):
+        """
+            Write the metrics now, return False if it was not possible.
+        """
+        try:
+            text = self.collect().text()
+
+            directory = os.path.dirname(self.path) or '.'
+            fd, temp_path = tempfile.mkstemp(prefix='.', suffix='.tmp', dir=directory)
+            try:
+                with os.fdopen(fd, encoding='utf-8', mode='wt') as f:
+                    f.write(text)
+
+                os.chmod(temp_path, 0o644)
+                os.replace(temp_path, self.path)
+            except BaseException:
+                os.remove(temp_path)
+                raise
+        except Exception:
+            self.errors += 1
+            # Do not fill the log if the directory is missing
+            if self.errors == 1:
+                print("Warning: It was not possible to write the metrics in `{}`".format(self.path))
+                print(format_exc())
+            return False
+
+        self.writes += 1
+        return True
+
+    def _run(self):
+        while True:
+            self.write()
+            if self._stop.wait(self.interval):
+                return
@@ -0,0 +1,166 @@
+#!/usr/bin/python3
+#
+
+#  Copyright (C) 2026  Rafael Senties Martinelli <rafael@senties-martinelli.com>
+#
+#  This program is free software; you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License 3 as published by
+#   the Free Software Foundation.
+#
+#  This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+#   along with this program; if not, write to the Free Software Foundation,
+#   Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301  USA.
+
+"""
+    The controllers need some time between two packets. This file decides
+    how much time the driver waits before writing each packet.
+"""
+
+from time import sleep, time
+
+from CCParser import CCParser
+
+PACING_CONSERVATIVE = 'conservative'
+PACING_ADAPTIVE = 'adaptive'
+
+
+class Pacer:
+
+    """
+        In the conservative mode the driver always waits CONSERVATIVE_DELAY,
+        like it has always done.
+
+        In the adaptive mode the delay starts with the one learned for the
+        computer (or CONSERVATIVE_DELAY), it is shortened after every
+        SPEEDUP_AFTER packets written without problems and doubled each time
+        the device fails or reports to be busy. After MAX_FAILURES failures in
+        a row, the pacer falls back to the conservative mode, and it goes
+        back to the adaptive one after RECOVER_AFTER packets written without
+        problems: a device can be slow only for a while, like during a reset.
+
+        The adaptive mode always reads the status of the device after the
+        packets (`check_status`): without it only the USB errors would tell
+        that the packets are sent too fast, and the delay would be shortened
+        down to MIN_DELAY. The packets written without checking the status
+        never shorten the delay.
+    """
+
+    CONSERVATIVE_DELAY = 0.02
+    MIN_DELAY = 0.001
+    MAX_DELAY = 0.2
+    SPEEDUP_AFTER = 32
+    SPEEDUP_FACTOR = 0.8
+    MAX_FAILURES = 3
+    RECOVER_AFTER = 256
+
+    def __init__(self,
+                 computer_name='',
+                 mode=PACING_CONSERVATIVE,
+                 path=None):
+
+        self.computer_name = computer_name
+        self.mode = mode
+        self.check_status = mode == PACING_ADAPTIVE
+        self.delay = self.CONSERVATIVE_DELAY
+
+        self.packets = 0
+        self.retries = 0
+        self.busy = 0
+        self.fallbacks = 0
+
+        self._successes = 0
+        self._failures = 0
+        self._fallen_back = False
+
+        if path is not None and computer_name != '':
+            self._ccp = CCParser(path, 'Write Pacing')
+            if mode == PACING_ADAPTIVE:
+                self.delay = self._ccp.get_float_defval(
+                    computer_name, self.CONSERVATIVE_DELAY)
+                self.delay = min(max(self.delay, self.MIN_DELAY), self.MAX_DELAY)
+        else:
+            self._ccp = None
+
+        self._saved_delay = self.delay
+        self._saved_time = time()
+
+    def wait(self):
+        sleep(self.delay)
+
+    def success(self, checked=True):
+        """
+            A packet was written, `checked` is False if its status was not read.
+        """
+        self.packets += 1
+        self._failures = 0
+
+        if self._fallen_back:
+            self._successes += 1
+            if self._successes >= self.RECOVER_AFTER:
+                print("The device works again, going back to the adaptive write pacing.")
+                self._fallen_back = False
+                self._successes = 0
+                self.mode = PACING_ADAPTIVE
+                self.check_status = True
+            return
+
+        if self.mode != PACING_ADAPTIVE or not checked:
+            return
+
+        self._successes += 1
+        if self._successes >= self.SPEEDUP_AFTER:
+            self._successes = 0
+            self.delay = max(self.delay * self.SPEEDUP_FACTOR, self.MIN_DELAY)
+
+    def failure(self, busy=False):
+        """
+            The device failed a write or reported to be busy,
+            the packets are being sent too fast.
+        """
+        if busy:
+            self.busy += 1
+        else:
+            self.retries += 1
+
+        self._successes = 0
+        self._failures += 1
+
+        if self.mode != PACING_ADAPTIVE:
+            return
+
+        if self._failures >= self.MAX_FAILURES:
+            print("Warning: The device keeps failing, falling back to the conservative write pacing.")
+            self.mode = PACING_CONSERVATIVE
+            self.check_status = False
+            self.delay = self.CONSERVATIVE_DELAY
+            self.fallbacks += 1
+            self._fallen_back = True
+        else:
+            self.delay = min(self.delay * 2, self.MAX_DELAY)
+
+    def end_transaction(self):
+        """
+            Persist the learned delay if it changed noticeably,
+            at most once per minute.
+        """
+        if self._ccp is None or self.mode != PACING_ADAPTIVE:
+            return
+
+        if abs(self.delay - self._saved_delay) > self._saved_delay * 0.1 \
+                and time() - self._saved_time > 60:
+            self._ccp.write(self.computer_name, round(self.delay, 4))
+            self._saved_delay = self.delay
+            self._saved_time = time()
+
+    def get_stats(self):
+        return {'mode': self.mode,
+                'delay': self.delay,
+                'packets': self.packets,
+                'retries': self.retries,
+                'busy': self.busy,
+                'fallbacks': self.fallbacks}
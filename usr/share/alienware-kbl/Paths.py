@@ -35,6 +35,8 @@ class Paths:
                 user)
 
         self.DAEMON_PYRO_PATH = '/etc/alienware-kbl-daemon-adress'
+        self.DAEMON_SOCKET_PATH = '/run/alienware-kbl.sock'
+        self.DEVICE_CACHE_PATH = '/run/alienware-kbl-device'
         self.SYSTEMCTL_PATH = '/bin/systemctl'
 
         """
@@ -59,6 +61,11 @@ class Paths:
         self.BACKUP_PROFILES = '/etc/alienware-kbl/profiles/'
         self.GLOBAL_CONFIG = '/etc/alienware-kbl/gobal-config.ini'
 
+        self.CACHE_PATH = '/var/cache/alienware-kbl/'
+        self.COMPILED_THEMES_PATH = self.CACHE_PATH + 'themes/'
+        self.PACING_PATH = self.CACHE_PATH + 'pacing.ini'
+        self.SAVED_BLOCKS_PATH = self.CACHE_PATH + 'saved-blocks.ini'
+
         """
             Create the tree dirs
         """
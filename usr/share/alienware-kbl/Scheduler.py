@@ -0,0 +1,272 @@
+#!/usr/bin/python3
+#
+
+#  Copyright (C) 2026  Rafael Senties Martinelli <rafael@senties-martinelli.com>
+#
+#  This program is free software; you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License 3 as published by
+#   the Free Software Foundation.
+#
+#  This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+#   along with this program; if not, write to the Free Software Foundation,
+#   Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301  USA.
+
+"""
+    The commands of the daemon are executed by a single thread, in the
+    order that they arrive, after those of a higher priority. A command
+    that is still waiting is dropped when a newer one with the same key
+    arrives, so only the newest state reaches the device.
+"""
+
+import threading
+from collections import deque
+from traceback import format_exc
+from time import time
+
+# local imports
+from Engine import DeviceNotFound, TransactionCancelled
+from Tracing import LatencyHistogram
+
+# The commands of a lower priority are only executed
+# when there is none of a higher priority waiting.
+PRIORITY_USER = 0
+PRIORITY_ANIMATION = 1
+PRIORITY_LEVELS = 2
+
+
+class _Command:
+
+    __slots__ = ('key', 'function', 'args', 'priority', 'preempt', 'time', 'done')
+
+    def __init__(self, key, function, args, priority, preempt):
+        self.key = key
+        self.function = function
+        self.args = args
+        self.priority = priority
+        self.preempt = preempt
+        self.time = time()
+        self.done = threading.Event()
+
+
+class CommandQueue:
+
+    """
+        `submit` returns the command without waiting, the commands are
+        executed by the thread of the queue. Its `done` event is set once
+        it was executed, replaced or discarded.
+
+        The commands whose key is None are barriers: they are never
+        dropped, and the commands submitted after them never replace
+        the ones submitted before them.
+    """
+
+    def __init__(self, name='CommandQueue'):
+        self._pending = [deque() for _ in range(PRIORITY_LEVELS)]
+        self._condition = threading.Condition()
+        self._running = None
+
+        self.submitted = 0
+        self.executed = 0
+        self.coalesced = 0
+        self.errors = 0
+        self.max_depth = 0
+        self._time_in_queue = 0.0
+        self._max_time_in_queue = 0.0
+
+        # name of the function: LatencyHistogram of the time to execute it,
+        # only used under the lock, see `get_execution_time`
+        self._execution_time = {}
+
+        self._thread = threading.Thread(target=self._run, name=name)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def submit(self, key, function, *args, priority=PRIORITY_USER, preempt=False):
+        """
+            If `preempt` is True, the command being executed is interrupted
+            when it is not a barrier. A command of a higher priority always
+            interrupts the one being executed.
+        """
+        command = _Command(key, function, args, priority, preempt)
+
+        with self._condition:
+            self.submitted += 1
+            pending = self._pending[priority]
+
+            if key is not None:
+                for i in range(len(pending) - 1, -1, -1):
+                    old = pending[i]
+                    if old.key is None:
+                        break
+                    elif old.key == key:
+                        del pending[i]
+                        old.done.set()
+                        self.coalesced += 1
+                        break
+
+            pending.append(command)
+            self.max_depth = max(self.max_depth, self._depth())
+
+            running = self._running
+            if running is not None and (
+                    priority < running.priority or preempt and running.key is not None):
+                self._preempt(running)
+
+            self._condition.notify_all()
+
+        return command
+
+    def discard(self, key):
+        """
+            Drop the pending commands of `key`.
+        """
+        with self._condition:
+            for pending in self._pending:
+                for command in [command for command in pending if command.key == key]:
+                    pending.remove(command)
+                    command.done.set()
+
+            self._condition.notify_all()
+
+    def join(self, timeout=None):
+        """
+            Wait until all the submitted commands were executed.
+            Return False if `timeout` expired before.
+        """
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: self._depth() == 0 and self._running is None, timeout)
+
+    def _depth(self):
+        return sum(len(pending) for pending in self._pending)
+
+    def _preempt(self, command):
+        """
+            Called with the lock held, to interrupt the running `command`.
+        """
+        pass
+
+    def _next(self):
+        for pending in self._pending:
+            if pending:
+                return pending.popleft()
+
+    def _execute(self, command):
+        command.function(*command.args)
+
+    def _run(self):
+        while True:
+            with self._condition:
+                command = self._next()
+                while command is None:
+                    self._condition.wait()
+                    command = self._next()
+
+                self._running = command
+
+                waited = time() - command.time
+                self._time_in_queue += waited
+                self._max_time_in_queue = max(self._max_time_in_queue, waited)
+
+            start = time()
+            try:
+                self._execute(command)
+            except Exception:
+                with self._condition:
+                    self.errors += 1
+                print(format_exc())
+
+            seconds = time() - start
+            name = command.function.__name__.lstrip('_')
+
+            with self._condition:
+                histogram = self._execution_time.get(name)
+                if histogram is None:
+                    histogram = self._execution_time[name] = LatencyHistogram()
+                histogram.record(seconds)
+
+                self.executed += 1
+                self._running = None
+                command.done.set()
+                self._condition.notify_all()
+
+    def get_execution_time(self):
+        """
+            Return a copy of the LatencyHistogram of each function executed.
+        """
+        with self._condition:
+            return dict((name, histogram.copy())
+                        for name, histogram in self._execution_time.items())
+
+    def get_stats(self):
+        with self._condition:
+            depth = self._depth()
+
+        return {'depth': depth,
+                'max_depth': self.max_depth,
+                'submitted': self.submitted,
+                'executed': self.executed,
+                'coalesced': self.coalesced,
+                'errors': self.errors,
+                'time_in_queue': self._time_in_queue / self.executed if self.executed else 0.0,
+                'max_time_in_queue': self._max_time_in_queue}
+
+
+class DeviceWorker(CommandQueue):
+
+    """
+        The only thread that writes to the device of `controller`. The
+        command being executed is interrupted at the next packet when it is
+        preempted, and the device is reset so it never keeps the loops of
+        an unfinished transaction.
+    """
+
+    def __init__(self, controller, name='DeviceWorker'):
+        self.controller = controller
+        self.cancelled = 0
+        self._cancel = threading.Event()
+        self._resetting = False
+        controller.driver.cancel = self._cancel
+
+        CommandQueue.__init__(self, name)
+
+    def _preempt(self, command):
+        if not self._resetting:
+            self._cancel.set()
+
+    def _next(self):
+        command = CommandQueue._next(self)
+        if command is not None:
+            self._cancel.clear()
+
+        return command
+
+    def _execute(self, command):
+        try:
+            command.function(*command.args)
+        except TransactionCancelled:
+            with self._condition:
+                # The reset can not be interrupted
+                self._resetting = True
+                self._cancel.clear()
+                self.cancelled += 1
+            try:
+                self.controller.Cancel_Transaction()
+            finally:
+                self._resetting = False
+        except DeviceNotFound as e:
+            # Until the device is connected again, there is nothing to add
+            with self._condition:
+                self.errors += 1
+            print("Warning: {}".format(e))
+
+    def get_stats(self):
+        with self._condition:
+            stats = CommandQueue.get_stats(self)
+            stats['cancelled'] = self.cancelled
+        return stats
@@ -0,0 +1,337 @@
+#!/usr/bin/python3
+#
+
+#  Copyright (C) 2026  Rafael Senties Martinelli <rafael@senties-martinelli.com>
+#
+#  This program is free software; you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License 3 as published by
+#   the Free Software Foundation.
+#
+#  This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+#   along with this program; if not, write to the Free Software Foundation,
+#   Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301  USA.
+
+"""
+    A simulated AlienFX controller, to test and benchmark the software
+    without an alienware computer. The driver uses it instead of pyusb
+    when the environment variable AKBL_SIMULATE (or the key `simulate` of
+    the global configuration) contains the name of a computer, like:
+
+        AKBL_SIMULATE=M17XR3 python3 Daemon.py
+"""
+
+from array import array
+from time import sleep, time
+
+try:
+    from usb.core import USBError
+except ImportError:
+    class USBError(IOError):
+        pass
+
+# local imports
+from Computers import AllComputers
+
+
+class SimulatedDevice:
+
+    """
+        Implements the part of `usb.core.Device` used by the driver, and
+        decodes the packets like an AlienFX controller:
+
+        + `latency` is the time that each transfer takes.
+        + `processing` is the time that the controller needs after each
+          command, other than COMMAND_GET_STATUS. Meanwhile the status is
+          STATE_BUSY and the other commands are rejected with an USBError.
+        + If `busy_after_execute` is True, the status is STATE_BUSY from
+          the moment that a transaction is executed until the next reset,
+          which is what the readiness loops of the Controller expect.
+        + If `keep_regions` is False, executing a transaction replaces all
+          the lights, and the regions that it does not send are turned off.
+          Otherwise only the lights of its regions change, which is what the
+          incremental writes of the Controller expect.
+
+        The lights of each region are in `regions`, a dict of
+        region name: [(mode, color1, color2), ...]
+
+        The packets saved in each block are in `storage`, a dict
+        of block: [packet, ...]
+    """
+
+    def __init__(self,
+                 computer,
+                 idVendor,
+                 idProduct,
+                 product='',
+                 latency=0.0,
+                 processing=0.0,
+                 busy_after_execute=True,
+                 keep_regions=True):
+
+        self.computer = computer
+        self.idVendor = idVendor
+        self.idProduct = idProduct
+        self.product = product
+        self.latency = latency
+        self.processing = processing
+        self.busy_after_execute = busy_after_execute
+        self.keep_regions = keep_regions
+
+        # False once it was unplugged, then every transfer fails
+        self.connected = True
+
+        self.regions = {}
+        self.lights_on = False
+        self.speed = 0
+        self.storage = {}
+
+        # Counters
+        self.configurations = 0
+        self.packets = 0
+        self.bytes = 0
+        self.reads = 0
+        self.transactions = 0
+        self.rejected = 0
+        self.storage_writes = 0
+        self.resets = 0
+
+        self._busy_until = 0
+        self._status = computer.STATE_READY
+        self._running = True  # The device starts running its boot lights
+        self._loops = []
+        self._loop = []
+        self._save_next = None
+        self._storage_pending = {}
+
+    def __str__(self):
+        return 'Simulated AlienFX device {:04x}:{:04x} {}'.format(
+            self.idVendor, self.idProduct, self.product)
+
+    def set_configuration(self):
+        if not self.connected:
+            raise USBError('Simulated device: no such device')
+
+        self.configurations += 1
+
+    def detach_kernel_driver(self, interface):
+        pass
+
+    def ctrl_transfer(self,
+                      bmRequestType,
+                      bRequest,
+                      wValue=0,
+                      wIndex=0,
+                      data_or_wLength=None,
+                      timeout=None):
+
+        if self.latency:
+            sleep(self.latency)
+
+        if not self.connected:
+            raise USBError('Simulated device: no such device')
+
+        busy = time() < self._busy_until
+
+        # Read
+        #
+        if bmRequestType & 0x80:
+            self.reads += 1
+            if busy or (self._running and self.busy_after_execute):
+                status = self.computer.STATE_BUSY
+            else:
+                status = self._status
+            return array('B', [status] + [0] * (data_or_wLength - 1))
+
+        # Write
+        #
+        packet = bytes(data_or_wLength)
+        status_request = packet[1:2] == bytes([self.computer.COMMAND_GET_STATUS])
+
+        if busy and not status_request:
+            self.rejected += 1
+            raise USBError('Simulated device: the device is busy')
+
+        self.packets += 1
+        self.bytes += len(packet)
+        if self.processing and not status_request:
+            self._busy_until = time() + self.processing
+
+        self._status = self._process(packet)
+        return len(packet)
+
+    def _process(self, packet):
+        computer = self.computer
+
+        if len(packet) != computer.DATA_LENGTH or packet[0] != computer.START_BYTE:
+            return computer.STATE_UNKNOWN_COMMAND
+
+        command = packet[1]
+
+        if command == computer.COMMAND_GET_STATUS:
+            return self._status
+
+        if self._save_next is not None:
+            self._storage_pending.setdefault(self._save_next, []).append(packet)
+            self._save_next = None
+            return computer.STATE_READY
+
+        if command == computer.COMMAND_SAVE_NEXT:
+            self._save_next = packet[2]
+
+        elif command == computer.COMMAND_SAVE:
+            self.storage.update(self._storage_pending)
+            self.storage_writes += len(self._storage_pending)
+            self._storage_pending = {}
+
+        elif command == computer.COMMAND_RESET:
+            self.resets += 1
+            self._running = False
+            self._loops = []
+            self._loop = []
+            if packet[2] == computer.RESET_ALL_LIGHTS_OFF:
+                self.lights_on = False
+            elif packet[2] == computer.RESET_ALL_LIGHTS_ON:
+                self.lights_on = True
+                self.regions = {}
+
+        elif command == computer.COMMAND_SET_SPEED:
+            self.speed = packet[3] * 256 + packet[4]
+
+        elif command == computer.COMMAND_SET_COLOR:
+            self._loop.append((packet, 'fixed', _color1(packet[6], packet[7]), None))
+
+        elif command == computer.COMMAND_SET_BLINK_COLOR:
+            self._loop.append((packet, 'blink', _color1(packet[6], packet[7]), None))
+
+        elif command == computer.COMMAND_SET_MORPH_COLOR:
+            self._loop.append((packet,
+                               'morph',
+                               _color1(packet[6], packet[7]),
+                               _color2(packet[7], packet[8])))
+
+        elif command == computer.COMMAND_LOOP_BLOCK_END:
+            self._loops.append(self._loop)
+            self._loop = []
+
+        elif command == computer.COMMAND_TRANSMIT_EXECUTE:
+            self._execute()
+
+        else:
+            return computer.STATE_UNKNOWN_COMMAND
+
+        return computer.STATE_READY
+
+    def _execute(self):
+        self.transactions += 1
+        self.lights_on = True
+        self._running = True
+
+        if not self.keep_regions:
+            self.regions = {}
+
+        for loop in self._loops:
+            lines = {}
+            for packet, mode, color1, color2 in loop:
+                mask = (packet[3] << 16) + (packet[4] << 8) + packet[5]
+                for name, region in self.computer.regions.items():
+                    if region.regionId & mask == region.regionId:
+                        lines.setdefault(name, []).append((mode, color1, color2))
+
+            self.regions.update(lines)
+
+        self._loops = []
+        self._loop = []
+
+    def set_power_mode(self, block):
+        """
+            Execute the loops saved in `block`, like the firmware
+            does when the power mode of the computer changes.
+        """
+        self._loops = []
+        self._loop = []
+        self._save_next = None
+
+        for packet in self.storage.get(block, ()):
+            self._process(packet)
+
+        self._execute()
+
+    def get_colors(self):
+        """
+            Return the color1 of the first line of each region.
+        """
+        return dict((name, lines[0][1]) for name, lines in self.regions.items())
+
+
+def _nibbles_to_hex(r, g, b):
+    return '#{:02X}{:02X}{:02X}'.format(r * 17, g * 17, b * 17)
+
+
+def _color1(byte1, byte2):
+    return _nibbles_to_hex(byte1 >> 4, byte1 & 0x0f, byte2 >> 4)
+
+
+def _color2(byte1, byte2):
+    return _nibbles_to_hex(byte1 & 0x0f, byte2 >> 4, byte2 & 0x0f)
+
+
+class SimulatedBus:
+
+    """
+        Replaces `usb.core` for the driver: it has a `find` function
+        that works like the one of pyusb, over a list of devices.
+    """
+
+    def __init__(self, devices=()):
+        self.devices = list(devices)
+        self.enumerations = 0
+
+    @classmethod
+    def for_computer(cls, computer_name, others=0, **kwargs):
+        """
+            Return a bus with the device of the computer `computer_name`,
+            after `others` devices that are not AlienFX controllers.
+        """
+        item = AllComputers.computerList[computer_name]
+
+        product = 'AlienFX'
+        if computer_name == 'M14XR2':
+            product = 'Gaming AlienFX'  # The driver looks for `Gaming` in str(dev)
+
+        device = SimulatedDevice(
+            item.computer,
+            item.vendorId,
+            item.productId,
+            product,
+            **kwargs)
+
+        devices = [SimulatedDevice(item.computer, 0x8087, 0x0a00 + i, 'USB Device')
+                   for i in range(others)]
+        devices.append(device)
+
+        return cls(devices)
+
+    def unplug(self, device):
+        self.devices.remove(device)
+        device.connected = False
+
+    def plug(self, device):
+        self.devices.append(device)
+
+    def find(self, find_all=False, idVendor=None, idProduct=None, **kwargs):
+        self.enumerations += 1
+
+        devices = [dev for dev in self.devices
+                   if (idVendor is None or dev.idVendor == idVendor)
+                   and (idProduct is None or dev.idProduct == idProduct)]
+
+        if find_all:
+            return iter(devices)
+        elif devices:
+            return devices[0]
+        return None
@@ -64,6 +64,10 @@ Usage:
 
     --start-indicator                 Start the indicator.
 
+    --stats                           Display the time to write each command
+                                      to the device (key `tracing` of the
+                                      global configuration).
+
     -h, -help                         Display this dialog.
     -l, --license                     Display the license.
 
@@ -0,0 +1,255 @@
+#!/usr/bin/python3
+#
+
+#  Copyright (C) 2026  Rafael Senties Martinelli <rafael@senties-martinelli.com>
+#
+#  This program is free software; you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License 3 as published by
+#   the Free Software Foundation.
+#
+#  This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+#   along with this program; if not, write to the Free Software Foundation,
+#   Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301  USA.
+
+"""
+    Measures of the transfers with the device. The driver only traces
+    them when it has a Tracer (the key `tracing` of the global
+    configuration), otherwise nothing is measured.
+"""
+
+import threading
+from collections import deque
+from time import time
+
+
+class LatencyHistogram:
+
+    """
+        Histogram of durations with a constant relative precision, like
+        HdrHistogram: the values are counted in microseconds, exactly
+        below 2 * SUB_BUCKETS and in SUB_BUCKETS buckets per power of
+        two above, so the error of the percentiles is below 1 / SUB_BUCKETS.
+    """
+
+    SUB_BITS = 5
+    SUB_BUCKETS = 1 << SUB_BITS
+
+    def __init__(self):
+        self.counts = {}
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = 0.0
+
+    def record(self, seconds):
+        value = int(seconds * 1000000)
+        shift = value.bit_length() - self.SUB_BITS - 1
+
+        if shift > 0:
+            index = shift * self.SUB_BUCKETS + (value >> shift)
+        else:
+            index = value
+
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        if self.min is None or seconds < self.min:
+            self.min = seconds
+
+    def copy(self):
+        histogram = LatencyHistogram()
+        histogram.counts = dict(self.counts)
+        histogram.count = self.count
+        histogram.total = self.total
+        histogram.min = self.min
+        histogram.max = self.max
+        return histogram
+
+    def _bounds(self, index):
+        """
+            Return the lowest and the highest microseconds of a bucket.
+        """
+        if index < 2 * self.SUB_BUCKETS:
+            return index, index
+
+        shift = index // self.SUB_BUCKETS - 1
+        value = index - shift * self.SUB_BUCKETS
+        return value << shift, ((value + 1) << shift) - 1
+
+    def percentile(self, percent):
+        """
+            Return the highest value in seconds of the bucket
+            where `percent` % of the values are reached.
+        """
+        if self.count == 0:
+            return 0.0
+
+        rank = max(self.count * percent / 100, 1)
+        seen = 0
+        for index in sorted(self.counts.keys()):
+            seen += self.counts[index]
+            if seen >= rank:
+                return min(self._bounds(index)[1] / 1000000, self.max)
+
+        return self.max
+
+    def get_stats(self):
+        """
+            Return the summary in seconds and the buckets that have values,
+            as [lowest microseconds, highest microseconds, count].
+        """
+        return {'count': self.count,
+                'total': self.total,
+                'min': self.min or 0.0,
+                'max': self.max,
+                'mean': self.total / self.count if self.count else 0.0,
+                'p50': self.percentile(50),
+                'p90': self.percentile(90),
+                'p99': self.percentile(99),
+                'p999': self.percentile(99.9),
+                'buckets': [list(self._bounds(index)) + [self.counts[index]]
+                            for index in sorted(self.counts.keys())]}
+
+
+class Tracer:
+
+    """
+        Counts the packets written and read by a Driver, with a histogram
+        of the time of the writes per command, and of the readiness loops
+        of the Controller per loop. The last `RECENT` packets are kept.
+
+        The times are those of the transfers only, without the delays of
+        the pacer. The driver and the clients asking for the stats are in
+        different threads, so the Tracer is only read and written under
+        its lock.
+    """
+
+    RECENT = 256
+
+    def __init__(self):
+        self.packets = 0
+        self.bytes = 0
+        self.reads = 0
+        self.retries = 0
+        self.started = time()
+
+        self.commands = {}
+        self.waits = {}
+        self.wait_iterations = {}
+        self.read_latency = LatencyHistogram()
+        self.recent = deque(maxlen=self.RECENT)
+
+        # command byte: name, of the computer of the last `write`
+        self._names = {}
+        self._computer = None
+        self._lock = threading.Lock()
+
+    def _command_name(self, computer, command):
+        if computer is not self._computer:
+            self._computer = computer
+            self._names = {}
+            for attribute in sorted(dir(computer), reverse=True):
+                if attribute.startswith('COMMAND_'):
+                    self._names[getattr(computer, attribute)] = attribute[8:].lower()
+
+        return self._names.get(command, hex(command))
+
+    def write(self, computer, packet, seconds, attempts):
+        """
+            A packet was written in `seconds`, at the attempt `attempts`.
+        """
+        with self._lock:
+            name = self._command_name(computer, packet[1])
+
+            histogram = self.commands.get(name)
+            if histogram is None:
+                histogram = self.commands[name] = LatencyHistogram()
+            histogram.record(seconds)
+
+            self.packets += 1
+            self.bytes += len(packet)
+            self.retries += attempts - 1
+            self.recent.append((time(), name, len(packet), seconds, attempts))
+
+    def read(self, seconds):
+        with self._lock:
+            self.reads += 1
+            self.read_latency.record(seconds)
+
+    def wait(self, name, iterations, seconds):
+        """
+            A readiness loop of the Controller ended.
+        """
+        with self._lock:
+            histogram = self.waits.get(name)
+            if histogram is None:
+                histogram = self.waits[name] = LatencyHistogram()
+            histogram.record(seconds)
+
+            self.wait_iterations[name] = self.wait_iterations.get(name, 0) + iterations
+
+    def get_stats(self, recent=0):
+        """
+            Return the counters and the histograms, and
+            the `recent` last packets that were written.
+        """
+        with self._lock:
+            stats = {'enabled': True,
+                     'seconds': time() - self.started,
+                     'packets': self.packets,
+                     'bytes': self.bytes,
+                     'reads': self.reads,
+                     'retries': self.retries,
+                     'commands': dict((name, histogram.get_stats())
+                                      for name, histogram in self.commands.items()),
+                     'waits': dict((name, histogram.get_stats())
+                                   for name, histogram in self.waits.items()),
+                     'wait_iterations': dict(self.wait_iterations),
+                     'read_latency': self.read_latency.get_stats()}
+
+            if recent > 0:
+                stats['recent'] = [list(packet) for packet in list(self.recent)[-recent:]]
+
+        return stats
+
+
+def format_stats(stats):
+    """
+        Return the text of the `get_stats` of the daemon.
+    """
+    tracing = stats.get('tracing', {})
+    lines = []
+
+    if not tracing.get('enabled'):
+        lines.append("The tracing is disabled, set `tracing = True` in the global configuration.")
+    else:
+        lines.append('{} packets, {} bytes, {} status reads, {} retries in {:.0f} seconds'.format(
+            tracing['packets'], tracing['bytes'], tracing['reads'],
+            tracing['retries'], tracing['seconds']))
+        lines.append('')
+        lines.append('  {:<22}{:>9}{:>11}{:>11}{:>11}{:>11}'.format(
+            'ms', 'count', 'p50', 'p90', 'p99', 'max'))
+
+        rows = sorted(tracing['commands'].items())
+        rows += sorted(('wait ' + name, histogram)
+                       for name, histogram in tracing['waits'].items())
+        rows.append(('status read', tracing['read_latency']))
+
+        for name, histogram in rows:
+            lines.append('  {:<22}{:>9}{:>11.3f}{:>11.3f}{:>11.3f}{:>11.3f}'.format(
+                name, histogram['count'], histogram['p50'] * 1000, histogram['p90'] * 1000,
+                histogram['p99'] * 1000, histogram['max'] * 1000))
+
+    wait = stats.get('wait')
+    if wait:
+        lines.append('')
+        lines.append('Readiness loops: {} calls, {} iterations, {:.3f} s, {} timeouts'.format(
+            wait['calls'], wait['iterations'], wait['wait_time'], wait['timeouts']))
+
+    return '\n'.join(lines)
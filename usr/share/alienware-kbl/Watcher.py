@@ -0,0 +1,175 @@
+#!/usr/bin/python3
+#
+
+#  Copyright (C) 2026  Rafael Senties Martinelli <rafael@senties-martinelli.com>
+#
+#  This program is free software; you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License 3 as published by
+#   the Free Software Foundation.
+#
+#  This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+#   along with this program; if not, write to the Free Software Foundation,
+#   Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301  USA.
+
+"""
+    Watch the files of a directory with inotify, or by polling
+    their mtimes when inotify is not available.
+"""
+
+import os
+import ctypes
+import ctypes.util
+import struct
+import threading
+from traceback import format_exc
+
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+
+IN_CLOEXEC = 0o2000000
+
+# IN_ATTRIB is not watched, so the `os.utime` that marks
+# the last used profile is not taken as a change.
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_DELETE
+
+_EVENT = struct.Struct('iIII')  # wd, mask, cookie, len
+
+try:
+    _libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+    _libc.inotify_init1
+except (OSError, AttributeError):
+    _libc = None
+
+
+class DirectoryWatcher:
+
+    """
+        Calls `callback(paths)` from its own thread with the set of paths
+        of the files of `path` that were written, moved or deleted. The
+        callback receives None when some events were lost, then all the
+        files must be checked.
+    """
+
+    POLL_INTERVAL = 2
+
+    def __init__(self, path, callback, use_inotify=True):
+        self.path = path
+        self.callback = callback
+        self.inotify = False
+
+        self._stop = threading.Event()
+        self._fd = None
+        self._wd = None
+
+        if use_inotify and _libc is not None:
+            try:
+                self._start_inotify()
+                self.inotify = True
+            except OSError as e:
+                print("Warning: inotify is not available ({}), the profiles will be polled.".format(e))
+
+        if self.inotify:
+            target = self._run_inotify
+        else:
+            target = self._run_poll
+
+        self._thread = threading.Thread(target=target, name='DirectoryWatcher')
+        self._thread.daemon = True
+
+    def start(self):
+        self._thread.start()
+
+    def close(self):
+        self._stop.set()
+
+        # Removing the watch makes the thread return from `read`
+        if self._wd is not None:
+            _libc.inotify_rm_watch(self._fd, self._wd)
+            self._wd = None
+
+    def _start_inotify(self):
+        fd = _libc.inotify_init1(IN_CLOEXEC)
+        if fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+
+        wd = _libc.inotify_add_watch(fd, os.fsencode(self.path), WATCH_MASK)
+        if wd < 0:
+            errno = ctypes.get_errno()
+            os.close(fd)
+            raise OSError(errno, os.strerror(errno))
+
+        self._fd = fd
+        self._wd = wd
+
+    def _run_inotify(self):
+        try:
+            while not self._stop.is_set():
+                data = os.read(self._fd, 64 * 1024)
+
+                paths = set()
+                offset = 0
+                while offset < len(data):
+                    _, mask, _, length = _EVENT.unpack_from(data, offset)
+                    offset += _EVENT.size
+                    name = data[offset:offset + length].rstrip(b'\0')
+                    offset += length
+
+                    if mask & IN_Q_OVERFLOW:
+                        paths = None
+                        break
+                    elif mask & IN_IGNORED:
+                        # The watch was removed, or the directory deleted
+                        self._stop.set()
+                    elif name:
+                        paths.add(os.path.join(self.path, os.fsdecode(name)))
+
+                if paths is None or paths:
+                    self._notify(paths)
+        except OSError:
+            if not self._stop.is_set():
+                print(format_exc())
+        finally:
+            os.close(self._fd)
+
+    def _scan(self):
+        mtimes = {}
+        try:
+            for entry in os.scandir(self.path):
+                try:
+                    mtimes[entry.path] = entry.stat().st_mtime
+                except OSError:
+                    pass
+        except OSError:
+            pass
+
+        return mtimes
+
+    def _run_poll(self):
+        mtimes = self._scan()
+
+        while not self._stop.wait(self.POLL_INTERVAL):
+            new_mtimes = self._scan()
+
+            paths = set(path for path, mtime in new_mtimes.items()
+                        if mtimes.get(path) != mtime)
+            paths.update(path for path in mtimes if path not in new_mtimes)
+            mtimes = new_mtimes
+
+            if paths:
+                self._notify(paths)
+
+    def _notify(self, paths):
+        try:
+            self.callback(paths)
+        except Exception:
+            print(format_exc())